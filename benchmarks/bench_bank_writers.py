@@ -0,0 +1,105 @@
+"""
+Parallel ingest benchmark for the question bank writers.
+
+Runs several worker processes that each append batches of new questions
+to a scratch copy of the bank at the same time, then checks that no rows
+were lost and reports throughput. --unsafe runs the old read/modify/write
+path without the lock to show the lost updates it causes.
+
+    python3 benchmarks/bench_bank_writers.py --workers 8 --batches 20
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from trivia_core.bank import DEFAULT_BANK_PATH, append_questions, load_questions
+
+
+def make_batch(worker, batch, size):
+    return [
+        {
+            "question": f"Worker {worker} batch {batch} question {i}?",
+            "options": {"A": "1", "B": "2", "C": "3", "D": "4"},
+            "correctAnswer": "A",
+            "category": "Customization",
+        }
+        for i in range(size)
+    ]
+
+
+def unsafe_append(path, rows):
+    """The pre-lock convert_and_append: read, merge, overwrite."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.extend(rows)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+
+
+def worker(args):
+    """Appends this worker's batches; returns how many failed outright."""
+    path, worker_id, batches, batch_size, unsafe = args
+    failed = 0
+    for batch in range(batches):
+        rows = make_batch(worker_id, batch, batch_size)
+        if unsafe:
+            try:
+                unsafe_append(path, rows)
+            except ValueError:
+                failed += 1  # Read another worker's half-written file
+        else:
+            append_questions(path, rows)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batches", type=int, default=20, help="batches per worker")
+    parser.add_argument("--batch-size", type=int, default=5, help="questions per batch")
+    parser.add_argument("--bank", default=DEFAULT_BANK_PATH, help="bank to copy as the starting point")
+    parser.add_argument("--unsafe", action="store_true", help="use the unlocked read/modify/write path")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="bank-bench-")
+    path = os.path.join(scratch, "questions_and_choices.json")
+    shutil.copy(args.bank, path)
+    start_count = len(load_questions(path))
+
+    jobs = [(path, w, args.batches, args.batch_size, args.unsafe) for w in range(args.workers)]
+    start = time.perf_counter()
+    with Pool(args.workers) as pool:
+        failed = sum(pool.map(worker, jobs))
+    elapsed = time.perf_counter() - start
+
+    try:
+        final_count = len(load_questions(path))
+    except ValueError as e:
+        final_count = None
+        print(f"Bank is corrupt after the run: {e}")
+
+    expected = start_count + args.workers * args.batches * args.batch_size
+    batches = args.workers * args.batches
+    print(f"mode:        {'unsafe' if args.unsafe else 'locked + journal'}")
+    print(f"workers:     {args.workers}")
+    print(f"elapsed:     {elapsed:.2f}s")
+    print(f"throughput:  {batches / elapsed:.1f} batches/s, {batches * args.batch_size / elapsed:.1f} rows/s")
+    print(f"rows:        {final_count} in bank, {expected} expected")
+    if failed:
+        print(f"FAILED:      {failed} batches hit a half-written bank")
+    if final_count != expected:
+        print(f"LOST ROWS:   {expected - (final_count or start_count)}")
+
+    shutil.rmtree(scratch)
+    sys.exit(0 if final_count == expected else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Idle CPU and key-to-feedback latency for the curses standard mode.
+
+Runs the game in a pseudo-terminal, leaves it idle on the start screen and
+on a question while sampling its CPU time, then presses answers and times
+how long it takes for the "Correct!/Incorrect!" line to reach the terminal.
+Linux only (reads /proc/<pid>/stat).
+
+To compare against another version of the game:
+
+    git show <rev>:s_mode_interface_sim.py > /tmp/old_sim.py
+    python3 benchmarks/bench_curses_loop.py --script /tmp/old_sim.py
+    python3 benchmarks/bench_curses_loop.py
+"""
+
+import argparse
+import os
+import pty
+import random
+import re
+import signal
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FEEDBACK = re.compile(rb"orrect! You chose")
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+class Terminal:
+    """Collects everything the child writes, with a way to wait for a pattern."""
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.buf = bytearray()
+        self.cond = threading.Condition()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except OSError:
+                data = b""
+            with self.cond:
+                if not data:
+                    self.buf = None
+                    self.cond.notify_all()
+                    return
+                self.buf += data
+                self.cond.notify_all()
+
+    def mark(self):
+        with self.cond:
+            return len(self.buf)
+
+    def wait_for(self, pattern, since, timeout=15):
+        """Returns the time pattern showed up in output written after `since`."""
+        deadline = time.perf_counter() + timeout
+        with self.cond:
+            while True:
+                if self.buf is None:
+                    raise RuntimeError("game exited")
+                if re.search(pattern, bytes(self.buf[since:])):
+                    return time.perf_counter()
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise TimeoutError(pattern)
+                self.cond.wait(remaining)
+
+    def press(self, key):
+        os.write(self.fd, key)
+
+
+def cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS  # utime + stime
+
+
+def idle_cost(pid, term, seconds):
+    """CPU (percent of a core) and terminal output (bytes/s) while nobody touches the game."""
+    cpu_before, bytes_before = cpu_seconds(pid), term.mark()
+    time.sleep(seconds)
+    cpu = 100.0 * (cpu_seconds(pid) - cpu_before) / seconds
+    return cpu, (term.mark() - bytes_before) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script", default=os.path.join(REPO_DIR, "s_mode_interface_sim.py"))
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--idle", type=float, default=3.0, help="seconds of idle sampling per screen")
+    args = parser.parse_args()
+
+    deck_file = tempfile.NamedTemporaryFile(prefix="bench-deck-", delete=False).name
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(REPO_DIR)
+        env = dict(os.environ, TERM="xterm-256color", LINES="24", COLUMNS="80",
+                   SWEETRIVIA_DECK_FILE=deck_file, PYTHONPATH=REPO_DIR)
+        os.execve(sys.executable, [sys.executable, args.script], env)
+
+    term = Terminal(fd)
+    start_idle, question_idle, latencies = [], [], []
+    mark = 0
+    try:
+        for _ in range(args.rounds):
+            term.wait_for(rb"Ready to start", mark)
+            start_idle.append(idle_cost(pid, term, args.idle))
+
+            mark = term.mark()
+            term.press(b" ")
+            term.wait_for(rb"Time Left", mark)
+            question_idle.append(idle_cost(pid, term, min(args.idle, 4.0)))
+
+            # Answer until the round runs out
+            while True:
+                # Random offset so presses don't phase-lock with a polling loop
+                time.sleep(random.uniform(0.0, 0.4))
+                mark = term.mark()
+                pressed = time.perf_counter()
+                term.press(random.choice(b"ABCD").to_bytes(1, "little"))
+                try:
+                    shown = term.wait_for(FEEDBACK, mark, timeout=2)
+                except TimeoutError:
+                    break  # Round ended before the answer counted
+                latencies.append((shown - pressed) * 1000)
+                time.sleep(1.6)  # Feedback pause, then the next question is up
+
+            mark = term.mark()
+            term.wait_for(rb"Game over", mark)
+    finally:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+        os.remove(deck_file)
+
+    latencies.sort()
+    print(f"script:              {args.script}")
+    for label, samples in (("start screen", start_idle), ("question", question_idle)):
+        cpu = statistics.mean(c for c, _ in samples)
+        traffic = statistics.mean(b for _, b in samples)
+        print(f"idle, {label + ':':15}{cpu:.1f}% of a core, {traffic:.0f} terminal bytes/s")
+    print(f"key-to-feedback:     n={len(latencies)} mean={statistics.mean(latencies):.1f}ms "
+          f"p50={latencies[len(latencies) // 2]:.1f}ms max={latencies[-1]:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
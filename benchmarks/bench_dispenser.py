@@ -0,0 +1,96 @@
+"""
+Candy dispenser: what a game pays per request, and what bursts do to the servos.
+
+Runs against trivia_core.dispenser.FakeDispenserBus, which behaves like
+servo_w_rpi.ino (a command that arrives during a spin is lost) with a
+share of failed transfers. Servo cycles are scaled down so this finishes
+in seconds.
+
+- submit cost: Dispenser.dispense() from the game thread, vs writing the
+  command inline and waiting out the spin the way a blocking call has to
+- bursts: requests in random bursts, sent directly to the bus vs through
+  the Dispenser (paced, retried, merged, capped)
+
+    python3 benchmarks/bench_dispenser.py --requests 200 --fail-rate 0.1
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from trivia_core.dispenser import ADDRESS, CYCLE_SECONDS, SLOTS, Dispenser, FakeDispenserBus
+
+
+def bursts(requests, seed):
+    """(delay before, slot) pairs: a few requests at once, then a pause."""
+    rng = random.Random(seed)
+    plan = []
+    while len(plan) < requests:
+        slot = rng.choice(SLOTS)
+        for i in range(rng.randint(1, 5)):
+            plan.append((0.0 if i else rng.uniform(0, 4), slot if rng.random() < 0.7 else rng.choice(SLOTS)))
+    return plan[:requests]
+
+
+def run_direct(plan, cycle, fail_rate, seed):
+    """Every request written to the bus straight away, no pacing and no retries."""
+    bus = FakeDispenserBus(cycle, fail_rate, seed)
+    errors = 0
+    for delay, slot in plan:
+        time.sleep(delay * cycle)
+        try:
+            bus.write_byte(ADDRESS, slot)
+            bus.read_byte(ADDRESS)
+        except OSError:
+            errors += 1
+    time.sleep(2 * cycle)
+    return bus, errors
+
+
+def run_dispenser(plan, cycle, fail_rate, seed):
+    bus = FakeDispenserBus(cycle, fail_rate, seed)
+    dispenser = Dispenser(bus, cycle_seconds=cycle * 1.05, coalesce_seconds=cycle / 4,
+                          retry_delay=cycle / 50)
+    for delay, slot in plan:
+        time.sleep(delay * cycle)
+        dispenser.dispense(slot)
+    dispenser.close()
+    time.sleep(2 * cycle)
+    return bus, dispenser
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--fail-rate", type=float, default=0.1, help="share of I2C transfers that fail")
+    parser.add_argument("--scale", type=float, default=0.01, help="servo cycle as a fraction of the real one")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    cycle = CYCLE_SECONDS * args.scale
+
+    dispenser = Dispenser(FakeDispenserBus(cycle), cycle_seconds=cycle)  # Default backlog of 8
+    calls = 20000
+    started = time.perf_counter()
+    for i in range(calls):
+        dispenser.dispense(SLOTS[i % 4])
+    submit_us = (time.perf_counter() - started) / calls * 1e6
+    dispenser.close(drain=False)
+    print(f"submit:     dispense() {submit_us:.1f} us per call; inline write + spin would block "
+          f"{CYCLE_SECONDS * 1000:.0f} ms (real servo)")
+
+    plan = bursts(args.requests, args.seed)
+    bus, errors = run_direct(plan, cycle, args.fail_rate, args.seed)
+    print(f"direct:     {len(plan)} requests -> {bus.total()} candies, {bus.lost} lost mid-spin, "
+          f"{errors} transfers failed")
+    bus, dispenser = run_dispenser(plan, cycle, args.fail_rate, args.seed)
+    print(f"dispenser:  {len(plan)} requests -> {bus.total()} candies, {bus.lost} lost mid-spin, "
+          f"{dispenser.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Blit cost of the flappy bird sprite, before and after flappy_core.assets.
+
+Before: the PNG loaded and scaled the way flappy.py used to, without
+convert_alpha(), so every blit converts its pixel format. After: the
+converted frame from the asset manager's atlas. Also times loading and
+scaling, which used to happen once per image and now once per (image, size).
+Runs headless under SDL's dummy video driver.
+
+    python3 benchmarks/bench_flappy_assets.py --blits 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import pygame
+
+from flappy_core.assets import Assets
+
+GAME_DIR = os.path.join(REPO_DIR, "challenge_code")
+WIDTH, HEIGHT = 1200, 620
+SIZES = [(50, 40), (100, 80)]
+
+
+def blit_ms(screen, surface, blits):
+    """Mean ms per blit, moving the sprite like the bird does."""
+    started = time.perf_counter()
+    for i in range(blits):
+        screen.blit(surface, (200, 100 + i % 400))
+    return (time.perf_counter() - started) / blits * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blits", type=int, default=20000)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    screen.fill((114, 198, 206))
+    assets = Assets(GAME_DIR)
+
+    started = time.perf_counter()
+    assets.frames("skeleton-animation_*.png", SIZES[0])
+    first_load = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    assets.frames("skeleton-animation_*.png", SIZES[0])
+    cached_load = (time.perf_counter() - started) * 1000
+    print(f"load + scale + atlas: {first_load:.2f} ms first time, {cached_load * 1000:.1f} us cached")
+
+    for size in SIZES:
+        raw = pygame.transform.scale(pygame.image.load(os.path.join(GAME_DIR, "skeleton-animation_01.png")), size)
+        frame = assets.frames("skeleton-animation_*.png", size)[0]
+        before = blit_ms(screen, raw, args.blits)
+        after = blit_ms(screen, frame, args.blits)
+        print(f"{size[0]}x{size[1]} blit: unconverted {before * 1000:6.2f} us, "
+              f"atlas {after * 1000:6.2f} us  ({before / after:.1f}x faster)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Collision cost per physics tick with many obstacles on screen.
+
+Scrolls N pipes and pickups past the bird, respawning each one at the
+right edge when it leaves the screen, and checks the bird against them
+every tick. Compares the straightforward way (a list of obstacle objects,
+a new object per spawn, every obstacle moved and tested every tick) with
+flappy_core.obstacles.ObstaclePool (preallocated slots, O(1) scrolling,
+sorted broad phase). Both must report the same hits.
+
+    python3 benchmarks/bench_flappy_obstacles.py --ticks 3000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from flappy_core.obstacles import PICKUP, PIPE, ObstaclePool
+
+WIDTH, HEIGHT = 1200, 620
+BIRD = (200, 0, 50, 40)   # x, y, width, height; y follows a sine-ish path
+SPEED = 10
+
+
+class Obstacle:
+    def __init__(self, x, y, width, height, kind):
+        self.x, self.y, self.width, self.height, self.kind = x, y, width, height, kind
+
+
+def layout(count, seed):
+    """Start positions spread over one screen width, pipes and pickups mixed."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        if i % 4 == 3:
+            items.append((rng.randrange(WIDTH), rng.randrange(HEIGHT - 20), 20, 20, PICKUP))
+        else:
+            items.append((rng.randrange(WIDTH), 0, 40, HEIGHT, PIPE))
+    return items
+
+
+def bird_y(tick):
+    return 100 + (tick * 7) % 400
+
+
+def run_list(count, ticks, seed):
+    obstacles = [Obstacle(*item) for item in layout(count, seed)]
+    bx, _, bw, bh = BIRD
+    hits = 0
+    started = time.perf_counter()
+    for tick in range(ticks):
+        by = bird_y(tick)
+        for i, ob in enumerate(obstacles):
+            ob.x -= SPEED
+            if ob.x + ob.width < 0:
+                obstacles[i] = Obstacle(ob.x + WIDTH + ob.width, ob.y, ob.width, ob.height, ob.kind)
+        for ob in obstacles:
+            if ob.x < bx + bw and ob.x + ob.width > bx and ob.y < by + bh and ob.y + ob.height > by:
+                hits += 1
+    return (time.perf_counter() - started) / ticks * 1e6, hits
+
+
+def run_pool(count, ticks, seed):
+    pool = ObstaclePool(count)
+    for item in layout(count, seed):
+        pool.spawn(*item)
+    bx, _, bw, bh = BIRD
+    hits = 0
+    started = time.perf_counter()
+    for tick in range(ticks):
+        by = bird_y(tick)
+        # Respawn each one that left at the right edge, like the list version
+        freed = pool.scroll(SPEED)
+        gone = pool.gone
+        respawns = [(pool.x(slot) + WIDTH + pool.width[slot], pool.top[slot], pool.width[slot],
+                     pool.height[slot], pool.kind[slot])
+                    for slot in (gone[i] for i in range(freed))]  # Read before spawn reuses the slots
+        for item in respawns:
+            pool.spawn(*item)
+        hits += len(pool.overlapping(bx, by, bw, bh))
+    return (time.perf_counter() - started) / ticks * 1e6, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=3000)
+    parser.add_argument("--counts", default="1,10,100,300,1000", help="obstacles on screen, comma separated")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'obstacles':>9s} {'list us/tick':>13s} {'pool us/tick':>13s} {'speedup':>8s} {'hits':>7s}")
+    for count in (int(c) for c in args.counts.split(",")):
+        naive, naive_hits = run_list(count, args.ticks, args.seed)
+        pooled, pool_hits = run_pool(count, args.ticks, args.seed)
+        match = "" if naive_hits == pool_hits else f"  MISMATCH (list {naive_hits})"
+        print(f"{count:9d} {naive:13.1f} {pooled:13.1f} {naive / pooled:7.1f}x {pool_hits:7d}{match}")
+
+
+if __name__ == "__main__":
+    main()
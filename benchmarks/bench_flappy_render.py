@@ -0,0 +1,109 @@
+"""
+Frame time of flappy's text and question box drawing, before and after RenderCache.
+
+Draws the same frames (pipe labels, score/lives HUD with the flash effect,
+question box) the way flappy.py used to, creating fonts, text and the
+translucent box every frame, and through flappy_core.render_cache. Runs
+headless under SDL's dummy video driver.
+
+    python3 benchmarks/bench_flappy_render.py --frames 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import pygame
+
+from flappy_core.render_cache import RenderCache
+
+WIDTH, HEIGHT = 1200, 620
+WHITE, RED = (255, 255, 255), (255, 0, 0)
+QUESTIONS = [
+    ("How many legs does a spider have?", {"A": "2", "B": "4", "C": "6", "D": "8"}),
+    ("What is the capital of France?", {"A": "Berlin", "B": "Madrid", "C": "Paris", "D": "Rome"}),
+]
+GAPS = [150, 250, 350, 450]
+FRAMES_PER_QUESTION = 120  # One pipe crossing at moving_rate 10
+
+
+def frame_state(i):
+    question = QUESTIONS[(i // FRAMES_PER_QUESTION) % len(QUESTIONS)]
+    flash_timer = 20 - i % 60 if i % 60 < 20 else 0
+    return question, i // 200, 3 - (i // 400) % 3, flash_timer
+
+
+def draw_uncached(screen, font, i):
+    """What draw_pipes' text and draw_question did per frame before the cache."""
+    (question, options), score, lives, flash_timer = frame_state(i)
+    for label, gap in zip("ABCD", GAPS):
+        screen.blit(font.render(label, True, WHITE), (600, gap + 25))
+    color = RED if flash_timer and flash_timer % 10 < 5 else WHITE
+    display_font = pygame.font.Font(None, 50 if flash_timer else 30)
+    screen.blit(display_font.render(f"Score: {score}", True, color), (WIDTH - 200, 10))
+    screen.blit(display_font.render(f"Lives: {lives}", True, color), (WIDTH - 200, 50))
+
+    widths = [font.size(question)[0]] + [font.size(f"{k}. {v}")[0] for k, v in options.items()]
+    box = pygame.Surface((max(widths) + 30, 30 + 5 * 25), pygame.SRCALPHA)
+    box.fill((0, 0, 0, 128))
+    screen.blit(box, (10, 50))
+    screen.blit(font.render(question, True, WHITE), (25, 65))
+    for n, (k, v) in enumerate(options.items()):
+        screen.blit(font.render(f"{k}. {v}", True, WHITE), (25, 65 + (n + 1) * 25))
+
+
+def draw_cached(screen, render, i):
+    """The same frame through RenderCache, as flappy.py draws it now."""
+    (question, options), score, lives, flash_timer = frame_state(i)
+    for label, gap in zip("ABCD", GAPS):
+        screen.blit(render.text(label, WHITE), (600, gap + 25))
+    color = RED if flash_timer and flash_timer % 10 < 5 else WHITE
+    size = 50 if flash_timer else 30
+    screen.blit(render.text(f"Score: {score}", color, size), (WIDTH - 200, 10))
+    screen.blit(render.text(f"Lives: {lives}", color, size), (WIDTH - 200, 50))
+
+    def build():
+        font = render.font(20)
+        widths = [font.size(question)[0]] + [font.size(f"{k}. {v}")[0] for k, v in options.items()]
+        box = pygame.Surface((max(widths) + 30, 30 + 5 * 25), pygame.SRCALPHA)
+        box.fill((0, 0, 0, 128))
+        box.blit(font.render(question, True, WHITE), (15, 15))
+        for n, (k, v) in enumerate(options.items()):
+            box.blit(font.render(f"{k}. {v}", True, WHITE), (15, 15 + (n + 1) * 25))
+        return box
+    screen.blit(render.surface("question", question, build), (10, 50))
+
+
+def run(frames, draw):
+    started = time.perf_counter()
+    for i in range(frames):
+        draw(i)
+    return (time.perf_counter() - started) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.Font(None, 20)
+    render = RenderCache()
+
+    before = run(args.frames, lambda i: draw_uncached(screen, font, i))
+    after = run(args.frames, lambda i: draw_cached(screen, render, i))
+    pygame.quit()
+
+    print(f"uncached:  {before:.3f} ms/frame")
+    print(f"cached:    {after:.3f} ms/frame  (saves {before - after:.3f} ms, {100 * (1 - after / before):.0f}%)")
+    print(f"cache:     {render.hits} hits, {render.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Press detection on the Pico: the old 100 ms polling loop vs pico_buttons IRQs.
+
+Replays the same random taps (hold time, contact bounce, arrival time) in
+virtual milliseconds against both input paths and reports how long each
+took to notice a press, how many taps it missed, and how many bounces were
+counted as extra presses. The IRQ path runs the real pico_buttons.Buttons
+class on a minimal stand-in for machine.Pin.
+
+    python3 benchmarks/bench_pico_input.py --taps 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import types
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+POLL_MS = 100   # time.sleep(0.1) in the old read_button()
+IDLE_MS = 1     # machine.idle() returns by the next 1 ms system tick at the latest
+
+
+class VirtualPin:
+    """Just enough of machine.Pin for Buttons: a level and an IRQ handler."""
+
+    IN = PULL_UP = IRQ_FALLING = 0
+    level = {}
+
+    def __init__(self, number, mode=None, pull=None):
+        self.number = number
+        self.handler = None
+        VirtualPin.level[number] = 1
+
+    def value(self):
+        return VirtualPin.level[self.number]
+
+    def irq(self, trigger=None, handler=None):
+        self.handler = handler
+
+    def drive(self, level):
+        falling = VirtualPin.level[self.number] == 1 and level == 0
+        VirtualPin.level[self.number] = level
+        if falling and self.handler:
+            self.handler(self)
+
+
+def make_taps(count, rng):
+    """(press ms, hold ms, edge times) for taps spaced like a player answering."""
+    taps, t = [], 1000
+    for _ in range(count):
+        t += rng.randint(400, 3000)
+        hold = rng.choice((rng.randint(15, 60), rng.randint(60, 250)))  # Quick taps and normal presses
+        edges = [(t, 0)]
+        for b in range(rng.randint(0, 4)):  # Contact bounce in the first few ms
+            edges += [(t + 1 + 2 * b, 1), (t + 2 + 2 * b, 0)]
+        edges.append((t + hold, 1))
+        taps.append((t, hold, edges))
+    return taps
+
+
+def polling(taps, rng):
+    """Old read_button(): sample the pin, sleep 100 ms, repeat."""
+    phase = rng.randrange(POLL_MS)
+    latencies, missed = [], 0
+    for t, hold, _ in taps:
+        first_sample = t + (phase - t) % POLL_MS
+        if first_sample < t + hold:
+            latencies.append(first_sample - t)
+        else:
+            missed += 1
+    return latencies, missed, 0
+
+
+def irq(taps):
+    machine = types.ModuleType("machine")
+    machine.Pin = VirtualPin
+    sys.modules["machine"] = machine
+    import pico_buttons
+
+    clock = [0]
+    pico_buttons.ticks_ms = lambda: clock[0]
+    buttons = pico_buttons.Buttons((("A", 10),))
+    pin = buttons.pins[0]
+
+    latencies, missed, extra = [], 0, 0
+    for t, hold, edges in taps:
+        for when, level in edges:
+            clock[0] = when
+            pin.drive(level)
+        press = buttons.get()
+        if press is None:
+            missed += 1
+            continue
+        latencies.append(press[1] - t + IDLE_MS)  # Queued at the edge, seen at the next wakeup
+        while buttons.get() is not None:
+            extra += 1
+    return latencies, missed, extra
+
+
+def report(name, latencies, missed, extra, taps):
+    latencies.sort()
+    avg = sum(latencies) / len(latencies) if latencies else 0
+    worst = latencies[-1] if latencies else 0
+    print(f"{name:8s} detect avg {avg:5.1f} ms  worst {worst:3d} ms  "
+          f"missed {100 * missed / taps:4.1f}%  double presses {extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--taps", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taps = make_taps(args.taps, rng)
+    report("polling", *polling(taps, rng), args.taps)
+    report("irq", *irq(taps), args.taps)
+
+
+if __name__ == "__main__":
+    main()
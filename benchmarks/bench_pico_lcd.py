@@ -0,0 +1,125 @@
+"""
+I2C traffic per LCD frame: clear()+putstr() through i2c_lcd vs pico_lcd.FrameLcd.
+
+Plays the screens of a few Pico games (score, timer, question, options,
+feedback) through both paths and reports bus bytes per frame and the bus
+time per frame at 400 kHz, including the 5 ms waits i2c_lcd does after
+clear and home. FrameLcd runs for real against a byte-counting I2C bus;
+the old path is counted the way i2c_lcd writes: every HD44780 byte is four
+one-byte I2C transactions.
+
+    python3 benchmarks/bench_pico_lcd.py
+"""
+
+import argparse
+import os
+import random
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from pico_lcd import FrameLcd
+from trivia_core.bank import DEFAULT_BANK_PATH, load_questions
+from trivia_core.engine import question_parts
+
+I2C_HZ = 400000
+BITS_PER_BYTE = 9  # 8 data bits plus ACK
+CLEAR_WAIT_S = 0.010  # i2c_lcd sleeps 5 ms after both LCD_CLR and LCD_HOME
+
+
+class CountingI2C:
+    def __init__(self):
+        self.bus_bytes = 0
+        self.transactions = 0
+
+    def writeto(self, addr, data):
+        self.transactions += 1
+        self.bus_bytes += 1 + len(data)  # Address byte plus payload
+
+
+class PanelStub:
+    """What FrameLcd reads from an I2cLcd; clear() is its one-off start-up cost."""
+
+    def __init__(self, i2c):
+        self.i2c = i2c
+        self.i2c_addr = 0x27
+        self.backlight = 1
+        self.num_lines = 2
+        self.num_columns = 16
+
+    def clear(self):
+        pass
+
+
+def old_frame_cost(text, rows=2, cols=16):
+    """(bus bytes, seconds) for lcd.clear(); lcd.putstr(text) with lcd_api/i2c_lcd."""
+    writes = 2  # LCD_CLR, LCD_HOME
+    x = y = 0
+    implied_newline = False
+    for ch in text:
+        if ch == "\n":
+            if not implied_newline:
+                x = cols
+        else:
+            writes += 1
+            x += 1
+        if x >= cols:
+            x = 0
+            y = (y + 1) % rows
+            implied_newline = ch != "\n"
+            writes += 1  # move_to()
+    bus_bytes = writes * 4 * 2  # Four transactions of address + one byte each
+    return bus_bytes, bus_bytes * BITS_PER_BYTE / I2C_HZ + CLEAR_WAIT_S
+
+
+def game_screens(questions, rng, games):
+    """(display, text) in the order the Pico game draws them."""
+    for _ in range(games):
+        yield "question", "Press any btn\nto start!"
+        score = 0
+        for seconds_left in range(10, 0, -2):
+            question, options, correct = question_parts(rng.choice(questions))
+            yield "score", f"Score: {score}"
+            yield "time", f"Time: {seconds_left}s"
+            yield "question", question
+            yield "question", f"A.{options['A']} B.{options['B']}\nC.{options['C']} D.{options['D']}"
+            if rng.random() < 0.6:
+                score += 10
+                yield "question", "Correct!"
+            else:
+                yield "question", "Incorrect!"
+            yield "score", f"Score: {score}"
+        yield "question", f"Game Over!\nScore: {score}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=50)
+    args = parser.parse_args()
+
+    questions = load_questions(DEFAULT_BANK_PATH)
+    bus = CountingI2C()
+    displays = {name: FrameLcd(PanelStub(bus)) for name in ("question", "score", "time")}
+
+    frames = old_bytes = old_seconds = 0
+    cpu_us = []
+    for name, text in game_screens(questions, random.Random(1), args.games):
+        b, s = old_frame_cost(text)
+        old_bytes += b
+        old_seconds += s
+        displays[name].show(text)
+        cpu_us.append(displays[name].last_us)
+        frames += 1
+
+    new_seconds = bus.bus_bytes * BITS_PER_BYTE / I2C_HZ
+    print(f"frames:            {frames} over {args.games} games")
+    print(f"clear+putstr:      {old_bytes / frames:6.1f} bus bytes/frame  "
+          f"{1000 * old_seconds / frames:5.2f} ms/frame")
+    print(f"FrameLcd:          {bus.bus_bytes / frames:6.1f} bus bytes/frame  "
+          f"{1000 * new_seconds / frames:5.2f} ms/frame  ({bus.transactions / frames:.2f} transactions/frame)")
+    print(f"diff cost (CPython): {sum(cpu_us) / len(cpu_us):.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
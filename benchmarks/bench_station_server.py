@@ -0,0 +1,120 @@
+"""
+Load test for station_server.py: how many stations one core can host.
+
+Starts the server as a subprocess, connects N bot stations that play
+continuously (start, answer after a random think time, repeat), and after
+--seconds reports the server's CPU use, sessions per core and how quickly
+answers came back as feedback. Linux only (reads /proc/<pid>/stat).
+
+    python3 benchmarks/bench_station_server.py --stations 200 --seconds 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+def cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def bot(port, stats, stop_at, think):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    rng = random.Random()
+    sent_at = None
+    try:
+        while time.perf_counter() < stop_at:
+            line = await reader.readline()
+            if not line:
+                return
+            message = json.loads(line)
+            kind = message["type"]
+            if kind == "ready":
+                writer.write(b"s\n")
+            elif kind == "question":
+                await asyncio.sleep(rng.uniform(*think))
+                sent_at = time.perf_counter()
+                writer.write(rng.choice(b"ABCD").to_bytes(1, "little") + b"\n")
+            elif kind == "feedback" and sent_at is not None:
+                stats["latency"].append((time.perf_counter() - sent_at) * 1000)
+                sent_at = None
+            elif kind == "game_over":
+                stats["sessions"] += 1
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def run_bots(port, stations, seconds, think):
+    stats = {"sessions": 0, "latency": []}
+    stop_at = time.perf_counter() + seconds
+    await asyncio.gather(*(bot(port, stats, stop_at, think) for _ in range(stations)),
+                         return_exceptions=True)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stations", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--think", type=float, nargs=2, default=(0.3, 2.0), help="min/max seconds to answer")
+    args = parser.parse_args()
+
+    port = free_port()
+    scratch = tempfile.mkdtemp(prefix="bench-")  # Keep the bots out of the real deck and telemetry files
+    env = dict(os.environ, SWEETRIVIA_DECK_FILE=os.path.join(scratch, "decks"),
+               SWEETRIVIA_TELEMETRY_FILE=os.path.join(scratch, "telemetry"))
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(REPO_DIR, "station_server.py"), "--host", "127.0.0.1", "--port", str(port)],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(("127.0.0.1", port)).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+
+        cpu_before = cpu_seconds(server.pid)
+        wall_before = time.perf_counter()
+        stats = asyncio.run(run_bots(port, args.stations, args.seconds, args.think))
+        wall = time.perf_counter() - wall_before
+        cpu = cpu_seconds(server.pid) - cpu_before
+    finally:
+        server.terminate()
+        server.wait()
+
+    latency = sorted(stats["latency"])
+    load = cpu / wall
+    print(f"stations:          {args.stations} concurrent for {wall:.1f}s")
+    print(f"games finished:    {stats['sessions']} ({len(latency)} answers)")
+    print(f"server CPU:        {100 * load:.1f}% of one core")
+    if load > 0:
+        print(f"sessions per core: ~{args.stations / load:,.0f} concurrent stations at this play rate")
+    if latency:
+        print(f"answer->feedback:  p50 {latency[len(latency) // 2]:.2f}ms  "
+              f"p99 {latency[int(len(latency) * 0.99)]:.2f}ms  mean {statistics.mean(latency):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Per-event cost of answer telemetry, as seen by the game loop.
+
+Times TelemetryRecorder.record() on its own and a full question/answer step
+through TriviaEngine with and without a recorder attached, then checks that
+everything recorded made it to the log and reads back through the report.
+
+    python3 benchmarks/bench_telemetry.py --events 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from trivia_core.bank import load_questions, DEFAULT_BANK_PATH
+from trivia_core.engine import TriviaEngine
+from trivia_core.telemetry import RECORD, TelemetryRecorder, read_records, summarize
+
+
+def engine_steps(questions, events, telemetry=None):
+    """Seconds per next_question() + answer() pair."""
+    engine = TriviaEngine(questions, round_seconds=None, feedback_seconds=None)
+    if telemetry is not None:
+        telemetry.attach(engine)
+    engine.start()
+    started = time.perf_counter()
+    for i in range(events):
+        engine.answer("ABCD"[i % 4])
+        engine.next_question()
+    return (time.perf_counter() - started) / events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args()
+
+    questions = load_questions(DEFAULT_BANK_PATH)
+    log_dir = tempfile.mkdtemp(prefix="telemetry-")
+
+    # Raw record() cost; a tight loop outruns the flusher, so some drops here are expected
+    path = os.path.join(log_dir, "record.log")
+    telemetry = TelemetryRecorder(path, flush_interval=0.5)
+    text = questions[0]["question"]
+    started = time.perf_counter()
+    for i in range(args.events):
+        telemetry.record(text, "ABCD"[i % 4], i % 3 == 0, 2.5)
+    record_us = (time.perf_counter() - started) / args.events * 1e6
+    telemetry.close()
+    logged = (os.path.getsize(path) - 8) // RECORD.size
+    print(f"record():            {record_us:.2f} us/event "
+          f"({logged} logged, {telemetry.dropped} dropped, {RECORD.size} bytes each)")
+
+    baseline = engine_steps(questions, args.events)
+    path = os.path.join(log_dir, "engine.log")
+    telemetry = TelemetryRecorder(path)
+    attached = engine_steps(questions, args.events, telemetry)
+    telemetry.close()
+    print(f"engine step, off:    {baseline * 1e6:.2f} us")
+    print(f"engine step, on:     {attached * 1e6:.2f} us  (+{(attached - baseline) * 1e6:.2f} us per answer)")
+
+    count = sum(1 for _ in read_records(path))
+    started = time.perf_counter()
+    rows = summarize(path, questions)
+    report = time.perf_counter() - started
+    print(f"log:                 {count} answers, {os.path.getsize(path) / 1024:.0f} KiB, "
+          f"{telemetry.dropped} dropped")
+    print(f"report:              {len(rows)} questions aggregated in {report * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+CPU use of the kiosk UI loop while nobody touches it.
+
+Runs a stand-in home screen (title, buttons, hint text) for a few seconds
+each way and reports process CPU time as a share of one core:
+
+- the old trivia_ui.py loop: fill, draw, display.update as fast as possible
+- ScreenManager idle: nothing changes, so it sleeps in event.wait
+- ScreenManager animating: a blinking hint, redrawn at the fps cap
+
+Runs headless under SDL's dummy video driver (the screens package that
+trivia_ui.py imports isn't in the repo, hence the stand-in).
+
+    python3 benchmarks/bench_ui_idle.py --seconds 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import pygame
+
+from screen_manager import ScreenManager
+
+WIDTH, HEIGHT = 1200, 620
+
+
+class StandInHome:
+    """Roughly what a home screen draws: a title, three buttons and a hint line."""
+
+    def __init__(self, surface, blink=False):
+        self.surface = surface
+        self.title_font = pygame.font.Font(None, 80)
+        self.font = pygame.font.Font(None, 36)
+        self.animating = blink
+        self.elapsed = 0.0
+
+    def update(self, dt):
+        self.elapsed += dt
+
+    def handle_event(self, event):
+        return event.type == pygame.MOUSEBUTTONDOWN
+
+    def draw(self):
+        self.surface.blit(self.title_font.render("SweeTrivia", True, (255, 255, 255)), (430, 120))
+        for i, label in enumerate(["Standard", "Challenge", "Flappy"]):
+            rect = pygame.Rect(450, 260 + i * 90, 300, 60)
+            pygame.draw.rect(self.surface, (200, 60, 120), rect, border_radius=12)
+            self.surface.blit(self.font.render(label, True, (255, 255, 255)), (rect.x + 90, rect.y + 18))
+        if not self.animating or int(self.elapsed * 2) % 2 == 0:
+            self.surface.blit(self.font.render("Press a button to play", True, (200, 200, 200)), (450, 560))
+
+
+def old_loop(surface, screen, seconds):
+    frames = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        surface.fill((0, 0, 0))
+        pygame.event.get()
+        screen.draw()
+        pygame.display.update()
+        frames += 1
+    return frames
+
+
+def managed(surface, screen, seconds):
+    manager = ScreenManager(surface, fps=30)
+    manager.show(screen)
+    pygame.event.clear()
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), 1)  # Ends run() like closing the window
+    manager.run()
+    return manager.frames
+
+
+def measure(label, run, seconds):
+    wall, cpu = time.perf_counter(), time.process_time()
+    frames = run(seconds)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(f"{label:28s} {100 * cpu / wall:5.1f}% CPU  {frames / wall:8.1f} frames/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    pygame.init()
+    surface = pygame.display.set_mode((WIDTH, HEIGHT))
+    measure("old loop", lambda s: old_loop(surface, StandInHome(surface), s), args.seconds)
+    measure("ScreenManager idle", lambda s: managed(surface, StandInHome(surface), s), args.seconds)
+    measure("ScreenManager animating", lambda s: managed(surface, StandInHome(surface, blink=True), s), args.seconds)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
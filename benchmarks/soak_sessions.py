@@ -0,0 +1,182 @@
+"""
+Soak test for the curses standard mode's session loop.
+
+Plays thousands of back-to-back games through the real game_loop with an
+accelerated clock and a scripted window (no terminal needed), sampling
+Python stack depth and traced memory at every start screen. Exits non-zero
+if either keeps growing.
+
+    python3 benchmarks/soak_sessions.py --games 10000
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+MEMORY_SLACK = 64 * 1024  # Allowed drift between the first and last samples (bytes)
+
+
+class SoakDone(Exception):
+    pass
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping just moves the clock forward."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeCurses:
+    """The handful of curses module functions the game calls."""
+
+    A_BOLD = COLOR_BLACK = COLOR_WHITE = COLOR_GREEN = COLOR_RED = 0
+
+    def color_pair(self, n):
+        return 0
+
+    def start_color(self):
+        pass
+
+    def init_pair(self, *args):
+        pass
+
+    def curs_set(self, visibility):
+        pass
+
+    def doupdate(self):
+        pass
+
+    def flushinp(self):
+        pass
+
+
+class ScriptedWindow:
+    """A window whose "player" starts every game and answers each question after think seconds."""
+
+    def __init__(self, clock, games, think=0.7):
+        self.clock = clock
+        self.games = games
+        self.think = think
+        self.played = 0
+        self.wait_ms = -1
+        self.next_key_at = None
+        self.depths = []  # (first, last, max); not a list, or the harness itself would grow
+        self.memory = []
+
+    def getch(self):
+        if self.wait_ms < 0:
+            return self._start_screen()
+
+        if self.next_key_at is None:
+            self.next_key_at = self.clock.now + self.think
+        wake = self.clock.now + self.wait_ms / 1000.0
+        if wake < self.next_key_at:
+            self.clock.now = wake
+            return -1
+        self.clock.now = self.next_key_at
+        self.next_key_at = None
+        return ord("ABCD"[self.played % 4])
+
+    def _start_screen(self):
+        depth = 0
+        frame = sys._getframe()
+        while frame is not None:
+            depth += 1
+            frame = frame.f_back
+        first = self.depths[0] if self.depths else depth
+        self.depths = (first, depth, max(depth, self.depths[2] if self.depths else depth))
+        if self.played % 100 == 0:
+            self.memory.append(tracemalloc.get_traced_memory()[0])
+
+        if self.played == self.games:
+            raise SoakDone()
+        self.played += 1
+        self.next_key_at = None
+        return ord(" ")
+
+    def timeout(self, ms):
+        self.wait_ms = ms
+
+    def addstr(self, *args):
+        pass
+
+    def move(self, y, x):
+        pass
+
+    def clrtoeol(self):
+        pass
+
+    def erase(self):
+        pass
+
+    def bkgd(self, attr):
+        pass
+
+    def refresh(self):
+        pass
+
+    def noutrefresh(self):
+        pass
+
+
+def load_game(path):
+    spec = importlib.util.spec_from_file_location("soaked_game", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--script", default=os.path.join(REPO_DIR, "s_mode_interface_sim.py"))
+    args = parser.parse_args()
+
+    deck_dir = tempfile.mkdtemp(prefix="soak-")
+    os.environ["SWEETRIVIA_DECK_FILE"] = os.path.join(deck_dir, "decks")
+    game = load_game(args.script)
+
+    clock = FakeClock()
+    game.time = clock
+    game.curses = FakeCurses()
+    game.engine.clock = clock.time
+    window = ScriptedWindow(clock, args.games)
+
+    tracemalloc.start()
+    try:
+        game.game_loop(window)
+    except SoakDone:
+        pass
+    except RecursionError:
+        print(f"RecursionError after {window.played} games")
+    tracemalloc.stop()
+
+    depths, memory = window.depths, window.memory
+    print(f"games played:   {window.played}")
+    print(f"stack depth:    first {depths[0]}, last {depths[1]}, max {depths[2]}")
+    print(f"traced memory:  first {memory[0] / 1024:.1f} KiB, last {memory[-1] / 1024:.1f} KiB, "
+          f"max {max(memory) / 1024:.1f} KiB")
+
+    # Compare against the sample after the first 100 games, once caches and the deck file exist
+    baseline = memory[1] if len(memory) > 1 else memory[0]
+    ok = (window.played == args.games and depths[2] == depths[0]
+          and memory[-1] - baseline <= MEMORY_SLACK)
+    print("PASS" if ok else "FAIL: stack or memory grew across sessions")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
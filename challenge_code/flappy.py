@@ -1,6 +1,58 @@
+import argparse
+import atexit
+import os
+import sys
+import tempfile
+import time
+
+STARTED = time.perf_counter()  # Startup timing includes importing pygame
+
 import pygame
 import random
 
+# Shared game logic lives at the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from trivia_core.deck import DEFAULT_DECK_PATH, QuestionDeck
+from trivia_core.engine import GAME_OVER, TriviaEngine
+from flappy_core.assets import Assets
+from flappy_core.layers import LayeredRenderer
+from flappy_core.physics import FlappyPhysics
+from flappy_core.replay import InputRecorder, InputReplay
+from flappy_core.render_cache import RenderCache
+from flappy_core.timestep import FixedTimestep, lerp
+from trivia_core.profiler import NullProfiler, StageProfiler, load_results
+from preloader import Preloader
+
+parser = argparse.ArgumentParser(description="Flappy Bird trivia.")
+mode = parser.add_mutually_exclusive_group()
+mode.add_argument("--bench", type=int, metavar="FRAMES",
+                  help="headless benchmark: a scripted player plays FRAMES frames, then per-stage frame times are printed")
+mode.add_argument("--record", metavar="FILE", help="record this session's input to FILE")
+mode.add_argument("--replay", metavar="FILE", help="play back a recorded session (with per-stage frame times)")
+parser.add_argument("--fast", action="store_true", help="with --replay: headless and as fast as possible")
+parser.add_argument("--seed", type=int, default=1, help="random seed for --bench, so runs are comparable")
+parser.add_argument("--json", metavar="FILE", help="save the --bench/--replay results to FILE")
+parser.add_argument("--baseline", metavar="FILE", help="compare the --bench/--replay results with a saved run")
+args = parser.parse_args()
+
+replay = InputReplay(args.replay) if args.replay else None
+scripted = bool(args.bench or replay)  # Start and game over screens are clicked through automatically
+if args.bench or (replay and args.fast):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed
+
+# Seeding first makes everything random below (pipe_height, deck shuffles) repeatable
+if replay:
+    seed = replay.seed
+elif args.record:
+    seed = random.randrange(2 ** 32)
+else:
+    seed = args.seed
+if scripted or args.record:
+    random.seed(seed)
+recorder = InputRecorder(args.record, seed, int(os.environ.get("FLAPPY_FPS", "60"))) if args.record else None
+if recorder:
+    atexit.register(recorder.close)  # Keep the recording even if the game exits from a menu
+
 # Initialize Pygame
 pygame.init()
 
@@ -16,22 +68,19 @@ BLACK = (0, 0, 0)
 GREEN = (0, 200, 0)
 RED = (255, 0, 0)
 
-# Game Variables
-bird_x, bird_y = 200, 200
+# Frame pacing: rendering runs at TARGET_FPS, physics at a fixed 30 ticks per second
+TARGET_FPS = replay.target_fps if replay else int(os.environ.get("FLAPPY_FPS", "60"))
+
+# Game Variables (the bird and pipe positions live in `physics`, below)
+bird_x = 200
 bird_radius = 10
 gravity = 0.5
-velocity = 0
 jump_strength = -6
-pipe_x = WIDTH
 pipe_gap = 60
 pipe_width = 40
 pipe_height = random.randint(50, HEIGHT - pipe_gap - 50)
-score = 0
-lives = 3  # Challenge Mode: 3 Lives
 moving_rate = 10
 game_started = False
-passed_pipe = False
-missed_pipe = False  # Ensure lives are reduced only once per pipe
 
 # Flash effect variables
 flash_timer = 0
@@ -45,10 +94,41 @@ questions = [
     {"question": "What is the capital of France?", "options": ["Berlin", "Madrid", "Paris", "Rome"], "correct": "A"},
     {"question": "What is 5 + 5?", "options": ["8", "9", "10", "11"], "correct": "A"},
 ]
-current_question = random.choice(questions)
-
-# Load Font
-font = pygame.font.Font(None, 20)
+# Persistent shuffle deck, no repeats until every question was asked; loaded with the other assets below
+deck_path = DEFAULT_DECK_PATH
+if args.bench:
+    deck_path = os.path.join(tempfile.mkdtemp(), "decks")  # Fresh deck: same questions every run
+
+def pick_question(qs):
+    """Deals the next question; recordings log the deal and replays repeat it."""
+    if replay:
+        return replay.next_question()
+    index = deck.draw("flappy", len(qs))
+    if recorder:
+        recorder.question(index)
+    return index
+
+# Scoring, lives and question selection (Challenge Mode: 3 Lives, no round timer).
+# The next question only comes up when the pipe wraps around.
+engine = TriviaEngine(
+    questions,
+    round_seconds=None,
+    feedback_seconds=None,
+    lives=3,
+    picker=pick_question,
+)
+
+# Load Font; fonts, rendered text and the question box are cached instead of rebuilt every frame
+render = RenderCache()
+assets = Assets(os.path.dirname(os.path.abspath(__file__)))  # Images load from next to this file
+
+# Fonts, images and the question deck load on worker threads while a loading screen is up
+preloader = Preloader(screen, started=STARTED)
+preloader.add("fonts", lambda: [render.font(size) for size in (20, 30, 50)])
+preloader.add("bird", assets.preload, "skeleton-animation_*.png")
+preloader.add("deck", QuestionDeck, deck_path)
+deck = preloader.run("Flappy Bird")["deck"]
+font = render.font(20)
 
 import random
 
@@ -82,106 +162,103 @@ import random
 
 gap_positions = [150, 250, 350, 450]  # Fixed gap positions
 
-def draw_pipes(pipe_x, bird_y, current_question):
-    """Draws the answer choices between the fixed gaps and checks if the player selects the correct answer."""
-    global lives, score, passed_pipe, missed_pipe, flash_active, flash_timer  # Add `flash_active` and `flash_timer`
-
-    labels = ["A", "B", "C", "D"]
-    gap_size = 5 * bird_radius
-
-    # Draw pipes above and below the gaps
-    pygame.draw.rect(screen, GREEN, (pipe_x, 0, pipe_width, gap_positions[0]))
-    pygame.draw.rect(screen, GREEN, (pipe_x, gap_positions[0] + gap_size, pipe_width, gap_positions[1] - (gap_positions[0] + gap_size)))
-    pygame.draw.rect(screen, GREEN, (pipe_x, gap_positions[1] + gap_size, pipe_width, gap_positions[2] - (gap_positions[1] + gap_size)))
-    pygame.draw.rect(screen, GREEN, (pipe_x, gap_positions[2] + gap_size, pipe_width, gap_positions[3] - (gap_positions[2] + gap_size)))
-    pygame.draw.rect(screen, GREEN, (pipe_x, gap_positions[3] + gap_size, pipe_width, HEIGHT - (gap_positions[3] + gap_size)))
+# Bird and pipe movement, collisions and scoring; flappy_core.sim plays the same rules headless
+physics = FlappyPhysics(engine, gravity=gravity, jump_strength=jump_strength, moving_rate=moving_rate,
+                        gap_positions=gap_positions, gap_size=5 * bird_radius, pipe_width=pipe_width,
+                        bird_x=bird_x, bird_radius=bird_radius, width=WIDTH, height=HEIGHT)
 
-    # Draw answer labels inside the gaps
-    for i in range(4):
-        text = font.render(labels[i], True, WHITE)
-        screen.blit(text, (pipe_x + pipe_width // 2 - 10, gap_positions[i] + gap_size // 2))
-
-    # Check if the bird passes through the correct answer's gap
-    correct_label = current_question["correct"]
-    correct_index = labels.index(correct_label)
-
-    if pipe_x < bird_x < pipe_x + pipe_width:
-        if not (gap_positions[correct_index] <= bird_y <= gap_positions[correct_index] + gap_size):
-            if not missed_pipe:  # Reduce life only if it's the first time missing this pipe
-                lives -= 1
-                flash_active = True  # Start flashing effect
-                flash_timer = flash_duration  # Reset flash timer
-                missed_pipe = True  # Prevent multiple life reductions
-        elif not passed_pipe:  # Only increment score if not already counted
-            score += 10
-            passed_pipe = True  # Prevent multiple score increments
+def draw_pipes(pipe_x):
+    """Sprites for the pipe column with its answer gaps, plus the score and lives."""
+    pipes = render.surface("pipes", tuple(gap_positions), build_pipe_column)
+    sprites = [("pipes", pipes, (int(pipe_x), 0))]
 
     # Flashing effect: Alternate red and white every few frames
     if flash_active and flash_timer > 0:
         text_color = RED if (flash_timer % 10 < 5) else WHITE  # Toggle color
-        display_font = pygame.font.Font(None, 50)  # Bigger font when flashing
+        text_size = 50  # Bigger font when flashing
     else:
         text_color = WHITE  # Normal color when not flashing
-        display_font = pygame.font.Font(None, 30)  # Normal size
+        text_size = 30  # Normal size
 
     # Display score and lives in the top-right corner
-    score_text = display_font.render(f"Score: {score}", True, text_color)
-    lives_text = display_font.render(f"Lives: {lives}", True, text_color)
-    screen.blit(score_text, (WIDTH - 200, 10))
-    screen.blit(lives_text, (WIDTH - 200, 50))
+    score_text = render.text(f"Score: {engine.score}", text_color, text_size)
+    lives_text = render.text(f"Lives: {engine.lives}", text_color, text_size)
+    sprites.append(("score", score_text, (WIDTH - 200, 10)))
+    sprites.append(("lives", lives_text, (WIDTH - 200, 50)))
+    return sprites
+
+def build_pipe_column():
+    """Renders the pipes and answer labels once; the column is then moved as one sprite."""
+    labels = ["A", "B", "C", "D"]
+    gap_size = physics.gap_size
+    column = pygame.Surface((pipe_width, HEIGHT), pygame.SRCALPHA)
 
+    # Draw pipes above and below the gaps
+    pygame.draw.rect(column, GREEN, (0, 0, pipe_width, gap_positions[0]))
+    pygame.draw.rect(column, GREEN, (0, gap_positions[0] + gap_size, pipe_width, gap_positions[1] - (gap_positions[0] + gap_size)))
+    pygame.draw.rect(column, GREEN, (0, gap_positions[1] + gap_size, pipe_width, gap_positions[2] - (gap_positions[1] + gap_size)))
+    pygame.draw.rect(column, GREEN, (0, gap_positions[2] + gap_size, pipe_width, gap_positions[3] - (gap_positions[2] + gap_size)))
+    pygame.draw.rect(column, GREEN, (0, gap_positions[3] + gap_size, pipe_width, HEIGHT - (gap_positions[3] + gap_size)))
+
+    # Draw answer labels inside the gaps
+    for i in range(4):
+        column.blit(render.text(labels[i], WHITE), (pipe_width // 2 - 10, gap_positions[i] + gap_size // 2))
+    return column.convert_alpha()
 
-bird_img = pygame.image.load("skeleton-animation_01.png")  # Load the bird image
-bird_img = pygame.transform.scale(bird_img, (50, 40))  # Resize as needed
+
+# Bird animation frames, scaled and converted once and packed into one atlas
+bird_frames = assets.frames("skeleton-animation_*.png", (50, 40))
+BIRD_FRAME_TICKS = 3  # Physics ticks each animation frame is shown for
 
 def draw_bird(bird_y):
-    """Draws the bird using an image instead of a circle."""
-    screen.blit(bird_img, (bird_x, int(bird_y)))
+    """Sprite for the bird, using an image instead of a circle."""
+    bird_img = bird_frames[timestep.steps // BIRD_FRAME_TICKS % len(bird_frames)]
+    return ("bird", bird_img, (bird_x, int(bird_y)))
 
 def draw_question():
-    """Displays the current question dynamically with a transparent background."""
+    """Sprite for the current question on a transparent box, drawn over everything else."""
+    # The box is only rebuilt when the question changes
+    return ("question", render.surface("question", engine.question, build_question_box), (10, 50))
+
+def build_question_box():
+    """Renders the current question and options onto a transparent box."""
     padding = 15
     line_height = 25
     
+    question, options, _ = engine.question
+
     # Calculate dynamic box width based on the longest line of text
-    text_widths = [font.size(current_question["question"])[0]]
-    for option in current_question["options"]:
-        text_widths.append(font.size(f"{chr(65 + current_question["options"].index(option))}. {option}")[0])
+    text_widths = [font.size(question)[0]]
+    for key, option in options.items():
+        text_widths.append(font.size(f"{key}. {option}")[0])
     box_width = max(text_widths) + 2 * padding  # Add padding to the longest text width
     
-    box_x = 10  # Move the box to the leftmost corner
-    box_y = 50  # Move down everything
-    
     # Calculate dynamic box height based on the number of lines
-    num_lines = 1 + len(current_question["options"])  # 1 for the question, others for options
+    num_lines = 1 + len(options)  # 1 for the question, others for options
     question_box_height = padding * 2 + num_lines * line_height
     
     # Create a transparent surface
     transparent_surface = pygame.Surface((box_width, question_box_height), pygame.SRCALPHA)
     transparent_surface.fill((0, 0, 0, 128))  # RGBA (Black with 50% opacity)
-    screen.blit(transparent_surface, (box_x, box_y))
     
-    # Render and display question text
-    text = font.render(current_question["question"], True, WHITE)
-    screen.blit(text, (box_x + padding, box_y + padding))
+    # Render question text
+    text = font.render(question, True, WHITE)
+    transparent_surface.blit(text, (padding, padding))
     
-    # Render and display answer options
-    for i, option in enumerate(current_question["options"]):
-        text = font.render(f"{chr(65+i)}. {option}", True, WHITE)
-        screen.blit(text, (box_x + padding, box_y + padding + (i + 1) * line_height))
+    # Render answer options
+    for i, (key, option) in enumerate(options.items()):
+        text = font.render(f"{key}. {option}", True, WHITE)
+        transparent_surface.blit(text, (padding, padding + (i + 1) * line_height))
+    return transparent_surface
 
 
 def reset_game():
     """Resets game variables to start a new round."""
-    global bird_y, velocity, pipe_x, score, lives, game_started, current_question
-    bird_y = 200
-    velocity = 0
-    pipe_x = WIDTH
-    score = 0
-    lives = 3
+    global game_started
+    physics.reset()
     game_started = False
-    current_question = random.choice(questions)
     show_start_screen()
+    engine.start()  # Fresh score and lives, first question
 
 def show_start_screen():
     """Displays the start screen with instructions."""
@@ -189,6 +266,9 @@ def show_start_screen():
     text = font.render("TAP TO START", True, BLACK)
     screen.blit(text, (WIDTH//2 - 40, HEIGHT//2))
     pygame.display.update()
+    preloader.interactive()  # Reports startup time the first time round
+    if scripted:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))  # Scripted player taps at once
 
     waiting = True
     while waiting:
@@ -203,13 +283,15 @@ def show_game_over_screen():
     """Displays the game over screen and waits for restart input."""
     screen.fill(BLACK)
     text1 = font.render("GAME OVER", True, WHITE)
-    text2 = font.render(f"Score: {score}", True, WHITE)
+    text2 = font.render(f"Score: {engine.score}", True, WHITE)
     text3 = font.render("Press SPACE to Restart", True, WHITE)
 
     screen.blit(text1, (WIDTH//2 - 40, HEIGHT//2 - 40))
     screen.blit(text2, (WIDTH//2 - 40, HEIGHT//2))
     screen.blit(text3, (WIDTH//2 - 80, HEIGHT//2 + 40))
     pygame.display.update()
+    if scripted:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
 
     waiting = True
     while waiting:
@@ -221,58 +303,115 @@ def show_game_over_screen():
                 waiting = False  # Restart game
 
     reset_game()
+def update():
+    """One physics tick (flappy_core.physics), plus the score flash when a life or answer was lost."""
+    global flash_active, flash_timer
+    hit = physics.step()
+
+    # Flashing Timer Countdown
+    if flash_timer > 0:
+        flash_timer -= 1
+    else:
+        flash_active = False  # Stop flashing after timer expires
+    if hit:
+        flash_active = True  # Start flashing effect
+        flash_timer = flash_duration  # Reset flash timer
+
+def scripted_input():
+    """Benchmark player: flaps whenever it falls below the middle of the correct gap."""
+    if physics.bird_y > physics.target_y and physics.velocity >= 0:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
 # Start Screen
 show_start_screen()
+engine.start()
+if args.bench or (replay and args.fast):
+    # Every frame counts as exactly 1/TARGET_FPS (or its recorded length), and nothing waits
+    timestep = FixedTimestep(TARGET_FPS, frame_seconds=1.0 / TARGET_FPS)
+else:
+    timestep = FixedTimestep(TARGET_FPS)
+if scripted:
+    profiler = StageProfiler(["physics", "draw_pipes", "draw_bird", "draw_question", "display_update", "input"])
+else:
+    profiler = NullProfiler()
+
+# Only the rectangles that changed since the last frame get redrawn and pushed to the display
+renderer = LayeredRenderer(screen)
+background = pygame.Surface((WIDTH, HEIGHT)).convert()
+background.fill(SKY)  # Background color
+renderer.set_background(background)
 
 # Main Game Loop
 running = True
 while running:
-    screen.fill(SKY)  # Background color
-
-    # Gravity and Bird Movement
-    velocity += gravity
-    bird_y += velocity
-
-    # Move Pipes
-    pipe_x -= moving_rate
-    if pipe_x < -pipe_width:
-        pipe_x = WIDTH
-        current_question = random.choice(questions)  # Change to a new question
-        passed_pipe = False  # Reset for the new pipe
-        missed_pipe = False  # Reset missed pipe flag to allow life loss for the next pipe
-
-    # Collision Detection (Hitting top/bottom)
-    if bird_y <= 0 or bird_y >= HEIGHT - bird_radius:
-        if lives > 0:  # Reduce lives only if lives remain
-            lives -= 1
-            flash_active = True  # Start flashing effect
-            flash_timer = flash_duration  # Reset flash timer
-            bird_y = HEIGHT // 2  # Reset bird position instead of ending game immediately
-            velocity = 0  # Stop downward movement
-
-    # Flashing Timer Countdown
-    if flash_timer > 0:
-        flash_timer -= 1
+    # Catch the physics up with real time in fixed ticks, however long the last frame took
+    if replay:
+        recorded = replay.next_frame()
+        if recorded is None:
+            break  # End of the recording
+        steps = timestep.advance(recorded[0])
     else:
-        flash_active = False  # Stop flashing after timer expires
+        steps = timestep.advance()
+    profiler.start_frame()
+    for _ in range(steps):
+        update()
+        if engine.state == GAME_OVER:
+            break
 
     # If all lives are lost, show game over screen
-    if lives == 0:
+    if engine.state == GAME_OVER:
         show_game_over_screen()
-
-    # Draw Objects
-    draw_pipes(pipe_x, bird_y, current_question)  
-    draw_bird(bird_y)
-    draw_question()
-
-    pygame.display.update()
-    pygame.time.delay(30)
+        timestep.reset()  # Time spent on the game over screen isn't owed to the physics
+        renderer.invalidate()  # The game over and start screens drew over everything
+        profiler.start_frame()  # Waiting on the game over screen isn't frame time
+    profiler.lap("physics")
+
+    # Draw Objects between the last two ticks, so motion stays smooth at any frame rate
+    alpha = timestep.alpha
+    sprites = draw_pipes(lerp(physics.prev_pipe_x, physics.pipe_x, alpha))
+    profiler.lap("draw_pipes")
+    sprites.append(draw_bird(lerp(physics.prev_bird_y, physics.bird_y, alpha)))
+    profiler.lap("draw_bird")
+    sprites.append(draw_question())
+    profiler.lap("draw_question")
+    renderer.frame(sprites)
+    profiler.lap("display_update")
 
     # Check for Jump Input
+    if args.bench:
+        scripted_input()
+    jumped = False
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-            velocity = jump_strength  # Make the bird jump
+            jumped = True
+    if replay:
+        jumped = recorded[1]  # Only the recorded input counts
+    if jumped:
+        physics.jump()  # Make the bird jump
+    if recorder:
+        recorder.frame(timestep.last_ms, jumped)
+    profiler.lap("input")
+    profiler.end_frame()
+
+    if args.bench and profiler.frames >= args.bench:
+        running = False
 
 pygame.quit()
+print(f"Frame pacing: {timestep.summary()}")
+print(f"Rendering: {renderer.summary()}")
+
+if recorder:
+    recorder.close()
+    print(f"💾 Recorded {recorder.frames} frames to {args.record} (score {engine.score}, lives {engine.lives})")
+
+if scripted:
+    print(f"Score {engine.score}, lives {engine.lives}")
+    regressions = profiler.report(load_results(args.baseline) if args.baseline else None)
+    if args.json:
+        profiler.save(args.json)
+        print(f"💾 Results saved to {args.json}")
+    if regressions:
+        print(f"⚠️ Slower than the baseline: {', '.join(regressions)}")
+        sys.exit(1)
@@ -0,0 +1 @@
+"""Shared pygame helpers for the flappy challenge mode (both copies of flappy.py)."""
@@ -0,0 +1,101 @@
+"""Images loaded once, converted to the display's pixel format, and animation frames packed into atlases."""
+
+import glob
+import os
+import re
+
+import pygame
+
+
+class Assets:
+    """Loads images relative to the game's folder instead of the working directory.
+
+    Everything comes back converted with convert_alpha(), so blits don't
+    convert pixel formats every frame, and is cached per (name, size).
+    Needs pygame.display.set_mode() to have been called first.
+    """
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self._images = {}   # (name, size) -> surface
+        self._frames = {}   # (pattern, size) -> list of atlas subsurfaces
+        self._raw = {}      # name -> decoded but not yet converted, from preload()
+        self.loads = 0
+
+    def path(self, name):
+        return os.path.join(self.base_dir, name)
+
+    def image(self, name, size=None):
+        """One image, optionally scaled to size (width, height)."""
+        key = (name, size)
+        surface = self._images.get(key)
+        if surface is None:
+            if size is None:
+                surface = self._load(name).convert_alpha()
+            else:
+                surface = pygame.transform.scale(self.image(name), size).convert_alpha()
+            self._images[key] = surface
+        return surface
+
+    def preload(self, pattern):
+        """Reads and decodes the matching files (safe on a worker thread); returns how many.
+
+        Converting needs the display, so that still happens on first use.
+        """
+        names = self._names(pattern)
+        for name in names:
+            self._raw[name] = pygame.image.load(self.path(name))
+            self.loads += 1
+        return len(names)
+
+    def frames(self, pattern, size=None):
+        """Animation frames matching a glob like "skeleton-animation_*.png", in number order.
+
+        The frames (scaled to size) are packed side by side into one atlas
+        surface, and come back as subsurfaces of it.
+        """
+        key = (pattern, size)
+        frames = self._frames.get(key)
+        if frames is not None:
+            return frames
+
+        names = self._names(pattern)
+        # Scaled straight from the file; neither the original nor the scaled copy stays cached
+        images = []
+        for name in names:
+            image = self._load(name)
+            if size is not None:
+                image = pygame.transform.scale(image, size)
+            images.append(image.convert_alpha())
+
+        width = sum(image.get_width() for image in images)
+        height = max(image.get_height() for image in images)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        frames = []
+        x = 0
+        for image in images:
+            atlas.blit(image, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)  # Copy, don't blend onto the empty atlas
+            frames.append(atlas.subsurface((x, 0, image.get_width(), image.get_height())))
+            x += image.get_width()
+        self._frames[key] = frames
+        return frames
+
+    def _load(self, name):
+        """The decoded file, from preload() if it ran, else read now."""
+        raw = self._raw.pop(name, None)
+        if raw is None:
+            raw = pygame.image.load(self.path(name))
+            self.loads += 1
+        return raw
+
+    def _names(self, pattern):
+        names = sorted((os.path.basename(p) for p in glob.glob(self.path(pattern))), key=_frame_number)
+        if not names:
+            raise FileNotFoundError(f"No images match {self.path(pattern)}")
+        return names
+
+
+def _frame_number(name):
+    """skeleton-animation_10.png sorts after skeleton-animation_9.png."""
+    numbers = re.findall(r"\d+", name)
+    return (int(numbers[-1]) if numbers else -1, name)
@@ -0,0 +1,89 @@
+"""Dirty-rectangle rendering over a pre-rendered background."""
+
+import pygame
+
+
+class LayeredRenderer:
+    """Draws a static background plus a few sprites, pushing only what changed.
+
+    Each frame gets the full sprite list in z-order as (name, surface, pos).
+    A sprite that moved or got a new surface is redrawn together with
+    anything it overlaps. Only the union of old and new rectangles is
+    restored from the background and sent to display.update(rects).
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.area = screen.get_width() * screen.get_height()
+        self.background = None
+        self._drawn = {}  # name -> (rect, surface) as of the last frame
+        self._full = True
+        self.frames = 0
+        self.pixels = 0
+        self.full_frames = 0
+
+    def set_background(self, surface):
+        if surface is not self.background:
+            self.background = surface
+            self._full = True
+
+    def invalidate(self):
+        """Redraws and pushes the whole screen next frame (e.g. after a menu drew over it)."""
+        self._full = True
+
+    def frame(self, sprites):
+        screen = self.screen
+        current = {name: (surface.get_rect(topleft=pos), surface) for name, surface, pos in sprites}
+        self.frames += 1
+
+        if self._full:
+            screen.blit(self.background, (0, 0))
+            for name, surface, pos in sprites:
+                screen.blit(surface, pos)
+            pygame.display.update()
+            self._drawn = current
+            self._full = False
+            self.full_frames += 1
+            self.pixels += self.area
+            return
+
+        dirty = []
+        redraw = set()
+        for name, (rect, surface) in current.items():
+            old = self._drawn.get(name)
+            if old is None or old[0] != rect or old[1] is not surface:
+                redraw.add(name)
+                dirty.append(rect)
+                if old is not None:
+                    dirty.append(old[0])
+        for name, (rect, _) in self._drawn.items():
+            if name not in current:
+                dirty.append(rect)  # Sprite went away; uncover what was under it
+
+        # Anything overlapping a dirty area is redrawn whole, so nothing is blended twice
+        grew = True
+        while grew:
+            grew = False
+            for name, (rect, _) in current.items():
+                if name not in redraw and rect.collidelist(dirty) != -1:
+                    redraw.add(name)
+                    dirty.append(rect)
+                    grew = True
+
+        for rect in dirty:
+            screen.blit(self.background, rect, rect)
+        for name, surface, pos in sprites:
+            if name in redraw:
+                screen.blit(surface, pos)
+        bounds = screen.get_rect()
+        pushed = [rect.clip(bounds) for rect in dirty]
+        if pushed:
+            pygame.display.update(pushed)
+        self._drawn = current
+        self.pixels += sum(rect.w * rect.h for rect in pushed)
+
+    def summary(self):
+        if not self.frames:
+            return "no frames"
+        share = self.pixels / (self.frames * self.area)
+        return f"{self.frames} frames, {100 * share:.1f}% of the screen pushed per frame, {self.full_frames} full redraws"
@@ -0,0 +1,142 @@
+"""Pooled obstacles (pipe columns, pickups) with a sorted broad phase for collisions."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+PIPE = 0
+PICKUP = 1
+
+
+class ObstaclePool:
+    """A fixed number of obstacle slots, reused instead of allocated per spawn.
+
+    Obstacles live in parallel arrays indexed by slot. Everything scrolls
+    left at the same speed, so positions are kept in world coordinates and
+    scroll(dx) only moves the camera: O(1) however many are on screen.
+    Active slots are kept sorted by left edge in a preallocated window
+    [_head, _tail) of two more arrays, so overlapping() bisects to the few
+    that can touch a rectangle instead of testing every one. Obstacles
+    spawn at the right edge and leave on the left, so the window usually
+    just grows at the tail and shrinks at the head.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.left = array("d", bytes(8 * capacity))    # World x of the left edge
+        self.top = array("d", bytes(8 * capacity))
+        self.width = array("d", bytes(8 * capacity))
+        self.height = array("d", bytes(8 * capacity))
+        self.kind = array("B", bytes(capacity))
+        self.tag = array("i", bytes(4 * capacity))     # Game data, e.g. which question a pipe asks
+        self.gone = array("i", bytes(4 * capacity))    # Slots the last scroll() freed, in its first entries
+        self._free = list(range(capacity - 1, -1, -1))
+        self._order = array("i", bytes(4 * capacity))  # Active slots sorted by left edge, in [_head, _tail)
+        self._lefts = array("d", bytes(8 * capacity))  # Their left edges, for bisect
+        self._head = 0
+        self._tail = 0
+        self._widest = 0.0  # Upper bound on active widths; only shrinks when the pool empties
+        self.offset = 0.0   # World x at the left of the screen
+        self.dropped = 0    # Spawns refused because every slot was in use
+
+    def __len__(self):
+        return self._tail - self._head
+
+    def spawn(self, x, y, width, height, kind=PIPE, tag=0):
+        """Places an obstacle at screen position (x, y); returns its slot, or None if the pool is full."""
+        if not self._free:
+            self.dropped += 1
+            return None
+        slot = self._free.pop()
+        left = x + self.offset
+        self.left[slot] = left
+        self.top[slot] = y
+        self.width[slot] = width
+        self.height[slot] = height
+        self.kind[slot] = kind
+        self.tag[slot] = tag
+        if width > self._widest:
+            self._widest = width
+
+        if self._tail == self.capacity:
+            self._compact()  # Room is left at the head: a free slot means fewer than capacity are active
+        lefts, order, tail = self._lefts, self._order, self._tail
+        at = bisect_right(lefts, left, self._head, tail)
+        if at < tail:  # Not at the right edge: shift the later ones up by one
+            lefts[at + 1:tail + 1] = lefts[at:tail]
+            order[at + 1:tail + 1] = order[at:tail]
+        lefts[at] = left
+        order[at] = slot
+        self._tail = tail + 1
+        return slot
+
+    def release(self, slot):
+        lefts, order, head, tail = self._lefts, self._order, self._head, self._tail
+        at = bisect_left(lefts, self.left[slot], head, tail)
+        while order[at] != slot:
+            at += 1  # Past others with the same left edge
+        if at == head:
+            self._head = head + 1  # The leftmost one, the usual case
+        else:
+            lefts[at:tail - 1] = lefts[at + 1:tail]
+            order[at:tail - 1] = order[at + 1:tail]
+            self._tail = tail - 1
+        if self._head == self._tail:
+            self._head = self._tail = 0
+            self._widest = 0.0
+        self._free.append(slot)
+
+    def scroll(self, dx):
+        """Moves every obstacle dx to the left and frees the ones that left the screen.
+
+        Returns how many were freed; their slots are the first entries of `gone`.
+        """
+        self.offset += dx
+        offset, lefts, widths, gone = self.offset, self.left, self.width, self.gone
+        # Only obstacles starting left of the screen edge can be fully off it
+        end = bisect_left(self._lefts, offset, self._head, self._tail)
+        count = 0
+        for slot in self._order[self._head:end]:
+            if lefts[slot] + widths[slot] < offset:
+                gone[count] = slot
+                count += 1
+        for i in range(count):
+            self.release(gone[i])
+        return count
+
+    def x(self, slot):
+        """Screen x of an obstacle's left edge."""
+        return self.left[slot] - self.offset
+
+    def active(self):
+        """Active slots, left to right."""
+        return self._order[self._head:self._tail].tolist()
+
+    def overlapping(self, x, y, width, height):
+        """Slots whose rectangle overlaps the screen rectangle (x, y, width, height)."""
+        left = x + self.offset
+        right = left + width
+        # Sorted by left edge: anything starting past `right` can't overlap, nor can
+        # anything starting more than the widest obstacle before `left`
+        lo = bisect_left(self._lefts, left - self._widest, self._head, self._tail)
+        hi = bisect_left(self._lefts, right, lo, self._tail)
+        lefts, widths, tops, heights = self.left, self.width, self.top, self.height
+        bottom = y + height
+        hits = []
+        for slot in self._order[lo:hi]:
+            if lefts[slot] + widths[slot] > left and tops[slot] < bottom and tops[slot] + heights[slot] > y:
+                hits.append(slot)
+        return hits
+
+    def clear(self):
+        self._free = list(range(self.capacity - 1, -1, -1))
+        self._head = self._tail = 0
+        self._widest = 0.0
+        self.offset = 0.0
+
+    def _compact(self):
+        """Moves the active window back to the start of the arrays."""
+        head, tail = self._head, self._tail
+        count = tail - head
+        self._lefts[:count] = self._lefts[head:tail]
+        self._order[:count] = self._order[head:tail]
+        self._head, self._tail = 0, count
@@ -0,0 +1,104 @@
+"""
+Flappy's rules without pygame: bird and pipe movement, collisions and scoring.
+
+flappy.py runs these once per fixed physics tick and draws the result; the
+headless simulator (flappy_core.sim) runs the very same code, so a
+parameter sweep tunes the game that actually ships.
+"""
+
+from trivia_core.engine import LABELS
+
+
+class FlappyPhysics:
+    """The bird, the pipe column and the answer gaps; scoring goes through a TriviaEngine."""
+
+    def __init__(self, engine, gravity=0.5, jump_strength=-6, moving_rate=10,
+                 gap_positions=(150, 250, 350, 450), gap_size=50, pipe_width=40,
+                 bird_x=200, bird_radius=10, width=1200, height=620):
+        self.engine = engine
+        self.gravity = gravity
+        self.jump_strength = jump_strength
+        self.moving_rate = moving_rate
+        self.gap_positions = tuple(gap_positions)
+        self.gap_size = gap_size
+        self.pipe_width = pipe_width
+        self.bird_x = bird_x
+        self.bird_radius = bird_radius
+        self.width = width
+        self.height = height
+        self.reset()
+
+    def reset(self):
+        """Bird back at the start and a fresh pipe on the right edge."""
+        self.bird_y = 200
+        self.velocity = 0
+        self.pipe_x = self.width
+        self.passed_pipe = False
+        self.missed_pipe = False  # Ensure lives are reduced only once per pipe
+        self.prev_bird_y, self.prev_pipe_x = self.bird_y, self.pipe_x
+
+    def jump(self):
+        self.velocity = self.jump_strength
+
+    @property
+    def target_y(self):
+        """Middle of the correct answer's gap."""
+        return self.gap_positions[LABELS.index(self.engine.question[2])] + self.gap_size / 2
+
+    def step(self):
+        """One physics tick: gravity, pipe movement, collisions and scoring.
+
+        Returns True if the bird lost a life or answered wrong this tick.
+        """
+        engine = self.engine
+        self.prev_bird_y, self.prev_pipe_x = self.bird_y, self.pipe_x  # Drawn positions blend from here
+        hit = False
+
+        # Gravity and Bird Movement
+        self.velocity += self.gravity
+        self.bird_y += self.velocity
+
+        # Move Pipes
+        self.pipe_x -= self.moving_rate
+        if self.pipe_x < -self.pipe_width:
+            self.pipe_x = self.prev_pipe_x = self.width  # Straight back to the right edge, no blending across
+            engine.next_question()  # Change to a new question
+            self.passed_pipe = False
+            self.missed_pipe = False
+
+        # Collision Detection (Hitting top/bottom)
+        if self.bird_y <= 0 or self.bird_y >= self.height - self.bird_radius:
+            if engine.lives > 0:  # Reduce lives only if lives remain
+                engine.lose_life()
+                hit = True
+                self.bird_y = self.prev_bird_y = self.height // 2  # Reset bird position instead of ending the game
+                self.velocity = 0
+
+        return self.check_pipe() or hit
+
+    def check_pipe(self):
+        """Checks if the bird flies through the correct answer's gap; returns True on a miss."""
+        engine = self.engine
+        if not (self.pipe_x < self.bird_x < self.pipe_x + self.pipe_width):
+            return False
+        correct_label = engine.question[2]
+        gap_top = self.gap_positions[LABELS.index(correct_label)]
+        if not (gap_top <= self.bird_y <= gap_top + self.gap_size):
+            if not self.missed_pipe:  # Reduce life only if it's the first time missing this pipe
+                if self.passed_pipe:
+                    engine.lose_life()  # Went through the right gap, then clipped the pipe
+                else:
+                    engine.answer(self.gap_label())  # Wrong gap (or the pipe itself)
+                self.missed_pipe = True
+                return True
+        elif not self.passed_pipe and not self.missed_pipe:  # Only score if this pipe wasn't already answered
+            engine.answer(correct_label)
+            self.passed_pipe = True
+        return False
+
+    def gap_label(self):
+        """The answer label of the gap the bird is in, or None if it's in the pipe."""
+        for label, gap_top in zip(LABELS, self.gap_positions):
+            if gap_top <= self.bird_y <= gap_top + self.gap_size:
+                return label
+        return None
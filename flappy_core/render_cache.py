@@ -0,0 +1,52 @@
+"""Caches for things the flappy frame used to rebuild every frame: fonts, text and overlays."""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class RenderCache:
+    """Fonts loaded once, an LRU of rendered text, and surfaces rebuilt only when their key changes."""
+
+    def __init__(self, max_text=256):
+        self.max_text = max_text
+        self._fonts = {}
+        self._text = OrderedDict()
+        self._surfaces = {}  # name -> (key, surface)
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, name=None):
+        font = self._fonts.get((name, size))
+        if font is None:
+            font = self._fonts[(name, size)] = pygame.font.Font(name, size)
+        return font
+
+    def text(self, string, color, size=20, name=None):
+        """Rendered antialiased text; the same surface comes back until it falls out of the LRU."""
+        key = (string, color, size, name)
+        surface = self._text.get(key)
+        if surface is not None:
+            self._text.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self._text[key] = self.font(size, name).render(string, True, color)
+        if len(self._text) > self.max_text:
+            self._text.popitem(last=False)
+        return surface
+
+    def surface(self, name, key, build):
+        """build() once per distinct key (e.g. the current question), then the cached result."""
+        cached = self._surfaces.get(name)
+        if cached is not None and cached[0] == key:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        surface = build()
+        self._surfaces[name] = (key, surface)
+        return surface
+
+    def clear(self):
+        self._text.clear()
+        self._surfaces.clear()
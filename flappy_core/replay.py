@@ -0,0 +1,97 @@
+"""
+Recording and replaying flappy sessions.
+
+A recording holds everything that isn't decided by the code itself: the
+random seed, how long each rendered frame took, whether the player jumped
+in it, and which question the deck dealt each time. Replaying feeds those
+back into the same game loop, so the session plays out exactly as it did.
+
+File layout: a header (magic, version, target FPS, seed), then 3-byte
+records (kind, value): a frame with its length in ms, a frame with a jump,
+or a dealt question index.
+"""
+
+import struct
+
+MAGIC = b"SWFR"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBxHI")   # magic, version, target FPS, random seed
+RECORD = struct.Struct("<BH")       # kind, value
+
+FRAME = 0      # value: frame length in ms
+JUMP = 1       # A frame in which the player jumped
+QUESTION = 2   # value: question index the deck dealt
+
+FLUSH_BYTES = 4096
+
+
+class InputRecorder:
+    def __init__(self, path, seed, target_fps):
+        self.path = path
+        self.seed = seed
+        self.frames = 0
+        self._file = open(path, "wb")
+        self._buffer = bytearray(HEADER.pack(MAGIC, VERSION, target_fps, seed))
+
+    def frame(self, frame_ms, jumped):
+        self._append(JUMP if jumped else FRAME, frame_ms)
+        self.frames += 1
+
+    def question(self, index):
+        self._append(QUESTION, index)
+
+    def _append(self, kind, value):
+        self._buffer += RECORD.pack(kind, min(int(value), 0xFFFF))
+        if len(self._buffer) >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class InputReplay:
+    """Reads a recording back as two streams: frames (ms, jumped) and dealt questions."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a flappy recording")
+        magic, version, self.target_fps, self.seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a flappy recording")
+
+        self.frames = []
+        self.questions = []
+        end = len(data) - (len(data) - HEADER.size) % RECORD.size  # A cut-off last record is ignored
+        for kind, value in RECORD.iter_unpack(data[HEADER.size:end]):
+            if kind == QUESTION:
+                self.questions.append(value)
+            else:
+                self.frames.append((value, kind == JUMP))
+        self._frame = 0
+        self._question = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def next_frame(self):
+        """Returns (frame ms, jumped) for the next frame, or None when the recording ends."""
+        if self._frame >= len(self.frames):
+            return None
+        self._frame += 1
+        return self.frames[self._frame - 1]
+
+    def next_question(self):
+        if self._question >= len(self.questions):
+            raise ValueError("Recording ran out of questions; was it made with a different question list?")
+        self._question += 1
+        return self.questions[self._question - 1]
@@ -0,0 +1,182 @@
+"""
+Headless flappy simulator for balance tuning.
+
+Plays the flappy rules (flappy_core.physics, the same code flappy.py runs,
+one physics tick at a time, no pygame) with a bot policy, across a process
+pool, and reports survival time and score distributions for each parameter
+set:
+
+    python3 -m flappy_core.sim --games 5000 --policy human
+    python3 -m flappy_core.sim --set gravity=0.4,0.5,0.6 --set jump_strength=-5,-6,-7
+    python3 -m flappy_core.sim --set gap_positions=150/250/350/450,120/240/360/480
+"""
+
+import argparse
+import itertools
+import os
+import random
+import time
+from multiprocessing import Pool
+
+from flappy_core.physics import FlappyPhysics
+from trivia_core.engine import GAME_OVER, LABELS, TriviaEngine
+from trivia_core.simulator import FakeClock
+
+SIM_HZ = 30  # Physics ticks per second, as in flappy_core.timestep (not imported: it needs pygame)
+
+# flappy.py's values (FlappyPhysics' parameters, plus the engine's lives)
+DEFAULTS = {
+    "gravity": 0.5,
+    "jump_strength": -6,
+    "moving_rate": 10,
+    "gap_positions": (150, 250, 350, 450),
+    "gap_size": 50,
+    "pipe_width": 40,
+    "bird_x": 200,
+    "bird_radius": 10,
+    "width": 1200,
+    "height": 620,
+    "lives": 3,
+}
+
+# Stand-in questions with their answers spread over all four gaps, so a bot has to aim at each
+QUESTIONS = [{"question": f"Q{i}", "options": ["1", "2", "3", "4"], "correct": LABELS[i % 4]} for i in range(40)]
+
+
+class FlappyGame(FlappyPhysics):
+    """One game of flappy; step(jump) runs one physics tick."""
+
+    def __init__(self, params, rng):
+        self.rng = rng
+        self.clock = FakeClock()
+        engine = TriviaEngine(QUESTIONS, clock=self.clock, rng=rng, round_seconds=None,
+                              feedback_seconds=None, lives=params["lives"])
+        engine.start()
+        super().__init__(engine, **{name: value for name, value in params.items() if name != "lives"})
+        self.ticks = 0
+
+    @property
+    def over(self):
+        return self.engine.state == GAME_OVER
+
+    def step(self, jump):
+        if jump:
+            self.jump()
+        self.ticks += 1
+        self.clock.now = self.ticks / SIM_HZ
+        return super().step()
+
+
+# Bot policies: policy(game) -> True to jump this tick
+
+def greedy(game):
+    """Flaps whenever it falls below the middle of the correct gap."""
+    return game.bird_y > game.target_y and game.velocity >= 0
+
+
+def human(game):
+    """Greedy, but misses some ticks and only aims roughly at the middle."""
+    if game.rng.random() < 0.3:
+        return False
+    return game.bird_y > game.target_y + game.rng.uniform(-15, 15) and game.velocity >= 0
+
+
+def flapper(game):
+    """Flaps at random, ignoring the question."""
+    return game.rng.random() < 0.15
+
+
+POLICIES = {"greedy": greedy, "human": human, "random": flapper}
+
+
+def play_game(params, policy, seed, max_seconds=120):
+    """Plays one game; returns (seconds survived, score)."""
+    game = FlappyGame(params, random.Random(seed))
+    max_ticks = int(max_seconds * SIM_HZ)
+    while not game.over and game.ticks < max_ticks:
+        game.step(policy(game))
+    return game.ticks / SIM_HZ, game.engine.score
+
+
+def _run_batch(job):
+    set_index, params, policy_name, first_seed, count, max_seconds = job
+    policy = POLICIES[policy_name]
+    results = [play_game(params, policy, seed, max_seconds) for seed in range(first_seed, first_seed + count)]
+    return set_index, results
+
+
+def parse_sets(settings):
+    """Turns ["gravity=0.4,0.5", "jump_strength=-6"] into every combination of parameters."""
+    choices = []
+    for setting in settings:
+        name, _, values = setting.partition("=")
+        if name not in DEFAULTS:
+            raise SystemExit(f"Unknown parameter {name!r}; choose from {', '.join(DEFAULTS)}")
+        parsed = []
+        for value in values.split(","):
+            if "/" in value:
+                parsed.append(tuple(int(v) for v in value.split("/")))
+            else:
+                number = float(value)
+                parsed.append(int(number) if number.is_integer() else number)
+        choices.append([(name, v) for v in parsed])
+
+    sets = []
+    for combo in itertools.product(*choices):
+        params = dict(DEFAULTS)
+        params.update(combo)
+        sets.append((dict(combo), params))
+    return sets
+
+
+def percentile(ordered, p):
+    return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2000, help="games per parameter set")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="human")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=V1,V2",
+                        help="parameter values to sweep (gap_positions as 150/250/350/450); repeat for a grid")
+    parser.add_argument("--max-seconds", type=float, default=120, help="stop a game that survives this long")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch", type=int, default=100, help="games per pool task")
+    args = parser.parse_args()
+
+    sets = parse_sets(args.set)
+    jobs = []
+    for set_index, (_, params) in enumerate(sets):
+        for first in range(0, args.games, args.batch):
+            count = min(args.batch, args.games - first)
+            jobs.append((set_index, params, args.policy, first, count, args.max_seconds))
+
+    start = time.perf_counter()
+    results = [[] for _ in sets]
+    with Pool(args.workers) as pool:
+        for set_index, batch in pool.imap_unordered(_run_batch, jobs):
+            results[set_index].extend(batch)
+    elapsed = time.perf_counter() - start
+
+    total = len(sets) * args.games
+    print(f"games:      {total} ({len(sets)} parameter sets, {args.policy} bot) on {args.workers} workers in {elapsed:.2f}s")
+    print(f"throughput: {total / elapsed:,.0f} games/s")
+    for (changed, _), games in zip(sets, results):
+        survival = sorted(s for s, _ in games)
+        scores = sorted(score for _, score in games)
+        capped = sum(1 for s in survival if s >= args.max_seconds)
+        label = ", ".join(f"{k}={v}" for k, v in changed.items()) or "defaults"
+        print(f"\n{label}")
+        print(f"  survival s:  mean {sum(survival) / len(survival):6.1f}  p10 {percentile(survival, 10):6.1f}  "
+              f"p50 {percentile(survival, 50):6.1f}  p90 {percentile(survival, 90):6.1f}  "
+              f"({100.0 * capped / len(survival):.1f}% hit {args.max_seconds:g}s)")
+        print(f"  score:       mean {sum(scores) / len(scores):6.1f}  p10 {percentile(scores, 10):6d}  "
+              f"p50 {percentile(scores, 50):6d}  p90 {percentile(scores, 90):6d}")
+        counts = {}
+        for score in scores:
+            counts[score] = counts.get(score, 0) + 1
+        print("  scores:      " + "  ".join(f"{s}: {100.0 * n / len(scores):.0f}%" for s, n in sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Fixed-timestep pacing: physics at a constant rate whatever the render rate."""
+
+import pygame
+
+SIM_HZ = 30       # Physics ticks per second; the game's gravity/jump/speed values are per tick
+MAX_STEPS = 5     # Most ticks run per rendered frame before the game slows down instead
+
+
+class FixedTimestep:
+    """Turns rendered frames into whole physics ticks plus an interpolation fraction.
+
+    Each frame: steps = timestep.advance(), run that many physics ticks,
+    then draw with timestep.alpha between the previous and current tick.
+    """
+
+    def __init__(self, target_fps=60, sim_hz=SIM_HZ, max_steps=MAX_STEPS, frame_seconds=None):
+        self.target_fps = target_fps
+        self.frame_seconds = frame_seconds  # Benchmarks: pretend every frame took exactly this long
+        self.dt = 1.0 / sim_hz
+        self.max_steps = max_steps
+        self.clock = pygame.time.Clock()
+        self.accumulator = 0.0
+        self.frames = 0
+        self.steps = 0
+        self.missed_frames = 0   # Frames that took over 1.5x the frame budget
+        self.dropped_steps = 0   # Ticks skipped because rendering fell too far behind
+        self.worst_ms = 0
+        self.last_ms = 0
+        self.total_ms = 0
+
+    def reset(self):
+        """Forgets time spent outside the loop (start and game over screens)."""
+        self.clock.tick()
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms=None):
+        """Waits for the next frame slot and returns how many physics ticks are due.
+
+        A replay passes the recorded frame length as frame_ms; it is waited
+        out unless frame_seconds is set (run as fast as possible).
+        """
+        if frame_ms is not None:
+            if self.frame_seconds is None:
+                self.clock.tick(1000.0 / max(frame_ms, 1))  # Hold the frame as long as it took originally
+            else:
+                self.clock.tick()
+        elif self.frame_seconds is None:
+            frame_ms = self.clock.tick(self.target_fps)
+        else:
+            self.clock.tick()  # No waiting, and the same ticks every run
+            frame_ms = self.frame_seconds * 1000
+        self.last_ms = frame_ms
+        self.frames += 1
+        self.total_ms += frame_ms
+        self.worst_ms = max(self.worst_ms, frame_ms)
+        if self.target_fps and frame_ms > 1500 / self.target_fps:
+            self.missed_frames += 1
+
+        self.accumulator += frame_ms / 1000.0 + 1e-9  # Keeps 60 FPS / 30 Hz from drifting on float error
+        steps = 0
+        while self.accumulator >= self.dt and steps < self.max_steps:
+            self.accumulator -= self.dt
+            steps += 1
+        if self.accumulator >= self.dt:  # Can't catch up; drop the backlog rather than spiral
+            self.dropped_steps += int(self.accumulator / self.dt)
+            self.accumulator %= self.dt
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """How far the frame is between the previous tick (0) and the current one (1)."""
+        return self.accumulator / self.dt
+
+    def summary(self):
+        if not self.frames:
+            return "no frames"
+        fps = 1000.0 * self.frames / max(self.total_ms, 1)
+        return (f"{self.frames} frames at {fps:.1f} FPS (target {self.target_fps}), "
+                f"{self.missed_frames} missed ({100.0 * self.missed_frames / self.frames:.1f}%), "
+                f"worst {self.worst_ms:.1f} ms, {self.dropped_steps} physics ticks dropped")
+
+
+def lerp(previous, current, alpha):
+    return previous + (current - previous) * alpha
@@ -0,0 +1,104 @@
+"""
+Interrupt-driven, debounced answer buttons for the Pico.
+
+Each button's falling edge fires a pin IRQ that records (button, ticks_ms)
+into a small preallocated ring. The IRQ only ever moves the head and the
+game loop only ever moves the tail, so no lock is needed and nothing is
+allocated inside the interrupt. Copy this file to the Pico next to
+s_mode_interface_pico.py.
+"""
+
+from machine import Pin
+
+try:
+    from time import ticks_diff, ticks_ms
+except ImportError:  # CPython, for running the game off the board
+    import time
+
+    def ticks_ms():
+        return int(time.monotonic() * 1000) & 0x3FFFFFFF
+
+    def ticks_diff(a, b):
+        return ((a - b + 0x20000000) & 0x3FFFFFFF) - 0x20000000
+
+DEBOUNCE_MS = 30  # Contact bounce on the arcade buttons settles well within this
+QUEUE_SIZE = 8    # Must be a power of two
+
+
+class Buttons:
+    """Queues debounced presses from active-low buttons."""
+
+    def __init__(self, pins, debounce_ms=DEBOUNCE_MS):
+        # pins: sequence of (label, GPIO number), e.g. (("A", 10), ("B", 11))
+        self.labels = [label for label, _ in pins]
+        self.pins = [Pin(number, Pin.IN, Pin.PULL_UP) for _, number in pins]
+        self.debounce_ms = debounce_ms
+        self._last = [ticks_ms() - debounce_ms] * len(self.pins)
+        self._which = bytearray(QUEUE_SIZE)
+        self._when = [0] * QUEUE_SIZE
+        self._head = 0  # Written only by the IRQ
+        self._tail = 0  # Written only by get()/clear()
+        self.overflows = 0
+        self.flag = None  # Optional uasyncio.ThreadSafeFlag, set on every press
+        for i, pin in enumerate(self.pins):
+            pin.irq(trigger=Pin.IRQ_FALLING, handler=self._handler(i))
+
+    def _handler(self, i):
+        def on_edge(pin):
+            self._on_press(i)
+        return on_edge
+
+    def _on_press(self, i):
+        now = ticks_ms()
+        if ticks_diff(now, self._last[i]) < self.debounce_ms or self.pins[i].value():
+            return  # Bounce, or a glitch that's already released
+        self._last[i] = now
+        head = self._head
+        if ((head + 1) & (QUEUE_SIZE - 1)) == self._tail:
+            self.overflows += 1  # Game loop isn't keeping up; drop the newest press
+            return
+        self._which[head] = i
+        self._when[head] = now
+        self._head = (head + 1) & (QUEUE_SIZE - 1)
+        if self.flag is not None:
+            self.flag.set()  # Wakes a task waiting for input; safe to call from an IRQ
+
+    def get(self):
+        """Oldest press as (label, ticks_ms when pressed), or None."""
+        tail = self._tail
+        if tail == self._head:
+            return None
+        press = (self.labels[self._which[tail]], self._when[tail])
+        self._tail = (tail + 1) & (QUEUE_SIZE - 1)
+        return press
+
+    def clear(self):
+        """Drops presses made while the game wasn't listening (e.g. during feedback)."""
+        self._tail = self._head
+
+    def any_held(self):
+        return any(pin.value() == 0 for pin in self.pins)
+
+
+class LatencyStats:
+    """Press-to-feedback latency in ms, small enough to keep for a whole day."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total = 0
+        self.worst = 0
+
+    def add(self, pressed_at, now=None):
+        ms = ticks_diff(ticks_ms() if now is None else now, pressed_at)
+        self.count += 1
+        self.total += ms
+        self.worst = max(self.worst, ms)
+        return ms
+
+    def summary(self):
+        if not self.count:
+            return "no presses"
+        return f"{self.count} presses, avg {self.total // self.count} ms, worst {self.worst} ms"
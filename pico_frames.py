@@ -0,0 +1,97 @@
+"""
+Precomputed 16x2 question frames for the Pico.
+
+standard_code/build_pico_frames.py turns the question bank into a frames
+file; FrameFile reads one question at a time from it, so the Pico can serve
+the whole bank without ever holding it in RAM. Copy the frames file to the
+Pico as questions.frames, next to this file and the game.
+
+File layout (little-endian):
+    header   "SWPF", version, cols, rows, pad, question count (u32)
+    index    count + 1 u32 offsets, one per question plus the end of file
+    record   correct option (0-3), question pages, option pages, then
+             (question pages + option pages) frames of rows*cols bytes
+"""
+
+import struct
+
+MAGIC = b"SWPF"
+VERSION = 1
+HEADER = "<4sBBBxI"
+HEADER_SIZE = struct.calcsize(HEADER)
+LABELS = "ABCD"
+
+
+def wrap_pages(text, cols=16, rows=2):
+    """Word-wraps text into pages of rows lines joined by "\\n"."""
+    lines, line = [], ""
+    for word in text.split():
+        while len(word) > cols:  # Words longer than a row get split
+            if line:
+                lines.append(line)
+                line = ""
+            lines.append(word[:cols])
+            word = word[cols:]
+        if line and len(line) + 1 + len(word) > cols:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line or not lines:
+        lines.append(line)
+    return ["\n".join(lines[i:i + rows]) for i in range(0, len(lines), rows)]
+
+
+def option_pages(options, cols=16, rows=2):
+    """All four options on one screen when they fit, then one per row, then pages per option."""
+    a, b, c, d = (options[label] for label in LABELS)
+    first, second = f"A.{a} B.{b}", f"C.{c} D.{d}"
+    if rows == 2 and len(first) <= cols and len(second) <= cols:
+        return [f"{first}\n{second}"]
+    lines = [f"{label}. {options[label]}" for label in LABELS]
+    if all(len(line) <= cols for line in lines):
+        return ["\n".join(lines[i:i + rows]) for i in range(0, len(lines), rows)]
+    pages = []
+    for label in LABELS:
+        pages += wrap_pages(f"{label}. {options[label]}", cols, rows)
+    return pages
+
+
+class FrameFile:
+    """Random access to a frames file; looks like a list of engine question tuples.
+
+    frames[i] is (question pages, option pages, correct label), read from
+    flash on demand.
+    """
+
+    def __init__(self, path):
+        self.f = open(path, "rb")
+        magic, version, self.cols, self.rows, self.count = struct.unpack(HEADER, self.f.read(HEADER_SIZE))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a version 1 frames file")
+        self.frame_size = self.cols * self.rows
+        self._offsets = bytearray(8)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        f = self.f
+        f.seek(HEADER_SIZE + 4 * index)
+        f.readinto(self._offsets)
+        start, end = struct.unpack("<II", self._offsets)
+        f.seek(start)
+        record = f.read(end - start)
+        correct, question_count = record[0], record[1]
+        pages = []
+        for i in range(3, len(record), self.frame_size):
+            frame = record[i:i + self.frame_size]
+            pages.append("\n".join(
+                frame[row * self.cols:(row + 1) * self.cols].decode().rstrip() for row in range(self.rows)
+            ).rstrip("\n"))
+        return pages[:question_count], pages[question_count:], LABELS[correct]
+
+    def close(self):
+        self.f.close()
@@ -0,0 +1,120 @@
+"""
+Shadow-framebuffer front end for the 16x2 I2C LCDs (HD44780 behind a PCF8574).
+
+The game draws whole screens with show(); flush() compares them with what
+the display already holds and sends only the changed cells. Cursor moves and
+characters for a frame go out as one I2C write instead of four single-byte
+writes per character, and clear()/home (5 ms each in i2c_lcd) are never
+used after start-up. Copy this file to the Pico with the game.
+"""
+
+try:
+    from time import ticks_diff, ticks_us
+except ImportError:  # CPython
+    import time
+
+    def ticks_us():
+        return int(time.perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+# PCF8574 pin mapping used by i2c_lcd.I2cLcd
+MASK_RS = 0x01
+MASK_E = 0x04
+SHIFT_BACKLIGHT = 3
+SHIFT_DATA = 4
+
+LCD_DDRAM = 0x80
+ROW_OFFSETS = (0x00, 0x40, 0x14, 0x54)
+
+
+class FrameLcd:
+    """A 16x2 I2cLcd that only rewrites the cells that changed."""
+
+    def __init__(self, lcd):
+        self.lcd = lcd
+        self.i2c = lcd.i2c
+        self.addr = lcd.i2c_addr
+        self.rows = lcd.num_lines
+        self.cols = lcd.num_columns
+        size = self.rows * self.cols
+        self.frame = bytearray(b" " * size)    # What the game wants shown
+        self.shadow = bytearray(b" " * size)   # What the display holds
+        self._out = bytearray(size * 8)        # Worst case: a move plus a char per cell
+        self.frames = 0
+        self.bytes_sent = 0
+        self.last_bytes = 0
+        self.last_us = 0
+        lcd.clear()  # The one slow clear, so the shadow starts out true
+
+    def show(self, text):
+        """Replaces the whole screen with text ("\\n" starts the next row, long rows wrap) and flushes."""
+        frame, cols = self.frame, self.cols
+        for i in range(len(frame)):
+            frame[i] = 32
+        pos = 0
+        wrapped = False
+        for ch in text:
+            if ch == "\n":
+                if not wrapped:  # Like LcdApi, a newline right after a wrap doesn't skip a row
+                    pos = (pos // cols + 1) * cols
+                wrapped = False
+                continue
+            if pos >= len(frame):
+                break
+            code = ord(ch)
+            frame[pos] = code if 32 <= code < 127 else 63  # "?" for what the LCD ROM can't show
+            pos += 1
+            wrapped = pos % cols == 0
+        return self.flush()
+
+    def write(self, row, col, text):
+        """Overwrites part of one row, leaving the rest of the screen alone, and flushes."""
+        start = row * self.cols + col
+        for i, ch in enumerate(text[:self.cols - col]):
+            code = ord(ch)
+            self.frame[start + i] = code if 32 <= code < 127 else 63
+        return self.flush()
+
+    def flush(self):
+        """Sends the changed cells in one I2C transaction; returns the bytes sent."""
+        started = ticks_us()
+        frame, shadow, out = self.frame, self.shadow, self._out
+        backlight = self.lcd.backlight << SHIFT_BACKLIGHT
+        n = 0
+        cursor = -1  # Where the display's address counter points, -1 when unknown
+        for pos in range(len(frame)):
+            ch = frame[pos]
+            if ch == shadow[pos]:
+                continue
+            if pos != cursor:
+                row, col = divmod(pos, self.cols)
+                n = _pack(out, n, LCD_DDRAM | (ROW_OFFSETS[row] + col), backlight)
+            n = _pack(out, n, ch, backlight | MASK_RS)
+            shadow[pos] = ch
+            # The address counter runs on past the end of a row rather than into the next one
+            cursor = pos + 1 if (pos + 1) % self.cols else -1
+        if n:
+            self.i2c.writeto(self.addr, memoryview(out)[:n])
+        self.frames += 1
+        self.bytes_sent += n
+        self.last_bytes = n
+        self.last_us = ticks_diff(ticks_us(), started)
+        return n
+
+    def invalidate(self):
+        """Forces a full redraw next flush (e.g. after the display was power cycled)."""
+        for i in range(len(self.shadow)):
+            self.shadow[i] = 0
+
+
+def _pack(out, n, value, bits):
+    """Appends one HD44780 byte as PCF8574 writes: each nibble with E high, then E low."""
+    high = bits | ((value >> 4) << SHIFT_DATA)
+    low = bits | ((value & 0x0F) << SHIFT_DATA)
+    out[n] = high | MASK_E
+    out[n + 1] = high
+    out[n + 2] = low | MASK_E
+    out[n + 3] = low
+    return n + 4
@@ -0,0 +1,38 @@
+"""
+Simulated Pico hardware, so the Pico game runs under CPython.
+
+install() puts stand-ins for machine, lcd_api, i2c_lcd and uasyncio into
+sys.modules. They cover the parts the game uses:
+- an I2C bus that counts bytes and transactions per device and charges
+  their 400 kHz transfer time to the clock
+- virtual HD44780 LCDs that decode the PCF8574 byte stream and record
+  what they show
+- pins whose IRQs fire from scripted button presses
+
+By default time is virtual, so a 10 s round takes milliseconds. To play
+games with a bot or a press script:
+
+    python3 -m pico_sim.run --games 200
+"""
+
+import sys
+
+from pico_sim.sim_clock import SimClock
+
+clock = SimClock()
+
+
+def install(virtual=True):
+    """Registers the stand-in modules; call before importing the Pico game."""
+    clock.virtual = virtual
+    from pico_sim import i2c_lcd, lcd_api, machine, uasyncio
+    sys.modules["machine"] = machine
+    sys.modules["lcd_api"] = lcd_api
+    sys.modules["i2c_lcd"] = i2c_lcd
+    sys.modules["uasyncio"] = uasyncio
+
+    # The Pico-side helpers fall back to CPython's clock; point them at the simulated one
+    import pico_buttons
+    pico_buttons.ticks_ms = clock.ticks_ms
+    pico_buttons.ticks_diff = clock.ticks_diff
+    return clock
@@ -0,0 +1,78 @@
+"""A 16x2 HD44780 behind a PCF8574 backpack, decoded from the I2C byte stream."""
+
+from collections import deque
+
+from pico_sim import clock
+from pico_sim.machine import I2CDevice
+
+MASK_RS = 0x01
+MASK_E = 0x04
+SHIFT_DATA = 4
+
+ROW_OFFSETS = (0x00, 0x40, 0x14, 0x54)
+
+
+class VirtualLcd(I2CDevice):
+    """Latches a nibble on every falling E edge and keeps the display RAM."""
+
+    def __init__(self, rows=2, cols=16, history=1000):
+        super().__init__()
+        self.rows = rows
+        self.cols = cols
+        self.ddram = bytearray(b" " * 0x80)
+        self.address = 0
+        self.four_bit = False
+        self._pending = None  # High nibble waiting for its low half
+        self._last = 0
+        self.instructions = 0
+        self.characters = 0
+        self.clears = 0
+        self.history = deque(maxlen=history)  # (clock time, screen text) whenever it changes
+        self._shown = self.text()
+
+    def write(self, data):
+        for byte in data:
+            if self._last & MASK_E and not byte & MASK_E:
+                self._latch(self._last >> SHIFT_DATA, self._last & MASK_RS)
+            self._last = byte
+        text = self.text()
+        if text != self._shown:
+            self._shown = text
+            self.history.append((clock.time(), text))
+
+    def _latch(self, nibble, rs):
+        if not self.four_bit:
+            # 8-bit mode during init: each nibble is a whole instruction's high half
+            if not rs and nibble == 0x2:
+                self.four_bit = True
+            return
+        if self._pending is None:
+            self._pending = nibble
+            return
+        value = (self._pending << 4) | nibble
+        self._pending = None
+        if rs:
+            self.ddram[self.address & 0x7F] = value
+            self.address = (self.address + 1) & 0x7F
+            self.characters += 1
+        else:
+            self._command(value)
+
+    def _command(self, value):
+        self.instructions += 1
+        if value == 0x01:
+            self.ddram[:] = b" " * 0x80
+            self.address = 0
+            self.clears += 1
+        elif value in (0x02, 0x03):
+            self.address = 0
+        elif value & 0x80:
+            self.address = value & 0x7F
+
+    def lines(self):
+        return [self.ddram[ROW_OFFSETS[row]:ROW_OFFSETS[row] + self.cols].decode("ascii", "replace")
+                for row in range(self.rows)]
+
+    def text(self):
+        """What's on screen, rows joined by newlines with trailing spaces removed."""
+        return "\n".join(line.rstrip() for line in self.lines()).rstrip("\n")
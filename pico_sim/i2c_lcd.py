@@ -0,0 +1,60 @@
+"""Stand-in for i2c_lcd.I2cLcd: same PCF8574 byte sequences and waits as the real driver."""
+
+from pico_sim import clock
+from pico_sim.lcd_api import LcdApi
+
+MASK_RS = 0x01
+MASK_RW = 0x02
+MASK_E = 0x04
+SHIFT_BACKLIGHT = 3
+SHIFT_DATA = 4
+
+
+class I2cLcd(LcdApi):
+    def __init__(self, i2c, i2c_addr, num_lines, num_columns):
+        self.i2c = i2c
+        self.i2c_addr = i2c_addr
+        self.i2c.writeto(self.i2c_addr, bytearray([0]))
+        clock.sleep_ms(20)  # Allow LCD time to power up
+        # Send reset 3 times
+        self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
+        clock.sleep_ms(5)
+        self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
+        clock.sleep_ms(1)
+        self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
+        clock.sleep_ms(1)
+        # Put LCD into 4-bit mode
+        self.hal_write_init_nibble(self.LCD_FUNCTION)
+        clock.sleep_ms(1)
+        LcdApi.__init__(self, num_lines, num_columns)
+        cmd = self.LCD_FUNCTION
+        if num_lines > 1:
+            cmd |= self.LCD_FUNCTION_2LINES
+        self.hal_write_command(cmd)
+
+    def hal_write_init_nibble(self, nibble):
+        byte = ((nibble >> 4) & 0x0F) << SHIFT_DATA
+        self.i2c.writeto(self.i2c_addr, bytearray([byte | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytearray([byte]))
+
+    def hal_backlight_on(self):
+        self.i2c.writeto(self.i2c_addr, bytearray([1 << SHIFT_BACKLIGHT]))
+
+    def hal_backlight_off(self):
+        self.i2c.writeto(self.i2c_addr, bytearray([0]))
+
+    def hal_write_command(self, cmd):
+        self._write_byte(cmd, 0)
+        if cmd <= 3:
+            clock.sleep_ms(5)  # The home and clear commands require a worst case delay of 4.1 msec
+
+    def hal_write_data(self, data):
+        self._write_byte(data, MASK_RS)
+
+    def _write_byte(self, value, rs):
+        byte = rs | (self.backlight << SHIFT_BACKLIGHT) | (((value >> 4) & 0x0F) << SHIFT_DATA)
+        self.i2c.writeto(self.i2c_addr, bytearray([byte | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytearray([byte]))
+        byte = rs | (self.backlight << SHIFT_BACKLIGHT) | ((value & 0x0F) << SHIFT_DATA)
+        self.i2c.writeto(self.i2c_addr, bytearray([byte | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytearray([byte]))
@@ -0,0 +1,105 @@
+"""Stand-in for MicroPython's machine module: Pin, I2C and idle()."""
+
+from pico_sim import clock
+
+BITS_PER_BYTE = 9  # 8 data bits plus ACK
+I2C_OVERHEAD_BITS = 2  # START and STOP conditions
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    pins = {}  # GPIO number -> Pin, so scripts can press buttons by number
+
+    def __init__(self, number, mode=IN, pull=None, value=None):
+        self.number = number
+        self.mode = mode
+        self.level = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            self.level = value
+        self.trigger = 0
+        self.handler = None
+        Pin.pins[number] = self
+
+    def value(self, level=None):
+        if level is None:
+            return self.level
+        self.drive(level)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING):
+        self.handler = handler
+        self.trigger = trigger
+
+    def drive(self, level):
+        """Sets the pin level from outside (a button) and fires the IRQ on a matching edge."""
+        before, self.level = self.level, level
+        edge = Pin.IRQ_FALLING if before and not level else Pin.IRQ_RISING if level and not before else 0
+        if edge & self.trigger and self.handler is not None:
+            self.handler(self)
+
+
+class I2CDevice:
+    """Base for things on the simulated bus; counts the traffic addressed to it."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.transactions = 0
+
+    def write(self, data):
+        pass
+
+
+class Bus:
+    def __init__(self):
+        self.devices = {}
+        self.freq = 400000
+        self.busy_seconds = 0.0
+
+    def transfer_seconds(self, payload):
+        return ((1 + payload) * BITS_PER_BYTE + I2C_OVERHEAD_BITS) / self.freq
+
+
+buses = {}
+
+
+def bus(bus_id=0):
+    if bus_id not in buses:
+        buses[bus_id] = Bus()
+    return buses[bus_id]
+
+
+def attach(address, device, bus_id=0):
+    """Puts a device on a simulated bus; returns it."""
+    bus(bus_id).devices[address] = device
+    return device
+
+
+class I2C:
+    def __init__(self, bus_id, scl=None, sda=None, freq=400000):
+        self.bus = bus(bus_id)
+        self.bus.freq = freq
+
+    def scan(self):
+        return sorted(self.bus.devices)
+
+    def writeto(self, addr, buf, stop=True):
+        device = self.bus.devices.get(addr)
+        if device is None:
+            raise OSError(5)  # EIO, like a real NAK from an empty address
+        data = bytes(buf)
+        device.bytes += 1 + len(data)
+        device.transactions += 1
+        seconds = self.bus.transfer_seconds(len(data))
+        self.bus.busy_seconds += seconds
+        clock.advance(seconds)  # writeto() blocks the CPU on the real board too
+        device.write(data)
+        return len(data)
+
+
+def idle():
+    pass
@@ -0,0 +1,199 @@
+"""
+Plays the Pico standard mode on simulated hardware and reports what it cost.
+
+A bot starts each game from the start screen and answers every question
+after a random think time, or --presses replays a script of timestamped
+presses ("<seconds> <A-D>" per line). Afterwards it prints I2C traffic per
+LCD, bus load, press-to-feedback latency and CPU time per game.
+
+    python3 -m pico_sim.run --games 200
+    python3 -m pico_sim.run --presses presses.txt --show
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import pico_sim
+from pico_sim import machine, uasyncio
+from pico_sim.hd44780 import VirtualLcd
+
+DEFAULT_SCRIPT = os.path.join(REPO_DIR, "s_mode_interface_pico.py")
+DEFAULT_FRAMES = os.path.join(REPO_DIR, "standard_code", "public", "data", "questions.frames")
+LCD_ADDRESSES = {0x27: "question", 0x26: "score", 0x25: "time"}
+POLL_SECONDS = 0.005
+
+
+class Board:
+    """The simulated hardware around one game: LCDs, buttons and what happened."""
+
+    def __init__(self):
+        self.lcds = {addr: machine.attach(addr, VirtualLcd()) for addr in LCD_ADDRESSES}
+        self.game = None
+        self.buttons = {}
+        self.presses = []    # (clock time, label)
+        self.latencies = []  # Press-to-feedback ms, as the game measured them
+        self.games = 0
+
+    def connect(self, game):
+        self.game = game
+        self.buttons = dict(zip(game.buttons.labels, game.buttons.pins))
+        game.engine.clock = pico_sim.clock.time
+        game.engine.on_event(self._on_event)
+
+        measure = game.latency.add
+
+        def add(pressed_at, now=None):
+            ms = measure(pressed_at, now)
+            self.latencies.append(ms)
+            return ms
+        game.latency.add = add
+
+    def _on_event(self, engine, event, data):
+        if event == "game_over":
+            self.games += 1
+
+    def press(self, label):
+        pin = self.buttons[label]
+        self.presses.append((pico_sim.clock.time(), label))
+        pin.drive(0)
+        pin.drive(1)
+
+    def screen(self, addr=0x27):
+        return self.lcds[addr].text()
+
+
+async def wait_until(condition):
+    while not condition():
+        await uasyncio.sleep(POLL_SECONDS)
+
+
+async def bot(board, games, rng, think, accuracy):
+    """Starts games and answers questions like a player who's right `accuracy` of the time."""
+    from trivia_core.engine import GAME_OVER, QUESTION
+    engine = board.game.engine
+    while board.games < games:
+        await wait_until(lambda: board.screen().startswith("Press any btn"))
+        await uasyncio.sleep(rng.uniform(0.2, 1.0))
+        board.press(rng.choice("ABCD"))
+        await wait_until(lambda: engine.state == QUESTION)
+
+        while engine.state != GAME_OVER:
+            question = engine.question
+            await uasyncio.sleep(rng.uniform(*think))
+            if engine.state == QUESTION and engine.question is question:
+                correct = question[2]
+                wrong = [label for label in "ABCD" if label != correct]
+                board.press(correct if rng.random() < accuracy else rng.choice(wrong))
+            await wait_until(lambda: engine.state == GAME_OVER
+                             or (engine.state == QUESTION and engine.question is not question))
+
+
+async def scripted(board, presses):
+    """Presses buttons at fixed times (seconds after the board starts), then lets the game finish."""
+    start = pico_sim.clock.time()
+    for at, label in presses:
+        await uasyncio.sleep(max(start + at - pico_sim.clock.time(), 0))
+        board.press(label)
+    games = board.games
+    await wait_until(lambda: board.games > games or board.screen().startswith("Press any btn"))
+
+
+def read_presses(path):
+    presses = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].split()
+            if line:
+                presses.append((float(line[0]), line[1].upper()))
+    return sorted(presses)
+
+
+def load_game(path, board, player):
+    """Imports the game file; its asyncio.run() plays until the player is done."""
+    spec = importlib.util.spec_from_file_location("pico_game", path)
+    game = importlib.util.module_from_spec(spec)
+
+    def start_player():
+        board.connect(game)  # The game's globals exist by the time it calls asyncio.run()
+        return player()
+    uasyncio.companions[:] = [start_player]
+    spec.loader.exec_module(game)
+    return game
+
+
+def percentile(values, p):
+    return values[min(int(len(values) * p / 100), len(values) - 1)] if values else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--script", default=DEFAULT_SCRIPT, help="Pico game file to run")
+    parser.add_argument("--frames", default=DEFAULT_FRAMES if os.path.exists(DEFAULT_FRAMES) else None,
+                        help="questions.frames to put on the simulated flash")
+    parser.add_argument("--presses", help="file of '<seconds> <A-D>' lines to play instead of the bot")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.5, 3.0), help="bot's min/max answer time")
+    parser.add_argument("--accuracy", type=float, default=0.6)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--realtime", action="store_true", help="run on the wall clock instead of virtual time")
+    parser.add_argument("--show", action="store_true", help="print every LCD change")
+    parser.add_argument("--verbose", action="store_true", help="show what the game prints")
+    args = parser.parse_args()
+
+    pico_sim.install(virtual=not args.realtime)
+    board = Board()
+    if args.presses:
+        presses = read_presses(args.presses)
+        player = lambda: scripted(board, presses)
+    else:
+        rng = random.Random(args.seed)
+        player = lambda: bot(board, args.games, rng, args.think, args.accuracy)
+
+    # The game looks for questions.frames in its working directory, like on the Pico's flash
+    script = os.path.abspath(args.script)
+    os.chdir(tempfile.mkdtemp(prefix="pico-sim-"))
+    if args.frames:
+        os.symlink(os.path.abspath(args.frames), "questions.frames")
+
+    output = io.StringIO()
+    sim_start = pico_sim.clock.time()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with contextlib.redirect_stdout(sys.stdout if args.verbose else output):
+        load_game(script, board, player)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    simulated = pico_sim.clock.time() - sim_start
+
+    if args.show:
+        changes = sorted((t, addr, text) for addr, lcd in board.lcds.items() for t, text in lcd.history)
+        for t, addr, text in changes:
+            print(f"{t - sim_start:9.3f}s  {LCD_ADDRESSES[addr]:8s}  {text!r}")
+        print()
+
+    games = max(board.games, 1)
+    bus = machine.bus()
+    print(f"games:             {board.games} ({len(board.presses)} presses)")
+    print(f"simulated time:    {simulated:.1f}s in {wall:.2f}s wall ({simulated / wall:.0f}x)")
+    print(f"CPU per game:      {1000 * cpu / games:.1f} ms (CPython)")
+    print(f"I2C bus busy:      {100 * bus.busy_seconds / max(simulated, 1e-9):.2f}% at {bus.freq // 1000} kHz")
+    for addr, name in LCD_ADDRESSES.items():
+        lcd = board.lcds[addr]
+        print(f"  {name:8s} {addr:#x}: {lcd.bytes / games:8.0f} bytes/game  {lcd.transactions / games:6.0f} "
+              f"transactions/game  {lcd.clears} clears")
+    latencies = sorted(board.latencies)
+    if latencies:
+        print(f"press->feedback:   avg {sum(latencies) / len(latencies):.1f} ms  "
+              f"p50 {percentile(latencies, 50)} ms  p99 {percentile(latencies, 99)} ms  max {latencies[-1]} ms")
+
+
+if __name__ == "__main__":
+    main()
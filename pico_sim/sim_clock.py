@@ -0,0 +1,31 @@
+import time
+
+
+class SimClock:
+    """Time for the simulated board: virtual (advanced by waits and bus traffic) or real."""
+
+    def __init__(self, virtual=True):
+        self.virtual = virtual
+        self.now = 1000.0
+
+    def time(self):
+        return self.now if self.virtual else time.time()
+
+    def advance(self, seconds):
+        """Time passing on the board, e.g. a blocking I2C transfer or sleep_ms()."""
+        if self.virtual:
+            self.now += seconds
+        elif seconds > 0:
+            time.sleep(seconds)
+
+    def ticks_ms(self):
+        return int(self.time() * 1000) & 0x3FFFFFFF
+
+    def ticks_us(self):
+        return int(self.time() * 1000000) & 0x3FFFFFFF
+
+    def ticks_diff(self, a, b):
+        return ((a - b + 0x20000000) & 0x3FFFFFFF) - 0x20000000
+
+    def sleep_ms(self, ms):
+        self.advance(ms / 1000.0)
@@ -0,0 +1,75 @@
+"""Stand-in for uasyncio: CPython asyncio on the simulated clock, plus the MicroPython extras."""
+
+import asyncio
+import selectors
+from asyncio import *  # noqa: F401,F403 - same API surface as uasyncio
+
+from pico_sim import clock
+
+companions = []  # Coroutine factories run alongside the game's main task (e.g. a scripted player)
+
+
+async def sleep_ms(ms):
+    await asyncio.sleep(ms / 1000.0)
+
+
+class ThreadSafeFlag:
+    """uasyncio.ThreadSafeFlag: set() from an IRQ, one waiter, cleared when the wait returns."""
+
+    def __init__(self):
+        self._event = asyncio.Event()
+
+    def set(self):
+        self._event.set()
+
+    def clear(self):
+        self._event.clear()
+
+    async def wait(self):
+        await self._event.wait()
+        self._event.clear()
+
+
+class _VirtualSelector(selectors.SelectSelector):
+    """Never blocks: a wait for the next timer just moves the simulated clock to it."""
+
+    def select(self, timeout=None):
+        ready = super().select(0)
+        if not ready:
+            if timeout is None:
+                raise RuntimeError("Simulated Pico deadlocked: every task is waiting and no timer is due")
+            clock.advance(timeout)
+        return ready
+
+
+class _VirtualLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        super().__init__(_VirtualSelector())
+
+    def time(self):
+        return clock.time()
+
+
+def new_event_loop():
+    return _VirtualLoop() if clock.virtual else asyncio.new_event_loop()
+
+
+async def _main(coro):
+    tasks = [asyncio.ensure_future(coro)] + [asyncio.ensure_future(factory()) for factory in companions]
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        task.result()  # Re-raise whatever ended the run
+
+
+def run(coro):
+    """Runs the game until it or any companion finishes."""
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_main(coro))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
@@ -0,0 +1,100 @@
+"""
+Startup loading on worker threads behind a progress screen.
+
+The games used to load images, fonts and questions at import time on the
+main thread, so the window stayed blank until everything was in. Preloader
+runs those jobs on a thread pool, draws a loading screen on the main thread
+meanwhile, and returns the results as one bundle:
+
+    preloader = Preloader(screen, started=STARTED)
+    preloader.add("deck", QuestionDeck, deck_path)
+    bundle = preloader.run("Flappy Bird")
+    ...
+    preloader.interactive()  # When the first screen takes input
+
+It also measures time to first frame (the loading screen) and time to
+interactive, both from `started`.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+
+class Preloader:
+    def __init__(self, surface, started=None, workers=4, fps=30):
+        self.surface = surface
+        self.started = started if started is not None else time.perf_counter()
+        self.workers = workers
+        self.fps = fps
+        self.jobs = []   # (name, function, args)
+        self.first_frame_ms = None
+        self.ready_ms = None
+        self.interactive_ms = None
+        self.job_ms = {}
+
+    def add(self, name, function, *args):
+        self.jobs.append((name, function, args))
+
+    def run(self, title="Loading"):
+        """Runs every job, showing progress until they're all done; returns {name: result}."""
+        font = pygame.font.Font(None, 40)
+        clock = pygame.time.Clock()
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="preload") as pool:
+            futures = {name: pool.submit(self._timed, name, function, *args) for name, function, args in self.jobs}
+            while True:
+                done = [name for name, future in futures.items() if future.done()]
+                self._draw(font, title, len(done), len(futures))
+                if self.first_frame_ms is None:
+                    self.first_frame_ms = self._elapsed()
+                if len(done) == len(futures):
+                    break
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        exit()
+                clock.tick(self.fps)
+            bundle = {}
+            for name, future in futures.items():
+                try:
+                    bundle[name] = future.result()
+                except Exception as e:
+                    raise RuntimeError(f"Loading {name} failed: {e}") from e
+        self.ready_ms = self._elapsed()
+        return bundle
+
+    def interactive(self):
+        """Call once the first screen accepts input; prints the startup timings the first time."""
+        if self.interactive_ms is not None:
+            return
+        self.interactive_ms = self._elapsed()
+        print(f"⏱️ Startup: first frame {self.first_frame_ms:.0f} ms, loaded {self.ready_ms:.0f} ms, "
+              f"interactive {self.interactive_ms:.0f} ms")
+
+    def summary(self):
+        return ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.job_ms.items())
+
+    def _timed(self, name, function, *args):
+        started = time.perf_counter()
+        result = function(*args)
+        self.job_ms[name] = (time.perf_counter() - started) * 1000
+        return result
+
+    def _elapsed(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def _draw(self, font, title, done, total):
+        surface = self.surface
+        width, height = surface.get_size()
+        surface.fill((0, 0, 0))
+        text = font.render(title, True, (255, 255, 255))
+        surface.blit(text, (width // 2 - text.get_width() // 2, height // 2 - 60))
+
+        bar = pygame.Rect(width // 4, height // 2, width // 2, 24)
+        pygame.draw.rect(surface, (255, 255, 255), bar, 2)
+        if total:
+            filled = bar.inflate(-6, -6)
+            filled.width = filled.width * done // total
+            pygame.draw.rect(surface, (255, 255, 255), filled)
+        pygame.display.update()
@@ -1,8 +1,16 @@
-import time
-import random
+import gc
 from machine import Pin, I2C
 from lcd_api import LcdApi
 from i2c_lcd import I2cLcd
+from pico_buttons import Buttons, LatencyStats
+from pico_frames import FrameFile, option_pages, wrap_pages
+from pico_lcd import FrameLcd
+from trivia_core.engine import FEEDBACK, GAME_OVER, QUESTION, TriviaEngine
+
+try:
+    import uasyncio as asyncio
+except ImportError:  # CPython
+    import asyncio
 
 # Define I2C and LCD address
 I2C_ADDR_QUESTION = 0x27  # Adjust based on your LCD
@@ -12,105 +20,173 @@ I2C_ADDR_TIME = 0x25      # Adjust based on your LCD
 # I2C Initialization (Pins: SDA=Pin 0, SCL=Pin 1)
 i2c = I2C(0, scl=Pin(1), sda=Pin(0), freq=400000)
 
-# LCD Initialization
-lcd_question = I2cLcd(i2c, I2C_ADDR_QUESTION, 2, 16)  # 16x2 LCD for questions
-lcd_score = I2cLcd(i2c, I2C_ADDR_SCORE, 2, 16)        # 16x2 LCD for score
-lcd_time = I2cLcd(i2c, I2C_ADDR_TIME, 2, 16)          # 16x2 LCD for timer
+# LCD Initialization; FrameLcd only sends the characters that changed since the last screen
+lcd_question = FrameLcd(I2cLcd(i2c, I2C_ADDR_QUESTION, 2, 16))  # 16x2 LCD for questions
+lcd_score = FrameLcd(I2cLcd(i2c, I2C_ADDR_SCORE, 2, 16))        # 16x2 LCD for score
+lcd_time = FrameLcd(I2cLcd(i2c, I2C_ADDR_TIME, 2, 16))          # 16x2 LCD for timer
 
-# Define Buttons
-btn_A = Pin(10, Pin.IN, Pin.PULL_UP)
-btn_B = Pin(11, Pin.IN, Pin.PULL_UP)
-btn_C = Pin(12, Pin.IN, Pin.PULL_UP)
-btn_D = Pin(13, Pin.IN, Pin.PULL_UP)
+# Define Buttons (pin IRQs, so short taps aren't missed between polls)
+buttons = Buttons((("A", 10), ("B", 11), ("C", 12), ("D", 13)))
+latency = LatencyStats()  # Press-to-feedback time, printed over USB serial after each game
 
-# Define Questions and Answers
+# Define Questions and Answers (used when there's no frames file on the Pico)
 QUESTIONS = [
     ("1+1=?", {"A": "1", "B": "2", "C": "3", "D": "4"}, "B"),
     ("Color of broccoli?", {"A": "red", "B": "blue", "C": "green", "D": "black"}, "C"),
 ]
 
+# The full bank, pre-wrapped into LCD pages by standard_code/build_pico_frames.py.
+# Questions are read from flash one at a time, so RAM use doesn't grow with the bank.
+FRAMES_FILE = "questions.frames"
+try:
+    questions = FrameFile(FRAMES_FILE)
+except OSError:
+    questions = [(wrap_pages(q), option_pages(options), answer) for q, options, answer in QUESTIONS]
+
+PAGE_SECONDS = 1.5      # Each 16x2 page of a long question
+OPTIONS_SECONDS = 3     # Options stay up longer before the question comes round again
+FEEDBACK_SECONDS = 1.5
+
+# Scoring, timing and question selection (shared with the other front-ends).
+# Feedback timing is handled by the display task, so the engine waits for next_question().
+engine = TriviaEngine(questions, feedback_seconds=None)
+
 def clear_lcds():
     """Clears all LCD screens"""
-    lcd_question.clear()
-    lcd_score.clear()
-    lcd_time.clear()
+    lcd_question.show("")
+    lcd_score.show("")
+    lcd_time.show("")
 
 def update_score(score):
     """Updates the score LCD"""
-    lcd_score.clear()
-    lcd_score.putstr(f"Score: {score}")
+    lcd_score.show(f"Score: {score}")
 
 def update_timer(time_left):
     """Updates the timer LCD"""
-    lcd_time.clear()
-    lcd_time.putstr(f"Time: {time_left}s")
+    lcd_time.show(f"Time: {time_left}s")
 
-def ask_question():
-    """Displays a random question and options on the LCD"""
-    lcd_question.clear()
-    question, options, correct_answer = random.choice(QUESTIONS)
+def question_pages():
+    """The engine's current question pages followed by its option pages"""
+    question, options, correct_answer = engine.question
+    return question + options
 
-    lcd_question.putstr(question)  # Display question
-    time.sleep(1)  # Small delay before showing options
-    lcd_question.clear()
+class Session:
+    """Signals shared by one game's tasks"""
 
-    lcd_question.putstr(f"A.{options['A']} B.{options['B']}\nC.{options['C']} D.{options['D']}")
-    
-    return correct_answer
+    def __init__(self):
+        self.changed = asyncio.Event()        # Answered, so the display should stop paging
+        self.score_changed = asyncio.Event()
+        self.pressed_at = None
 
-def read_button():
-    """Waits for button press and returns A, B, C, or D"""
+async def next_press():
+    """Waits for the next queued button press without blocking the other tasks"""
     while True:
-        if btn_A.value() == 0:
-            return "A"
-        elif btn_B.value() == 0:
-            return "B"
-        elif btn_C.value() == 0:
-            return "C"
-        elif btn_D.value() == 0:
-            return "D"
-        time.sleep(0.1)  # Prevent rapid polling
-
-def game_loop():
-    """Main game logic"""
+        press = buttons.get()
+        if press is not None:
+            return press
+        if press_flag is not None:
+            await press_flag.wait()  # Set from the button IRQ
+        else:
+            await asyncio.sleep(0.01)
+
+async def wait_for(event, seconds):
+    """Waits for event or until seconds have passed"""
+    try:
+        await asyncio.wait_for(event.wait(), seconds)
+    except asyncio.TimeoutError:
+        pass
+    event.clear()
+
+async def countdown_task():
+    """Keeps the timer LCD ticking and ends the round at the time limit.
+
+    Sleeps until the timer's next whole second or the engine's next deadline,
+    whichever is sooner, instead of polling. The deadline is read again after
+    every wakeup, so a changed one is picked up within a second.
+    """
+    while engine.tick() != GAME_OVER:
+        update_timer(engine.time_left())
+        now = engine.clock()
+        wake = engine.start_time + int(now - engine.start_time) + 1  # When the shown second changes
+        deadline = engine.next_deadline()
+        if deadline is not None and deadline < wake:
+            wake = deadline
+        await asyncio.sleep(max(wake - now, 0))
+    update_timer(0)
+
+async def input_task(session):
+    """Scores button presses while a question is up"""
+    while True:
+        key, pressed_at = await next_press()
+        if engine.state == QUESTION:
+            engine.answer(key)
+            session.pressed_at = pressed_at
+            session.changed.set()
+            session.score_changed.set()
+
+async def scoring_task(session):
+    """Redraws the score LCD whenever it changes"""
+    while True:
+        update_score(engine.score)
+        await session.score_changed.wait()
+        session.score_changed.clear()
+
+async def question_task(session):
+    """Pages through the question and options until answered, then shows feedback"""
+    while True:
+        pages = question_pages()
+        page = 0
+        while engine.state == QUESTION:
+            lcd_question.show(pages[page])
+            await wait_for(session.changed, OPTIONS_SECONDS if page == len(pages) - 1 else PAGE_SECONDS)
+            page = (page + 1) % len(pages)
+
+        if engine.state != FEEDBACK:
+            return  # Time ran out
+        lcd_question.show("Correct!" if engine.last_correct else "Incorrect!")
+        latency.add(session.pressed_at)
+        await asyncio.sleep(FEEDBACK_SECONDS)
+        buttons.clear()  # Ignore presses made during feedback
+        engine.next_question()
+
+async def play_session():
+    """Plays one game from the start prompt to game over"""
     clear_lcds()
-    lcd_question.putstr("Press any btn\nto start!")
-    
-    while btn_A.value() and btn_B.value() and btn_C.value() and btn_D.value():
-        time.sleep(0.1)  # Wait until a button is pressed
+    lcd_question.show("Press any btn\nto start!")
+
+    buttons.clear()
+    await next_press()  # Wait until a button is pressed
+
+    engine.start()
+    latency.reset()
+    buttons.clear()
+    session = Session()
+    tasks = [asyncio.create_task(question_task(session)),
+             asyncio.create_task(input_task(session)),
+             asyncio.create_task(scoring_task(session))]
+    await countdown_task()  # Returns when time is up, whatever the other tasks are doing
+    for task in tasks:
+        task.cancel()
 
-    score = 0
-    start_time = time.time()
+    # Game Over Display
+    update_score(engine.score)
+    lcd_question.show(f"Game Over!\nScore: {engine.score}")
+    print("Press to feedback:", latency.summary())
+    await asyncio.sleep(3)
 
-    while True:
-        elapsed_time = time.time() - start_time
-        time_left = max(10 - int(elapsed_time), 0)
-        
-        update_score(score)
-        update_timer(time_left)
-
-        if time_left == 0:
-            break  # End game when time is up
-
-        correct_answer = ask_question()
-        user_input = read_button()
-
-        lcd_question.clear()
-        if user_input == correct_answer:
-            lcd_question.putstr("Correct!")
-            score += 10
-        else:
-            lcd_question.putstr("Incorrect!")
+async def game_loop():
+    """Main game logic"""
+    global press_flag
+    press_flag = asyncio.ThreadSafeFlag() if hasattr(asyncio, "ThreadSafeFlag") else None
+    buttons.flag = press_flag
 
-        update_score(score)  # Update score after every question
-        time.sleep(1.5)
+    # Restart game automatically; a loop instead of recursion, which overflows
+    # the MicroPython stack after a few dozen games
+    while True:
+        await play_session()
+        gc.collect()  # Start every session with the heap tidied up
 
-    # Game Over Display
-    lcd_question.clear()
-    lcd_question.putstr(f"Game Over!\nScore: {score}")
-    time.sleep(3)
-    
-    game_loop()  # Restart game automatically
+press_flag = None
 
 # Start the game
-game_loop()
+asyncio.run(game_loop())
@@ -1,6 +1,10 @@
 import curses
-import random
 import time
+from trivia_core.bank import QuestionBank
+from trivia_core.deck import QuestionDeck
+from trivia_core.dispenser import open_dispenser
+from trivia_core.engine import FEEDBACK, GAME_OVER, QUESTION, TriviaEngine
+from trivia_core.telemetry import TelemetryRecorder
 
 # Define questions and answers
 QUESTIONS = [
@@ -13,22 +17,142 @@ QUESTIONS = [
     ("How old did Queen Elizabeth II live to be?", {"A": "108", "B": "99", "C": "96", "D": "87"}, "C")
 ]
 
-def ask_question(win, used_questions):
-    """Selects a new question without repetition within a round."""
-    available_questions = [q for q in QUESTIONS if q[0] not in used_questions]
-    
-    if not available_questions:  # Reset if all questions have been used
-        used_questions.clear()
-        available_questions = QUESTIONS.copy()
-    
-    question, options, correct_answer = random.choice(available_questions)
-    used_questions.add(question)  # Store only the question text
-    
+# Shared question bank, reloaded in the background when fetch_and_prepare.py updates it
+bank = QuestionBank(fallback=[
+    {"question": q, "options": options, "correctAnswer": answer, "category": "General"}
+    for q, options, answer in QUESTIONS
+])
+
+# Persistent shuffle deck so regular players don't see repeats across rounds
+deck = QuestionDeck()
+
+# Scoring, timing and question selection; this file only draws and reads keys
+engine = TriviaEngine(
+    lambda: bank.snapshot().questions,  # Read once per question, reloads swap in before the next one
+    picker=lambda questions: deck.draw("standard", len(questions)),
+)
+
+QUESTION_ROWS = range(4, 11)  # Question, options and feedback line
+
+class Hud:
+    """Remembers what is on screen so only regions that changed get redrawn."""
+
+    def __init__(self, win):
+        self.win = win
+        self.time_left = None
+        self.score = None
+
+    def draw_timer(self, time_left):
+        if time_left == self.time_left:
+            return
+        self.time_left = time_left
+        self.win.addstr(1, 2, f"Time Left: {time_left}s".ljust(15), curses.color_pair(1) | curses.A_BOLD)
+        self.win.noutrefresh()
+
+    def draw_score(self, score):
+        if score == self.score:
+            return
+        self.score = score
+        self.win.addstr(1, 50, f"Score: {score}".ljust(12), curses.color_pair(1) | curses.A_BOLD)
+        self.win.noutrefresh()
+
+def clear_rows(win, rows):
+    """Blanks just these rows instead of clearing (and repainting) the whole screen."""
+    for y in rows:
+        win.move(y, 0)
+        win.clrtoeol()
+
+def wait_for_key(win, hud, engine, until):
+    """Blocks on input until a key arrives or `until` passes; returns the key or -1.
+
+    Instead of polling, each getch waits exactly until the on-screen timer
+    has to change (or the deadline), so an idle screen costs no CPU and a
+    key press is handled as soon as it arrives.
+    """
+    while True:
+        now = time.time()
+        hud.draw_timer(engine.time_left())
+        curses.doupdate()
+        if now >= until:
+            return -1
+
+        next_tick = engine.start_time + int(now - engine.start_time) + 1
+        wait_ms = int((min(until, next_tick) - now) * 1000) + 1  # Round up so we wake after the tick
+        win.timeout(wait_ms)
+        key = win.getch()
+        if key != -1:
+            return key
+
+def show_question(win, engine):
+    """Draws the engine's current question and options."""
+    question, options, correct_answer = engine.question
+
+    clear_rows(win, QUESTION_ROWS)
     win.addstr(4, 2, question, curses.color_pair(1) | curses.A_BOLD)  # Bold question
     for i, (key, value) in enumerate(options.items(), start=6):
         win.addstr(i, 4, f"  {key}. {value}", curses.color_pair(1) | curses.A_BOLD)  # Normal color for choices
-    
-    return question, options, correct_answer
+    win.noutrefresh()
+
+def show_feedback(win, engine):
+    """Shows Correct!/Incorrect! and highlights the right option after a wrong answer."""
+    question, options, correct_answer = engine.question
+    user_input = engine.last_answer
+
+    if engine.last_correct:
+        win.addstr(10, 4, f"Correct! You chose: {user_input}", curses.color_pair(2) | curses.A_BOLD)  # Green for correct answer
+    else:
+        win.addstr(10, 4, f"Incorrect! You chose: {user_input}", curses.color_pair(3) | curses.A_BOLD)  # Red for incorrect answer
+
+        # Re-display all choices but **highlight the correct answer**
+        for i, (key, value) in enumerate(options.items(), start=6):
+            if key == correct_answer:
+                win.addstr(i, 4, f"  {key}. {value}", curses.color_pair(2) | curses.A_BOLD)  # Green highlight
+            else:
+                win.addstr(i, 4, f"  {key}. {value}", curses.color_pair(1) | curses.A_BOLD)  # Normal color
+    win.noutrefresh()
+
+def play_session(stdscr):
+    """Plays one game from the start screen to game over; returns False if the player quit."""
+    # Start screen: drawn once, then block until a key arrives
+    stdscr.erase()
+    stdscr.addstr(2, 2, "Ready to start the game? Press any key to begin (or 'q' to quit)...", curses.color_pair(1) | curses.A_BOLD)
+    stdscr.refresh()
+    stdscr.timeout(-1)
+    if stdscr.getch() == ord('q'):  # Quit if 'q' is pressed
+        return False
+
+    stdscr.erase()
+    hud = Hud(stdscr)
+    engine.start()  # Fresh score, timer and question for this session
+    shown = None  # Question currently on screen
+
+    while engine.tick() != GAME_OVER:
+        hud.draw_score(engine.score)
+
+        if engine.state == QUESTION:
+            if shown is not engine.question:
+                curses.flushinp()  # Drop keys typed during the feedback pause
+                show_question(stdscr, engine)
+                shown = engine.question
+
+            key = wait_for_key(stdscr, hud, engine, engine.end_time)
+            if key == ord('q'):  # Quit if 'q' is pressed at any point
+                return False
+            if key != -1:
+                engine.answer(chr(key).upper() if 0 <= key < 256 else None)
+                show_feedback(stdscr, engine)
+
+        elif engine.state == FEEDBACK:
+            # Short delay before next question; the timer keeps ticking
+            if wait_for_key(stdscr, hud, engine, engine.next_deadline()) == ord('q'):
+                return False
+
+    # Game over screen
+    stdscr.erase()
+    stdscr.addstr(5, 10, f"Game over! Your score is: {engine.score}", curses.color_pair(1) | curses.A_BOLD)
+    stdscr.refresh()
+    time.sleep(3)  # Show score before resetting
+    return True
 
 def game_loop(stdscr):
     """Main game logic using curses."""
@@ -39,95 +163,28 @@ def game_loop(stdscr):
     curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_WHITE)  # Green for correct answers
     curses.init_pair(3, curses.COLOR_RED, curses.COLOR_WHITE)  # Red for incorrect messages
     stdscr.bkgd(curses.color_pair(1))  # Set background color
-    stdscr.clear()
-    
     curses.curs_set(0)  # Hide cursor
-    stdscr.nodelay(True)  # Non-blocking input
-    stdscr.timeout(100)  # Refresh rate
-
-    while True:
-        stdscr.clear()
-        stdscr.addstr(2, 2, "Ready to start the game? Press any key to begin (or 'q' to quit)...", curses.color_pair(1) | curses.A_BOLD)
-        stdscr.refresh()
-        
-        key = stdscr.getch()
-        if key == ord('q'):  # Quit if 'q' is pressed
-            return
-        if key != -1:  # If any other key is pressed, start game
-            break
-
-    score = 0
-    start_time = time.time()
-    used_questions = set()  # Track used question texts for this round
-
-    while True:
-        stdscr.clear()
-        elapsed_time = time.time() - start_time
-        time_left = max(10 - int(elapsed_time), 0)  # Ensure time_left doesn't go negative
-        
-        # Display time left at top-left (updates live)
-        stdscr.addstr(1, 2, " " * 15)  # Clear previous time text
-        stdscr.addstr(1, 2, f"Time Left: {time_left}s", curses.color_pair(1) | curses.A_BOLD)
-        # Display score at top-right
-        stdscr.addstr(1, 50, f"Score: {score}", curses.color_pair(1) | curses.A_BOLD)
-
-        if time_left == 0:  # Check if time is up
-            break  # Exit the game loop
-
-        question, options, correct_answer = ask_question(stdscr, used_questions)
-        stdscr.refresh()
-
-        user_input = None
-
-        while time.time() - start_time < 10:  # Keep waiting for input until time runs out
-            key = stdscr.getch()
-            if key == ord('q'):  # Quit if 'q' is pressed at any point
-                return
-            if key != -1:
-                user_input = chr(key).upper()
-                break  # Exit input loop
-
-            # Continuously update time display while waiting
-            elapsed_time = time.time() - start_time
-            time_left = max(10 - int(elapsed_time), 0)
-            stdscr.addstr(1, 2, " " * 15)  # Clear previous time text
-            stdscr.addstr(1, 2, f"Time Left: {time_left}s", curses.color_pair(1) | curses.A_BOLD)  # Correct format
-            stdscr.refresh()
-            time.sleep(0.1)  # Refresh every 0.1s
-
-            if time_left == 0:
-                break  # Stop waiting when time runs out
-        
-        if time_left == 0:
-            break  # If time is up, exit the game loop
-
-        if user_input == correct_answer:
-            score += 10
-            stdscr.addstr(10, 4, f"Correct! You chose: {user_input}", curses.color_pair(2) | curses.A_BOLD)  # Green for correct answer
-        else:
-            stdscr.addstr(10, 4, f"Incorrect! You chose: {user_input}", curses.color_pair(3) | curses.A_BOLD)  # Red for incorrect answer
-
-            # Re-display all choices but **highlight the correct answer**
-            for i, (key, value) in enumerate(options.items(), start=6):
-                if key == correct_answer:
-                    stdscr.addstr(i, 4, f"  {key}. {value}", curses.color_pair(2) | curses.A_BOLD)  # Green highlight
-                else:
-                    stdscr.addstr(i, 4, f"  {key}. {value}", curses.color_pair(1) | curses.A_BOLD)  # Normal color
-
-        stdscr.refresh()
-        time.sleep(1.5)  # Short delay before next question
-
-    # Game over screen
-    stdscr.clear()
-    stdscr.addstr(5, 10, f"Game over! Your score is: {score}", curses.color_pair(1) | curses.A_BOLD)
-    stdscr.refresh()
-    time.sleep(3)  # Show score before resetting
 
-    game_loop(stdscr)  # Restart game automatically
+    # Restart game automatically; a loop instead of recursion so an all-day kiosk
+    # doesn't grow the stack by one frame per game
+    while play_session(stdscr):
+        pass
 
 # Run the game
 if __name__ == "__main__":
+    bank.start_watching()
+    telemetry = TelemetryRecorder()  # Answer times and choices, see python3 -m trivia_core.telemetry
+    telemetry.attach(engine)
+    dispenser = open_dispenser()  # Candy for finished rounds, when SWEETRIVIA_DISPENSER_BUS is set
+    if dispenser:
+        dispenser.attach(engine)
+    interrupted = False
     try:
         curses.wrapper(game_loop)
     except KeyboardInterrupt:
-        pass  # Allow clean exit with Ctrl+C
+        interrupted = True  # Allow clean exit with Ctrl+C
+    finally:
+        telemetry.close()
+        if dispenser:
+            # The last round's candy still goes out, but Ctrl+C or a stuck bus doesn't hang the exit
+            dispenser.close(drain=not interrupted, timeout=5)
@@ -0,0 +1,122 @@
+"""
+Redraw-on-change screen loop for the pygame kiosk UI.
+
+The old loop redrew the home screen as fast as it could, so an idle kiosk
+kept a CPU core busy. ScreenManager only draws when something changed:
+
+- the screen's handle_event(event) returned True (or it has none; then any event counts),
+- the screen's update(dt) returned True, e.g. an attract-mode timer fired,
+- the screen is animating (its `animating` attribute is true), capped at `fps`,
+- the window was exposed/restored, or invalidate()/show() was called.
+
+When nothing needs drawing it sleeps in pygame.event.wait() with a timeout,
+so the process wakes only for input or once per idle_ms. update() still runs
+on every wakeup, so a change it reports is drawn at most idle_ms late; a
+screen that needs smoother timing sets `animating` instead.
+
+A screen is any object with draw(); handle_event(event), update(dt) and
+`animating` are optional.
+"""
+
+import time
+
+import pygame
+
+from trivia_core.profiler import NullProfiler
+
+# Events after which the window contents may be gone and need a full redraw
+_EXPOSE_EVENTS = {pygame.VIDEOEXPOSE, pygame.ACTIVEEVENT, pygame.WINDOWEXPOSED,
+                  pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED}
+
+
+class ScreenManager:
+    def __init__(self, surface, fps=30, idle_ms=1000, background=(0, 0, 0), profiler=None):
+        self.surface = surface
+        self.fps = fps
+        self.idle_ms = idle_ms
+        self.background = background
+        self.profiler = profiler or NullProfiler()
+        self.screen = None
+        self.bundle = {}   # Preloaded assets and questions, shared by every screen
+        self.dirty = True
+        self.running = False
+        self.clock = pygame.time.Clock()
+        self.frames = 0    # Frames actually drawn
+        self.wakeups = 0   # Times the loop ran
+
+    def show(self, screen):
+        """Switches to another screen (e.g. from a button on the home screen)."""
+        self.screen = screen
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def stop(self):
+        self.running = False
+
+    def animating(self):
+        return bool(getattr(self.screen, "animating", False))
+
+    def run(self, max_frames=None, always_redraw=False, on_first_frame=None):
+        """Runs until the window is closed (or max_frames were drawn, for benchmarks).
+
+        on_first_frame() is called once the first frame is on the display.
+        """
+        self.running = True
+        last = time.perf_counter()
+        while self.running:
+            self.wakeups += 1
+            self.profiler.start_frame()
+            busy = always_redraw or self.animating()
+            if busy or self.dirty:
+                events = pygame.event.get()
+            else:
+                events = [pygame.event.wait(self.idle_ms)]  # Sleeps until input or the timeout
+            for event in events:
+                self._handle(event)
+            self.profiler.lap("events")
+
+            now = time.perf_counter()
+            update = getattr(self.screen, "update", None)
+            if update is not None and update(now - last):
+                self.dirty = True  # Timers and animations advance even when nothing is drawn
+            last = now
+
+            if not (self.dirty or always_redraw or self.animating()):
+                continue  # Idle: back to waiting, no draw and no frame cap
+            self._draw()
+            self.profiler.lap("draw")
+            pygame.display.update()
+            self.profiler.lap("display_update")
+            self.profiler.end_frame()
+            self.frames += 1
+            if self.frames == 1 and on_first_frame is not None:
+                on_first_frame()
+            self.dirty = False
+            if max_frames and self.frames >= max_frames:
+                break
+            if not always_redraw:
+                self.clock.tick(self.fps)  # Animations run at most at fps
+
+    def _handle(self, event):
+        if event.type == pygame.NOEVENT:
+            return  # event.wait timed out
+        if event.type == pygame.QUIT:
+            self.running = False
+            return
+        if event.type in _EXPOSE_EVENTS:
+            self.dirty = True
+        handle_event = getattr(self.screen, "handle_event", None)
+        if handle_event is None:
+            self.dirty = True  # Can't tell what changed, so redraw
+        elif handle_event(event):
+            self.dirty = True
+
+    def _draw(self):
+        self.surface.fill(self.background)
+        # Draw the screen safely
+        try:
+            self.screen.draw()
+        except Exception as e:
+            print(f"Error drawing screen: {e}")
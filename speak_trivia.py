@@ -1,6 +1,6 @@
 import pyttsx3
 import json
-import random
+from trivia_core.deck import QuestionDeck
 
 # Initialize pyttsx3 engine
 engine = pyttsx3.init()
@@ -35,8 +35,9 @@ def narrate_question(question_data):
         engine.say(option_text)
         engine.runAndWait()
 
-# Pick a random question
-question_data = random.choice(trivia_questions)
+# Pick the next question from the persistent shuffle deck
+deck = QuestionDeck()
+question_data = trivia_questions[deck.draw("narration", len(trivia_questions))]
 
 # Speak the question and options
 narrate_question(question_data)
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Builds the Pico's question frames file from the question bank.
+
+Every question and its options are word-wrapped and paged for the 16x2
+LCDs ahead of time and written to a compact indexed file (see
+pico_frames.py for the layout), so the Pico only reads the frames it is
+about to show. Copy the output to the Pico as questions.frames; for the
+current bank (292 questions) it is 43.0 KiB.
+
+    python3 build_pico_frames.py [bank.json] [questions.frames]
+"""
+
+import argparse
+import os
+import struct
+import sys
+import unicodedata
+
+# Shared helpers live at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pico_frames import HEADER, HEADER_SIZE, LABELS, MAGIC, VERSION, option_pages, wrap_pages
+from trivia_core.bank import DEFAULT_BANK_PATH, load_questions
+from trivia_core.engine import question_parts
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "data")
+DEFAULT_FRAMES_PATH = os.path.join(DATA_DIR, "questions.frames")
+MAX_PAGES = 255
+
+
+def lcd_text(text):
+    """Plain ASCII the HD44780 character ROM can show ("é" -> "e", "–" -> "-")."""
+    text = text.replace("‘", "'").replace("’", "'").replace("“", '"').replace("”", '"')
+    text = text.replace("–", "-").replace("—", "-")
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch if 32 <= ord(ch) < 127 else "?" for ch in text if not unicodedata.combining(ch))
+
+
+def frame_bytes(page, cols, rows):
+    """One page as rows*cols space-padded bytes."""
+    lines = page.split("\n")
+    lines += [""] * (rows - len(lines))
+    return b"".join(line[:cols].ljust(cols).encode("ascii") for line in lines[:rows])
+
+
+def build_record(question, cols, rows):
+    text, options, correct = question_parts(question)
+    question_pages = wrap_pages(lcd_text(text), cols, rows)
+    answer_pages = option_pages({label: lcd_text(options[label]) for label in LABELS}, cols, rows)
+    if len(question_pages) > MAX_PAGES or len(answer_pages) > MAX_PAGES:
+        raise ValueError(f"Question is too long for the LCD: {text[:40]}...")
+    record = bytearray((LABELS.index(correct), len(question_pages), len(answer_pages)))
+    for page in question_pages + answer_pages:
+        record += frame_bytes(page, cols, rows)
+    return bytes(record)
+
+
+def build_frames(questions, out_path, cols=16, rows=2):
+    """Writes the frames file; returns (questions written, file size)."""
+    records = [build_record(q, cols, rows) for q in questions]
+    offset = HEADER_SIZE + 4 * (len(records) + 1)
+    offsets = []
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+    offsets.append(offset)
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(struct.pack(HEADER, MAGIC, VERSION, cols, rows, len(records)))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for record in records:
+            f.write(record)
+    os.replace(tmp_path, out_path)
+    return len(records), offset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute 16x2 LCD frames for the Pico standard mode.")
+    parser.add_argument("bank", nargs="?", default=DEFAULT_BANK_PATH)
+    parser.add_argument("output", nargs="?", default=DEFAULT_FRAMES_PATH)
+    parser.add_argument("--cols", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=2)
+    args = parser.parse_args()
+
+    bank = load_questions(args.bank)
+    questions = [q for q in bank if question_parts(q)[2] in tuple(LABELS)]
+    if len(questions) < len(bank):
+        print(f"⚠️ Skipped {len(bank) - len(questions)} question(s) without a correct answer A-D")
+    count, size = build_frames(questions, args.output, args.cols, args.rows)
+    print(f"✅ Wrote {count} questions ({size / 1024:.1f} KiB) → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
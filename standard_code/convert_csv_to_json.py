@@ -1,16 +1,13 @@
 import csv
-import json
 import os
+import sys
 
-def convert_and_append(csv_file, json_file):
-    # Step 1: Load existing JSON if it exists
-    if os.path.exists(json_file):
-        with open(json_file, 'r', encoding='utf-8') as jf:
-            existing_data = json.load(jf)
-    else:
-        existing_data = []
+# Shared bank helpers live at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from trivia_core.bank import append_questions
 
-    # Step 2: Load new data from CSV
+def convert_and_append(csv_file, json_file):
+    # Step 1: Load new data from CSV
     with open(csv_file, mode="r", encoding="utf-8") as file:
         csv_reader = csv.DictReader(file)
         csv_reader.fieldnames = [field.strip() for field in csv_reader.fieldnames]
@@ -29,19 +26,10 @@ def convert_and_append(csv_file, json_file):
             }
             new_data.append(question_data)
 
-    # Step 3: Combine and remove duplicates (optional)
-    all_questions = existing_data + new_data
-    # Optional: remove duplicates based on the "question" text
-    seen = set()
-    unique_questions = []
-    for q in all_questions:
-        q_text = q["question"]
-        if q_text not in seen:
-            seen.add(q_text)
-            unique_questions.append(q)
-
-    # Step 4: Save updated JSON
-    with open(json_file, "w", encoding="utf-8") as json_file:
-        json.dump(unique_questions, json_file, indent=4, ensure_ascii=False)
+    # Step 2: Merge into the bank under the bank lock, skipping duplicate question text.
+    # The rows are journaled first and the bank is replaced with a rename, so parallel
+    # uploads don't overwrite each other and a crash never leaves a partial file.
+    added = append_questions(json_file, new_data)
 
-    print(f"✅ Appended {len(new_data)} new question(s) → {json_file.name}")
+    print(f"✅ Appended {added} new question(s) → {json_file}")
+    return added
@@ -1,28 +1,196 @@
-import json
+import argparse
 import csv
+import json
+import os
+import sys
+
+# Default paths (same as before, override on the command line)
+DEFAULT_INPUT = "questions_and_choices.json"
+DEFAULT_OUTPUT = "exported_questions.csv"
+
+CSV_HEADER = ["Question", "Option A", "Option B", "Option C", "Option D", "Correct Answer", "Category"]
+FORMATS = ("json", "jsonl", "csv")
+READ_CHUNK = 64 * 1024
+
+_INCOMPLETE = object()
+
+
+def detect_format(path):
+    """Guesses the file format from its extension."""
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext == "ndjson":
+        return "jsonl"
+    if ext not in FORMATS:
+        raise ValueError(f"Can't tell the format of {path}, pass --from/--to")
+    return ext
+
+
+def iter_json_array(f):
+    """Yields the objects of a top-level JSON array one at a time.
+
+    Only the current chunk and the object being decoded are held in memory,
+    so the bank size doesn't matter.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace and separators between elements
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos < len(buf):
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("Expected a JSON array of questions")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                obj = _INCOMPLETE  # Object is split across chunks, read more
+            if obj is not _INCOMPLETE and (end < len(buf) or eof):
+                yield obj
+                pos = end
+                continue
+        elif eof:
+            if started:
+                raise ValueError("Unterminated JSON array")
+            return
+
+        # Drop what we've consumed and pull in the next chunk
+        chunk = f.read(READ_CHUNK)
+        buf = buf[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+
+def record_from_csv_row(row, default_category):
+    """Converts a CSV row (web form or exported layout) into a question dict."""
+    row = {(k or "").strip(): v for k, v in row.items()}
+    return {
+        "question": row.get("Question", ""),
+        "options": {
+            "A": row.get("Option A", ""),
+            "B": row.get("Option B", ""),
+            "C": row.get("Option C", ""),
+            "D": row.get("Option D", ""),
+        },
+        "correctAnswer": row.get("Correct Answer", ""),
+        "category": row.get("Category") or default_category,
+    }
+
+
+def read_records(path, fmt, default_category="General"):
+    """Yields question dicts from a JSON, JSONL or CSV file."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if fmt == "json":
+            yield from iter_json_array(f)
+        elif fmt == "jsonl":
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        elif fmt == "csv":
+            for row in csv.DictReader(f):
+                yield record_from_csv_row(row, default_category)
+        else:
+            raise ValueError(f"Unknown format: {fmt}")
+
+
+def filter_records(records, categories=None, min_id=None, max_id=None):
+    """Yields (id, record) pairs that pass the category and ID range filters.
+
+    The ID of a question is its 0-based position in the input file.
+    """
+    wanted = {c.lower() for c in categories} if categories else None
+    for qid, q in enumerate(records):
+        if min_id is not None and qid < min_id:
+            continue
+        if max_id is not None and qid > max_id:
+            return  # Input is in ID order, nothing more can match
+        if wanted is not None and q.get("category", "General").lower() not in wanted:
+            continue
+        yield qid, q
+
+
+def csv_row(q):
+    options = q.get("options", {})
+    return [
+        q.get("question", ""),
+        options.get("A", ""),
+        options.get("B", ""),
+        options.get("C", ""),
+        options.get("D", ""),
+        q.get("correctAnswer", ""),
+        q.get("category", "General"),
+    ]
+
+
+def write_records(records, path, fmt):
+    """Writes question dicts to path one at a time and returns how many were written."""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            for q in records:
+                writer.writerow(csv_row(q))
+                count += 1
+        elif fmt == "jsonl":
+            for q in records:
+                f.write(json.dumps(q, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        elif fmt == "json":
+            # Same layout as questions_and_choices.json, written element by element
+            f.write("[")
+            for q in records:
+                f.write(",\n" if count else "\n")
+                f.write("    " + json.dumps(q, indent=4, ensure_ascii=False).replace("\n", "\n    "))
+                count += 1
+            f.write("\n]\n" if count else "]\n")
+        else:
+            raise ValueError(f"Unknown format: {fmt}")
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the question bank between JSON, JSONL and CSV.")
+    parser.add_argument("input", nargs="?", default=DEFAULT_INPUT, help="file to read (default: %(default)s)")
+    parser.add_argument("output", nargs="?", default=DEFAULT_OUTPUT, help="file to write (default: %(default)s)")
+    parser.add_argument("--from", dest="src_format", choices=FORMATS, help="input format (default: from extension)")
+    parser.add_argument("--to", dest="dst_format", choices=FORMATS, help="output format (default: from extension)")
+    parser.add_argument("--category", action="append", help="only keep this category (repeatable)")
+    parser.add_argument("--min-id", type=int, help="first question ID to keep (0-based, inclusive)")
+    parser.add_argument("--max-id", type=int, help="last question ID to keep (inclusive)")
+    parser.add_argument("--default-category", default="General", help="category for CSV rows without one")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    src_format = args.src_format or detect_format(args.input)
+    dst_format = args.dst_format or detect_format(args.output)
+
+    records = read_records(args.input, src_format, args.default_category)
+    selected = (q for _, q in filter_records(records, args.category, args.min_id, args.max_id))
+    count = write_records(selected, args.output, dst_format)
+
+    print(f"✅ Exported {count} questions to {args.output}")
+
 
-# Paths (adjust if needed)
-json_file = "questions_and_choices.json"
-csv_file = "exported_questions.csv"
-
-# Load JSON
-with open(json_file, 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
-# Write CSV
-with open(csv_file, 'w', encoding='utf-8', newline='') as f:
-    writer = csv.writer(f)
-    writer.writerow(["Question", "Option A", "Option B", "Option C", "Option D", "Correct Answer", "Category"])
-
-    for q in data:
-        writer.writerow([
-            q.get("question", ""),
-            q.get("options", {}).get("A", ""),
-            q.get("options", {}).get("B", ""),
-            q.get("options", {}).get("C", ""),
-            q.get("options", {}).get("D", ""),
-            q.get("correctAnswer", ""),
-            q.get("category", "General")
-        ])
-
-print(f"✅ Exported {len(data)} questions to {csv_file}")
+if __name__ == "__main__":
+    try:
+        main()
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Thin terminal station for station_server.py.
+
+Draws whatever the server sends and forwards key presses; all game rules
+and timers live on the server.
+
+Run:
+    python3 station_client.py --host <server ip> --port 8790
+"""
+
+import argparse
+import curses
+import json
+import socket
+import threading
+import time
+
+
+class Connection:
+    """Reads server messages on a background thread, keeping only the latest screen."""
+
+    def __init__(self, host, port):
+        self.sock = socket.create_connection((host, port))
+        self.lock = threading.Lock()
+        self.screen = {"type": "connecting"}
+        self.deadline = None
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.sock.makefile("r", encoding="utf-8"):
+            message = json.loads(line)
+            with self.lock:
+                if message["type"] == "question":
+                    self.deadline = time.time() + message["time_left"]
+                    self.screen = message
+                elif message["type"] == "feedback":
+                    self.screen = dict(self.screen, feedback=message, score=message["score"])
+                else:
+                    self.deadline = None
+                    self.screen = message
+        with self.lock:
+            self.screen = {"type": "disconnected"}
+
+    def send_key(self, key):
+        self.sock.sendall((key + "\n").encode())
+
+
+def draw(win, screen, time_left):
+    """Renders one server message with the same layout as s_mode_interface_sim.py."""
+    bold = curses.color_pair(1) | curses.A_BOLD
+    win.erase()
+    kind = screen["type"]
+
+    if kind == "ready":
+        win.addstr(2, 2, "Ready to start the game? Press any key to begin (or 'q' to quit)...", bold)
+    elif kind == "question":
+        win.addstr(1, 2, f"Time Left: {time_left}s", bold)
+        win.addstr(1, 50, f"Score: {screen['score']}", bold)
+        win.addstr(4, 2, screen["question"], bold)
+        feedback = screen.get("feedback")
+        for i, (key, value) in enumerate(screen["options"].items(), start=6):
+            highlight = feedback and not feedback["correct"] and key == feedback["correct_answer"]
+            win.addstr(i, 4, f"  {key}. {value}", (curses.color_pair(2) if highlight else curses.color_pair(1)) | curses.A_BOLD)
+        if feedback:
+            if feedback["correct"]:
+                win.addstr(10, 4, f"Correct! You chose: {feedback['answer']}", curses.color_pair(2) | curses.A_BOLD)
+            else:
+                win.addstr(10, 4, f"Incorrect! You chose: {feedback['answer']}", curses.color_pair(3) | curses.A_BOLD)
+    elif kind == "game_over":
+        win.addstr(5, 10, f"Game over! Your score is: {screen['score']}", bold)
+    else:
+        win.addstr(2, 2, f"{kind.capitalize()}...", bold)
+    win.refresh()
+
+
+def client_loop(stdscr, conn):
+    curses.start_color()
+    curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)
+    curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_WHITE)
+    curses.init_pair(3, curses.COLOR_RED, curses.COLOR_WHITE)
+    stdscr.bkgd(curses.color_pair(1))
+    curses.curs_set(0)
+
+    shown = None
+    while True:
+        with conn.lock:
+            screen, deadline = conn.screen, conn.deadline
+        time_left = max(int(deadline - time.time() + 0.999), 0) if deadline else None
+        if (screen, time_left) != shown:
+            draw(stdscr, screen, time_left)
+            shown = (screen, time_left)
+        if screen["type"] == "disconnected":
+            stdscr.timeout(-1)
+            stdscr.getch()
+            return
+
+        # Wake for a key, the next countdown second, or a server message (checked every 50 ms)
+        stdscr.timeout(50)
+        key = stdscr.getch()
+        if key == ord('q'):
+            return
+        if 0 <= key < 256:
+            conn.send_key(chr(key))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Terminal station for the SweeTrivia station server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8790)
+    args = parser.parse_args()
+
+    conn = Connection(args.host, args.port)
+    try:
+        curses.wrapper(client_loop, conn)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
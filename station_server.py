@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Standard-mode game server for a room of stations.
+
+One process holds the question bank, the shuffle deck and every station's
+game; stations are thin clients that draw what the server sends and send
+back key presses. All round and feedback timers share one scheduler task.
+
+Protocol (TCP, one message per line):
+  client -> server:  a key ("A".."D", any key to start, "q" to leave)
+                     or JSON {"key": "A"}
+  server -> client:  JSON objects with a "type" of
+                     ready | question | feedback | game_over
+
+Browsers can connect over websocket on --ws-port when the `websockets`
+package is installed (pip3 install websockets).
+
+Run:
+    python3 station_server.py --port 8790
+"""
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import sys
+
+from trivia_core.bank import QuestionBank
+from trivia_core.deck import QuestionDeck
+from trivia_core.engine import GAME_OVER, IDLE, QUESTION, TriviaEngine
+from trivia_core.telemetry import TelemetryRecorder
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+
+GAME_OVER_SECONDS = 3  # Score stays up this long before the station is ready again
+DECK_SAVE_SECONDS = 30
+
+
+class Scheduler:
+    """One timer heap for every station instead of a sleeping task per game."""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def call_at(self, when, station, generation):
+        seq = next(self._seq)
+        heapq.heappush(self._heap, (when, seq, station, generation))
+        if self._heap[0][1] == seq:
+            self._wakeup.set()  # New earliest deadline, re-arm the sleep
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, station, generation = heapq.heappop(self._heap)
+                if generation == station.generation:  # Skip timers a key press made stale
+                    station.on_timer()
+
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+class Station:
+    """One connected station: its engine plus a way to send it messages."""
+
+    def __init__(self, server, name, send):
+        self.server = server
+        self.name = name
+        self.send = send
+        self.generation = 0  # Bumped whenever pending timers should be ignored
+        self.restart_at = None
+        loop = asyncio.get_running_loop()
+        self.engine = TriviaEngine(
+            lambda: server.bank.snapshot().questions,
+            clock=loop.time,
+            round_seconds=server.round_seconds,
+            picker=lambda questions: server.deck.draw("standard", len(questions)),
+        )
+        if server.telemetry is not None:
+            server.telemetry.attach(self.engine, station=next(server.station_ids) & 0xFFFF)
+
+    def ready(self):
+        self.engine.reset()
+        self.restart_at = None
+        self.send({"type": "ready"})
+
+    def on_key(self, key):
+        key = key.strip().upper()[:1]
+        state = self.engine.state
+        if state == IDLE:  # Any key starts, including space
+            self.engine.start()
+            self._send_question()
+        elif state == QUESTION and key:
+            self.engine.answer(key)
+            self._send_feedback()
+        if self.engine.state != state:
+            self._schedule()  # Otherwise the pending timer still stands
+
+    def on_timer(self):
+        engine = self.engine
+        if self.restart_at is not None:
+            self.ready()
+            return
+        before = engine.question
+        state = engine.tick()
+        if state == GAME_OVER:
+            self.send({"type": "game_over", "score": engine.score})
+            self.restart_at = engine.clock() + GAME_OVER_SECONDS
+        elif state == QUESTION and engine.question is not before:
+            self._send_question()
+        self._schedule()
+
+    def _schedule(self):
+        self.generation += 1
+        when = self.restart_at if self.restart_at is not None else self.engine.next_deadline()
+        if when is not None:
+            self.server.scheduler.call_at(when, self, self.generation)
+
+    def _send_question(self):
+        engine = self.engine
+        question, options, _ = engine.question
+        self.send({
+            "type": "question",
+            "question": question,
+            "options": options,
+            "score": engine.score,
+            "time_left": round(engine.end_time - engine.clock(), 3),
+        })
+
+    def _send_feedback(self):
+        engine = self.engine
+        self.send({
+            "type": "feedback",
+            "answer": engine.last_answer,
+            "correct": engine.last_correct,
+            "correct_answer": engine.question[2],
+            "score": engine.score,
+        })
+
+    def close(self):
+        self.generation += 1  # Drop any timers still queued for this station
+
+
+class StationServer:
+    def __init__(self, bank, deck, round_seconds=10, telemetry=None):
+        self.bank = bank
+        self.deck = deck
+        self.round_seconds = round_seconds
+        self.telemetry = telemetry
+        self.station_ids = itertools.count()
+        self.scheduler = None
+        self.stations = set()
+
+    async def handle_tcp(self, reader, writer):
+        peer = writer.get_extra_info("peername")
+        name = f"{peer[0]}:{peer[1]}" if peer else "station"
+
+        flush = asyncio.Event()
+
+        def send(message):
+            writer.write((json.dumps(message) + "\n").encode())
+            flush.set()  # Timer messages get drained too, not just replies to keys
+
+        async def drain():
+            try:
+                while True:
+                    await flush.wait()
+                    flush.clear()
+                    await writer.drain()
+            except ConnectionError:
+                pass
+
+        station = self._open(name, send)
+        drainer = asyncio.ensure_future(drain())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                key = _parse_key(line.decode(errors="replace"))
+                if key.lower() == "q":
+                    break
+                station.on_key(key)
+        except ConnectionError:
+            pass
+        finally:
+            self._close(station)
+            drainer.cancel()
+            writer.close()
+
+    async def handle_ws(self, websocket, path=None):
+        peer = websocket.remote_address
+        name = f"ws {peer[0]}:{peer[1]}" if peer else "ws station"
+
+        def send(message):
+            asyncio.ensure_future(websocket.send(json.dumps(message)))
+
+        station = self._open(name, send)
+        try:
+            async for message in websocket:
+                key = _parse_key(message)
+                if key.lower() == "q":
+                    break
+                station.on_key(key)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self._close(station)
+
+    def _open(self, name, send):
+        station = Station(self, name, send)
+        self.stations.add(station)
+        logging.info(f"Station {name} connected ({len(self.stations)} active)")
+        station.ready()
+        return station
+
+    def _close(self, station):
+        station.close()
+        self.stations.discard(station)
+        logging.info(f"Station {station.name} left ({len(self.stations)} active)")
+
+    async def save_deck_periodically(self):
+        while True:
+            await asyncio.sleep(DECK_SAVE_SECONDS)
+            self.deck.save()
+
+    async def serve(self, host, port, ws_port=None):
+        self.scheduler = Scheduler()
+        tasks = [asyncio.ensure_future(self.scheduler.run()),
+                 asyncio.ensure_future(self.save_deck_periodically())]
+        server = await asyncio.start_server(self.handle_tcp, host, port)
+        logging.info(f"Stations can connect to tcp://{host}:{port}")
+
+        ws_server = None
+        if ws_port is not None:
+            if websockets is None:
+                logging.warning("websockets isn't installed, browser stations are disabled")
+            else:
+                ws_server = await websockets.serve(self.handle_ws, host, ws_port)
+                logging.info(f"Browser stations can connect to ws://{host}:{ws_port}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if ws_server is not None:
+                ws_server.close()
+                await ws_server.wait_closed()
+            for task in tasks:
+                task.cancel()
+            self.deck.save()
+
+
+def _parse_key(text):
+    text = text.strip()
+    if text.startswith("{"):
+        try:
+            return str(json.loads(text).get("key", ""))
+        except (ValueError, AttributeError):
+            return ""
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SweeTrivia standard-mode server for many stations.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--ws-port", type=int, help="also accept browser stations over websocket")
+    parser.add_argument("--round-seconds", type=int, default=10)
+    parser.add_argument("--no-telemetry", action="store_true", help="don't log answer times and choices")
+    args = parser.parse_args()
+
+    bank = QuestionBank()
+    bank.start_watching()
+    deck = QuestionDeck(autosave=False)  # Saved every DECK_SAVE_SECONDS instead of per draw
+    telemetry = None if args.no_telemetry else TelemetryRecorder()
+    server = StationServer(bank, deck, args.round_seconds, telemetry)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.ws_port))
+    except KeyboardInterrupt:
+        logging.info("Server stopped by user")
+    finally:
+        if telemetry is not None:
+            telemetry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trivia_core.bank import DEFAULT_BANK_PATH, BankSnapshot, QuestionBank, load_questions, valid_question
+from trivia_core.engine import LABELS, question_parts
+
+
+class BankValidationTest(unittest.TestCase):
+    def test_every_question_in_the_real_bank_can_be_answered(self):
+        snapshot = QuestionBank(DEFAULT_BANK_PATH).snapshot()
+        self.assertGreater(len(snapshot), 0)
+        for q in snapshot.questions:
+            text, options, correct = question_parts(q)
+            self.assertTrue(text.strip())
+            self.assertIn(correct, tuple(LABELS), text)
+            for label in LABELS:
+                self.assertTrue(str(options[label]).strip(), f"{text}: option {label} is empty")
+
+    def test_unanswerable_questions_are_left_out(self):
+        bank = load_questions(DEFAULT_BANK_PATH)
+        snapshot = BankSnapshot(bank)
+        self.assertEqual(len(snapshot) + snapshot.skipped, len(bank))
+        texts = {q["question"] for q in snapshot.questions}
+        self.assertNotIn("The Sun is a star.", texts)  # TRUE/FALSE with empty C/D options
+
+    def test_valid_question(self):
+        good = {"question": "2 + 2?", "options": {"A": "3", "B": "4", "C": "5", "D": "6"}, "correctAnswer": "B"}
+        self.assertTrue(valid_question(good))
+        self.assertFalse(valid_question(dict(good, correctAnswer=None)))
+        self.assertFalse(valid_question(dict(good, correctAnswer="E")))
+        self.assertFalse(valid_question(dict(good, question=" ")))
+        self.assertFalse(valid_question(dict(good, options={"A": "3", "B": "4", "C": "", "D": ""})))
+        self.assertFalse(valid_question({"question": "No options", "correctAnswer": "A"}))
+        # Flappy-style questions (options list, "correct" key) are fine too
+        self.assertTrue(valid_question({"question": "5 + 5?", "options": ["8", "9", "10", "11"], "correct": "C"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
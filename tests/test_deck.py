@@ -0,0 +1,55 @@
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trivia_core.deck import QuestionDeck
+
+
+class SharedDeckFileTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "decks")
+
+    def test_processes_keep_each_others_categories(self):
+        standard = QuestionDeck(self.path, rng=random.Random(1))
+        flappy = QuestionDeck(self.path, rng=random.Random(2))
+        standard.draw("standard", 10)
+        flappy.draw("flappy", 3)  # Full rewrite by a process that never saw "standard"
+        for _ in range(3):
+            standard.draw("standard", 10)  # Cursor patch after the other process rewrote the file
+
+        on_disk = QuestionDeck(self.path)
+        self.assertEqual(sorted(on_disk._decks), ["flappy", "standard"])
+        self.assertEqual(on_disk._decks["standard"].cursor, 4)
+        self.assertEqual(on_disk._decks["flappy"].cursor, 1)
+
+    def test_cursor_saves_patch_in_place(self):
+        deck = QuestionDeck(self.path, rng=random.Random(1))
+        deck.draw("standard", 10)
+        inode = os.stat(self.path).st_ino
+        for _ in range(3):
+            deck.draw("standard", 10)  # Our own patches mustn't look like someone else's rewrite
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+        self.assertEqual(QuestionDeck(self.path)._decks["standard"].cursor, 4)
+
+    def test_damaged_deck_is_rebuilt(self):
+        deck = QuestionDeck(self.path, rng=random.Random(1))
+        deck.draw("standard", 10)
+        data = bytearray(open(self.path, "rb").read())
+        name_len = data[8]
+        struct.pack_into("<I", data, 8 + 14 + name_len, 999)  # First order entry out of range
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+        reloaded = QuestionDeck(self.path, rng=random.Random(1))
+        self.assertNotIn("standard", reloaded._decks)
+        drawn = {reloaded.draw("standard", 10) for _ in range(10)}
+        self.assertEqual(drawn, set(range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flappy_core.obstacles import PICKUP, ObstaclePool
+
+
+class ObstaclePoolTest(unittest.TestCase):
+    def test_release_among_equal_left_edges(self):
+        pool = ObstaclePool(4)
+        first, middle, last = (pool.spawn(100, y, 40, 50) for y in (0, 100, 200))
+        pool.release(middle)
+
+        self.assertEqual(pool.active(), [first, last])
+        self.assertEqual(pool.overlapping(110, 0, 10, 300), [first, last])
+        pool.release(last)
+        pool.release(first)
+        self.assertEqual(len(pool), 0)
+
+    def test_widest_gone(self):
+        pool = ObstaclePool(4)
+        wide = pool.spawn(0, 0, 300, 620)
+        narrow = pool.spawn(400, 0, 40, 620)
+        pool.scroll(350)  # The wide one is off screen, the narrow one is at x=50
+
+        self.assertEqual(pool.active(), [narrow])
+        self.assertEqual(pool.overlapping(0, 0, 40, 620), [])
+        self.assertEqual(pool.overlapping(60, 0, 10, 620), [narrow])
+        self.assertEqual(pool.gone[0], wide)
+        pool.scroll(100)
+        self.assertEqual(pool._widest, 0.0)  # Empty pool: the bound starts over
+
+        small = pool.spawn(0, 0, 20, 20, PICKUP)
+        self.assertEqual(pool.overlapping(15, 0, 10, 10), [small])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1)
+        pool = ObstaclePool(16)
+        for _ in range(500):
+            if rng.random() < 0.6:
+                pool.spawn(rng.choice((0, 200, 1200, rng.randrange(1200))), rng.randrange(600),
+                           rng.choice((20, 40, 300)), rng.randrange(1, 620))
+            elif len(pool):
+                pool.release(rng.choice(pool.active()))
+            freed = pool.scroll(rng.randrange(20))
+            self.assertEqual(len(set(pool.gone[:freed]) & set(pool.active())), 0)
+
+            active = pool.active()
+            self.assertEqual([pool.left[s] for s in active], sorted(pool.left[s] for s in active))
+            x, y = rng.randrange(1200), rng.randrange(600)
+            expected = [s for s in active
+                        if pool.x(s) < x + 50 and pool.x(s) + pool.width[s] > x
+                        and pool.top[s] < y + 40 and pool.top[s] + pool.height[s] > y]
+            self.assertEqual(sorted(pool.overlapping(x, y, 50, 40)), sorted(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
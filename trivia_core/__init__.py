@@ -0,0 +1 @@
+"""Shared game logic for the SweeTrivia front-ends (curses, Pico, pygame)."""
@@ -0,0 +1,322 @@
+import contextlib
+import ctypes
+import ctypes.util
+import fcntl
+import json
+import os
+import select
+import struct
+import tempfile
+import threading
+
+from trivia_core.engine import LABELS, question_parts
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BANK_PATH = os.path.join(REPO_DIR, "standard_code", "public", "data", "questions_and_choices.json")
+
+POLL_INTERVAL = 1.0    # Seconds between mtime checks when inotify isn't available
+SETTLE_DELAY = 0.05    # Let a burst of file events finish before reloading
+
+# inotify flags (see <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+def load_questions(path=DEFAULT_BANK_PATH):
+    """Reads the question bank JSON (a list of question dicts)."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"{path} does not contain a list of questions")
+    return data
+
+
+def valid_question(q):
+    """True if a question can be asked and won: text, four non-empty options A-D and a correct answer A-D."""
+    try:
+        text, options, correct = question_parts(q)
+    except (KeyError, TypeError, AttributeError):
+        return False
+    if not isinstance(text, str) or not text.strip() or not isinstance(options, dict):
+        return False
+    if any(not str(options.get(label) or "").strip() for label in LABELS):
+        return False
+    return correct is not None and correct in tuple(LABELS)
+
+
+def atomic_write_json(path, data):
+    """Writes JSON to a temp file next to path, then renames it into place.
+
+    Readers either see the old file or the complete new one, never a
+    half-written bank.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def bank_lock(path=DEFAULT_BANK_PATH):
+    """Holds an exclusive lock on the bank (a sidecar .lock file) across processes."""
+    with open(path + ".lock", "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def merge_questions(existing, new_rows):
+    """Appends rows whose question text isn't in the bank yet; returns how many were added."""
+    seen = {q["question"] for q in existing}
+    added = 0
+    for q in new_rows:
+        if q["question"] not in seen:
+            seen.add(q["question"])
+            existing.append(q)
+            added += 1
+    return added
+
+
+def _write_journal(journal_path, new_rows):
+    with open(journal_path, "w", encoding="utf-8") as f:
+        for q in new_rows:
+            f.write(json.dumps(q, ensure_ascii=False) + "\n")
+        f.write(json.dumps({"commit": len(new_rows)}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_journal(journal_path):
+    """Returns the rows of a committed journal, or None if it was never finished."""
+    rows = []
+    try:
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if "commit" in entry:
+                    return rows if entry["commit"] == len(rows) else None
+                rows.append(entry)
+    except ValueError:
+        pass  # Torn last line, the writer died mid-journal
+    return None
+
+
+def recover_journal(path=DEFAULT_BANK_PATH):
+    """Finishes an append that crashed after journaling; call with the lock held."""
+    journal_path = path + ".journal"
+    if not os.path.exists(journal_path):
+        return 0
+    rows = _read_journal(journal_path)
+    added = 0
+    if rows:
+        existing = load_questions(path) if os.path.exists(path) else []
+        added = merge_questions(existing, rows)
+        if added:
+            atomic_write_json(path, existing)
+    os.remove(journal_path)
+    return added
+
+
+def append_questions(path, new_rows):
+    """Safely appends questions to the bank while other writers may be doing the same.
+
+    Under the bank lock: replay any journal left by a crashed writer, log
+    the new rows to the journal, merge them into the freshly read bank and
+    rename the result into place. Returns how many rows were new.
+    """
+    new_rows = list(new_rows)
+    journal_path = path + ".journal"
+    with bank_lock(path):
+        recover_journal(path)
+        existing = load_questions(path) if os.path.exists(path) else []
+        _write_journal(journal_path, new_rows)
+        added = merge_questions(existing, new_rows)
+        if added:
+            atomic_write_json(path, existing)
+        os.remove(journal_path)
+    return added
+
+
+class BankSnapshot:
+    """An immutable, indexed view of the question bank at one point in time."""
+
+    def __init__(self, questions, version=0):
+        questions = list(questions)
+        self.questions = tuple(q for q in questions if valid_question(q))
+        self.skipped = len(questions) - len(self.questions)  # Unanswerable questions left out
+        self.version = version
+        by_category = {}
+        for i, q in enumerate(self.questions):
+            by_category.setdefault(q.get("category", "General"), []).append(i)
+        self.by_category = {name: tuple(idx) for name, idx in by_category.items()}
+
+    def __len__(self):
+        return len(self.questions)
+
+    def categories(self):
+        return sorted(self.by_category)
+
+    def in_category(self, category):
+        """Question indexes for a category (all questions if category is None)."""
+        if category is None:
+            return range(len(self.questions))
+        return self.by_category.get(category, ())
+
+
+class QuestionBank:
+    """Loads the question bank and keeps it fresh while the game is running.
+
+    The watcher thread parses and indexes a changed file in the background
+    and then swaps the whole snapshot in with a single assignment. Games
+    should call snapshot() once per question and use that object until the
+    next question, so a reload never lands halfway through one.
+    """
+
+    def __init__(self, path=DEFAULT_BANK_PATH, fallback=None):
+        self.path = path
+        self._listeners = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._file_id = None
+        try:
+            self._snapshot = self._build(1)
+        except (OSError, ValueError) as e:
+            if fallback is None:
+                raise
+            print(f"Using built-in questions, couldn't load {path}: {e}")
+            self._snapshot = BankSnapshot(fallback, 0)
+
+    def snapshot(self):
+        """Returns the current bank; safe to call from any thread."""
+        return self._snapshot
+
+    def on_reload(self, callback):
+        """Registers callback(snapshot), called from the watcher thread after a swap."""
+        self._listeners.append(callback)
+
+    def start_watching(self):
+        """Starts the background watcher (inotify on Linux, mtime polling elsewhere)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="bank-watcher", daemon=True)
+        self._thread.start()
+
+    def stop_watching(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def reload(self):
+        """Reloads now if the file changed; returns True if a new bank was swapped in."""
+        if self._stat_id() == self._file_id:
+            return False
+        try:
+            snapshot = self._build(self._snapshot.version + 1)
+        except (OSError, ValueError) as e:
+            print(f"Keeping current question bank, reload failed: {e}")
+            return False
+        self._snapshot = snapshot
+        for callback in self._listeners:
+            callback(snapshot)
+        return True
+
+    def _build(self, version):
+        file_id = self._stat_id()
+        snapshot = BankSnapshot(load_questions(self.path), version)
+        if snapshot.skipped:
+            print(f"⚠️ Skipped {snapshot.skipped} question(s) in {self.path} without text, options A-D and a correct answer")
+        if not snapshot.questions:
+            raise ValueError(f"{self.path} has no usable questions")
+        self._file_id = file_id
+        return snapshot
+
+    def _stat_id(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _watch(self):
+        fd = _inotify_watch(os.path.dirname(os.path.abspath(self.path)))
+        if fd is None:
+            self._poll()
+            return
+        try:
+            self._watch_inotify(fd)
+        finally:
+            os.close(fd)
+
+    def _poll(self):
+        while not self._stop.wait(POLL_INTERVAL):
+            self.reload()
+
+    def _watch_inotify(self, fd):
+        name = os.path.basename(self.path).encode()
+        while not self._stop.is_set():
+            ready, _, _ = select.select([fd], [], [], POLL_INTERVAL)
+            if not ready:
+                continue
+            if not _read_inotify_names(fd, name):
+                continue
+            # Let the writer finish its rename before we look
+            self._stop.wait(SETTLE_DELAY)
+            _read_inotify_names(fd, name)
+            self.reload()
+
+
+def _inotify_watch(directory):
+    """Returns an inotify fd watching directory, or None if inotify is unavailable."""
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return None
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        init = libc.inotify_init1
+        add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+
+    fd = init(IN_NONBLOCK | IN_CLOEXEC)
+    if fd < 0:
+        return None
+    mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    if add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _read_inotify_names(fd, name):
+    """Drains pending inotify events; True if any of them were for name."""
+    hit = False
+    while True:
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            return hit
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            if data[offset:offset + length].rstrip(b"\0") == name:
+                hit = True
+            offset += length
@@ -0,0 +1,232 @@
+import os
+import random
+import struct
+import sys
+from array import array
+
+from trivia_core.bank import bank_lock
+
+# Where decks are kept between sessions. Point this at a shared folder to
+# carry a player's progress across devices.
+DEFAULT_DECK_PATH = os.environ.get(
+    "SWEETRIVIA_DECK_FILE", os.path.join(os.path.expanduser("~"), ".sweetrivia_decks")
+)
+
+MAGIC = b"SWDK"
+VERSION = 1
+NO_CARD = 0xFFFFFFFF
+
+_FILE_HEADER = struct.Struct("<4sHH")      # magic, version, number of decks
+_DECK_HEADER = struct.Struct("<HIII")      # name length, size, cursor, last drawn
+_CURSOR = struct.Struct("<I")
+
+
+class _Deck:
+    """One category: a shuffled permutation of question indexes and a cursor."""
+
+    def __init__(self, order=None, cursor=0, last=NO_CARD):
+        self.order = order if order is not None else array("I")
+        self.cursor = cursor
+        self.last = last
+        self.cursor_offset = None  # Byte offset of the cursor in the deck file
+
+
+class QuestionDeck:
+    """Persistent no-repeat question picker.
+
+    Each category keeps a shuffled permutation of the indexes 0..size-1 and
+    a cursor into it. Drawing just reads the next slot, so a player only
+    sees a repeat after the whole category has been dealt. New questions are
+    shuffled into the part of the deck that hasn't been dealt yet.
+
+    Several games share one deck file, each with its own categories. Saves
+    hold a lock on it, and a full rewrite first takes in the categories
+    other processes saved since this one last read the file.
+    """
+
+    def __init__(self, path=DEFAULT_DECK_PATH, rng=random, autosave=True):
+        self.path = path
+        self.rng = rng
+        self.autosave = autosave
+        self._decks = {}
+        self._layout_dirty = False   # Needs a full rewrite (shuffle/grow/new deck)
+        self._cursor_dirty = set()   # Only the cursor moved, patch in place
+        self._changed = set()        # Categories this process changed since its last save
+        self._file_id = None         # The deck file as of our last read/write; cursor offsets are only valid for it
+        if path and os.path.exists(path):
+            try:
+                with bank_lock(path):  # Same sidecar .lock scheme as the question bank
+                    self._decks = self._read()
+            except (OSError, ValueError, struct.error) as e:
+                print(f"Ignoring unreadable deck file {path}: {e}")
+                self._decks = {}
+
+    def draw(self, category, size):
+        """Returns the next question index in [0, size) for this category."""
+        if size <= 0:
+            raise ValueError(f"No questions to draw from in {category!r}")
+
+        deck = self._decks.get(category)
+        if deck is None:
+            deck = self._decks[category] = _Deck()
+        if len(deck.order) != size:
+            self._resize(deck, size)
+
+        if deck.cursor >= len(deck.order):
+            self._reshuffle(deck)
+
+        index = deck.order[deck.cursor]
+        deck.cursor += 1
+        deck.last = index
+        self._cursor_dirty.add(category)
+        self._changed.add(category)
+
+        if self.autosave:
+            self.save()
+        return index
+
+    def remaining(self, category):
+        """How many questions are left before this category reshuffles."""
+        deck = self._decks.get(category)
+        return len(deck.order) - deck.cursor if deck else 0
+
+    def reset(self, category):
+        """Forgets a category's progress; it is reshuffled on the next draw."""
+        if self._decks.pop(category, None) is not None:
+            self._layout_dirty = True
+            self._changed.add(category)
+            if self.autosave:
+                self.save()
+
+    def _resize(self, deck, size):
+        order = deck.order
+        old_size = len(order)
+
+        if size < old_size:
+            # Bank shrank: drop indexes that no longer exist, keep the rest in order
+            dealt = sum(1 for i in order[:deck.cursor] if i < size)
+            deck.order = array("I", (i for i in order if i < size))
+            deck.cursor = dealt
+        else:
+            # Bank grew: deal each new question into a random undealt slot
+            for index in range(old_size, size):
+                order.append(index)
+                slot = self.rng.randrange(deck.cursor, len(order))
+                order[slot], order[-1] = order[-1], order[slot]
+        self._layout_dirty = True
+
+    def _reshuffle(self, deck):
+        order = deck.order
+        for i in range(len(order) - 1, 0, -1):
+            j = self.rng.randrange(i + 1)
+            order[i], order[j] = order[j], order[i]
+        # Don't start the new pass with the question that ended the last one
+        if len(order) > 1 and order[0] == deck.last:
+            j = self.rng.randrange(1, len(order))
+            order[0], order[j] = order[j], order[0]
+        deck.cursor = 0
+        self._layout_dirty = True
+
+    def save(self):
+        """Writes pending changes; cursor-only updates are patched in place."""
+        if not self.path or not (self._layout_dirty or self._cursor_dirty or not os.path.exists(self.path)):
+            return
+        with bank_lock(self.path):
+            exists = os.path.exists(self.path)
+            # Someone else rewrote the file since we read it, so our cursor offsets are stale
+            moved = exists and self._stat_id() != self._file_id
+            if self._layout_dirty or moved or not exists:
+                if exists:
+                    self._merge_from_disk()  # Keep what other processes saved in their categories
+                self._write_all()
+            elif self._cursor_dirty:
+                self._write_cursors()
+        self._layout_dirty = False
+        self._cursor_dirty.clear()
+        self._changed.clear()
+
+    def _merge_from_disk(self):
+        """Takes the file's version of every category this process hasn't changed."""
+        try:
+            on_disk = self._read()
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Overwriting unreadable deck file {self.path}: {e}")
+            return
+        for name, deck in on_disk.items():
+            if name not in self._changed:
+                self._decks[name] = deck
+
+    def _stat_id(self):
+        st = os.stat(self.path)
+        # Full writes replace the file, and a freed inode can come back with the same size, so the
+        # modification time is part of it too; our own cursor patches re-read it under the lock
+        return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _write_all(self):
+        tmp_path = self.path + ".tmp"
+        offset = _FILE_HEADER.size
+        with open(tmp_path, "wb") as f:
+            f.write(_FILE_HEADER.pack(MAGIC, VERSION, len(self._decks)))
+            for name, deck in self._decks.items():
+                raw_name = name.encode("utf-8")
+                f.write(_DECK_HEADER.pack(len(raw_name), len(deck.order), deck.cursor, deck.last))
+                f.write(raw_name)
+                deck.cursor_offset = offset + 6  # After name length and size
+                offset += _DECK_HEADER.size + len(raw_name)
+
+                order = deck.order
+                if sys.byteorder == "big":
+                    order = array("I", order)
+                    order.byteswap()
+                order.tofile(f)
+                offset += len(deck.order) * deck.order.itemsize
+        os.replace(tmp_path, self.path)
+        self._file_id = self._stat_id()
+
+    def _write_cursors(self):
+        with open(self.path, "r+b") as f:
+            for name in self._cursor_dirty:
+                deck = self._decks.get(name)
+                if deck is None or deck.cursor_offset is None:
+                    continue
+                f.seek(deck.cursor_offset)
+                f.write(_CURSOR.pack(deck.cursor))
+                f.write(_CURSOR.pack(deck.last))
+        self._file_id = self._stat_id()
+
+    def _read(self):
+        """Parses the deck file; a category whose order isn't a permutation is dropped and reshuffled on its next draw."""
+        with open(self.path, "rb") as f:
+            data = f.read()
+            file_id = self._stat_id()
+
+        magic, version, count = _FILE_HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a deck file")
+
+        decks = {}
+        offset = _FILE_HEADER.size
+        for _ in range(count):
+            name_len, size, cursor, last = _DECK_HEADER.unpack_from(data, offset)
+            cursor_offset = offset + 6
+            offset += _DECK_HEADER.size
+            name = data[offset:offset + name_len].decode("utf-8")
+            offset += name_len
+
+            order = array("I")
+            end = offset + size * order.itemsize
+            if end > len(data):
+                raise ValueError("truncated deck file")
+            order.frombytes(data[offset:end])
+            if sys.byteorder == "big":
+                order.byteswap()
+            offset = end
+
+            if len(set(order)) != size or (size and max(order) >= size):
+                print(f"Rebuilding damaged deck {name!r} in {self.path}")
+                continue
+            deck = _Deck(order, min(cursor, size), last)
+            deck.cursor_offset = cursor_offset
+            decks[name] = deck
+        self._file_id = file_id
+        return decks
@@ -0,0 +1,213 @@
+"""
+Candy dispenser client for the Arduino in servo_w_rpi/servo_w_rpi.ino.
+
+The Arduino listens at I2C address 0x08: writing 1-4 spins that servo, and
+reading a byte back returns the 0xAA ACK. A spin takes about two seconds
+and a command that arrives meanwhile is lost (the sketch clears its flag
+once the spin ends), so games must never call the bus inline. Dispenser.dispense() only queues a request;
+a background thread sends them one servo cycle apart, retries when the ACK
+doesn't come, merges repeated requests for the same slot and drops bursts
+beyond a small backlog.
+
+On the Pi, set SWEETRIVIA_DISPENSER_BUS=1 (for /dev/i2c-1, needs smbus2) and
+the games reward a finished round with candy. FakeDispenserBus stands in
+for the Arduino elsewhere.
+"""
+
+import os
+import random
+import threading
+import time
+from collections import deque
+
+ADDRESS = 0x08
+ACK = 0xAA
+SLOTS = (1, 2, 3, 4)
+CYCLE_SECONDS = 2.2  # The sketch's rotateServo360: 2 x (500 + 500 + 50) ms, plus a margin
+
+
+class Dispenser:
+    def __init__(self, bus, address=ADDRESS, cycle_seconds=CYCLE_SECONDS, coalesce_seconds=0.5,
+                 max_pending=8, retries=3, retry_delay=0.05, clock=time.monotonic):
+        self.bus = bus
+        self.address = address
+        self.cycle_seconds = cycle_seconds        # Minimum time between two commands
+        self.coalesce_seconds = coalesce_seconds  # Same-slot requests this close together are one
+        self.max_pending = max_pending
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.clock = clock
+        self._pending = deque()  # (slot, time requested)
+        self._cond = threading.Condition()
+        self._sending = False
+        self._closed = False
+        self._next_send = 0.0
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.retried = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._send_loop, name="dispenser", daemon=True)
+        self._thread.start()
+
+    def dispense(self, slot=1):
+        """Queues one candy from slot 1-4 without waiting; returns False if it was merged or dropped."""
+        if slot not in SLOTS:
+            raise ValueError(f"Dispenser slot must be one of {SLOTS}, not {slot!r}")
+        now = self.clock()
+        with self._cond:
+            if self._closed:
+                return False
+            for pending_slot, requested in self._pending:
+                if pending_slot == slot and now - requested < self.coalesce_seconds:
+                    self.coalesced += 1
+                    return False
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending.append((slot, now))
+            self._cond.notify()
+        return True
+
+    def attach(self, engine, slot=1):
+        """Dispenses a candy whenever a round ends with points on the board."""
+        def on_event(engine, event, data):
+            if event == "game_over" and data:
+                self.dispense(slot)
+        engine.on_event(on_event)
+
+    def wait_idle(self, timeout=None):
+        """Blocks until everything queued was sent; returns False on timeout."""
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._sending:
+                left = None if end is None else end - time.monotonic()
+                if left is not None and left <= 0:
+                    return False
+                self._cond.wait(left)
+        return True
+
+    def close(self, drain=True, timeout=None):
+        """Stops the sender, first waiting up to timeout seconds for the queue to empty if drain."""
+        if drain:
+            self.wait_idle(timeout)
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def summary(self):
+        return (f"{self.sent} sent, {self.coalesced} merged, {self.dropped} dropped, "
+                f"{self.retried} retries, {self.failed} failed")
+
+    def _send_loop(self):
+        while True:
+            with self._cond:
+                while not self._closed and (not self._pending or self.clock() < self._next_send):
+                    if self._pending:
+                        self._cond.wait(self._next_send - self.clock())  # Servo still turning
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    return
+                slot, _ = self._pending.popleft()
+                self._sending = True
+
+            ok = self._send(slot)
+
+            with self._cond:
+                self._sending = False
+                if ok:
+                    self.sent += 1
+                else:
+                    self.failed += 1
+                self._next_send = self.clock() + self.cycle_seconds
+                self._cond.notify_all()
+            if not ok:
+                print(f"⚠️ Dispenser didn't acknowledge slot {slot} after {self.retries + 1} tries")
+
+    def _send(self, slot):
+        """One command with its ACK read; retried with backoff when the ACK is missing or wrong.
+
+        If the write went through and only the ACK read failed, just the read
+        is retried: writing again would spin the servo a second time.
+        """
+        written = False
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.retried += 1
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                if not written:
+                    self.bus.write_byte(self.address, slot)
+                    written = True
+                if self.bus.read_byte(self.address) == ACK:
+                    return True
+                written = False  # Garbled reply; send the command again
+            except OSError:
+                pass  # NACK or bus error
+        return False
+
+
+class FakeDispenserBus:
+    """Behaves like the Arduino sketch, for tests and benchmarks without the hardware.
+
+    A command that arrives while a servo is turning is ACKed but never
+    dispensed: the sketch's loop() clears shouldDispense once
+    rotateServo360 returns, throwing it away. lost counts the candies that
+    went missing that way. fail_rate makes a share of transfers raise
+    OSError, like a NACK on the real bus.
+    """
+
+    def __init__(self, cycle_seconds=CYCLE_SECONDS, fail_rate=0.0, seed=None, clock=time.monotonic):
+        self.cycle_seconds = cycle_seconds
+        self.fail_rate = fail_rate
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.dispensed = {slot: 0 for slot in SLOTS}
+        self.writes = 0
+        self.lost = 0
+        self.invalid = 0
+        self._busy_until = 0.0
+
+    def write_byte(self, address, value):
+        with self.lock:
+            self._fail(address)
+            self.writes += 1
+            if self.clock() < self._busy_until:
+                self.lost += 1  # Servo still turning: dropped when it stops
+            else:
+                self._spin(value)
+
+    def read_byte(self, address):
+        with self.lock:
+            self._fail(address)
+            return ACK
+
+    def total(self):
+        with self.lock:
+            return sum(self.dispensed.values())
+
+    def _fail(self, address):
+        if address != ADDRESS:
+            raise OSError(121, "Remote I/O error")  # Nothing at that address
+        if self.fail_rate and self.rng.random() < self.fail_rate:
+            raise OSError(121, "Remote I/O error")
+
+    def _spin(self, value):
+        if value in SLOTS:
+            self.dispensed[value] += 1
+            self._busy_until = self.clock() + self.cycle_seconds
+        else:
+            self.invalid += 1
+
+
+def open_dispenser():
+    """The dispenser on the I2C bus named by SWEETRIVIA_DISPENSER_BUS, or None when it isn't set."""
+    bus_number = os.environ.get("SWEETRIVIA_DISPENSER_BUS")
+    if not bus_number:
+        return None
+    from smbus2 import SMBus  # Only needed on the Pi: pip3 install smbus2
+    return Dispenser(SMBus(int(bus_number)))
@@ -0,0 +1,160 @@
+import random
+import time
+
+# Kept free of CPython-only modules so the Pico can run it under MicroPython.
+
+IDLE = "idle"            # Waiting for a player to start
+QUESTION = "question"    # A question is up and the player can answer
+FEEDBACK = "feedback"    # Showing Correct!/Incorrect! before the next question
+GAME_OVER = "game_over"  # Round finished (time or lives ran out)
+
+LABELS = "ABCD"
+
+
+def question_parts(q):
+    """Returns (text, options dict, correct key) for bank-style, flappy-style or tuple questions."""
+    if isinstance(q, tuple):
+        return q
+    options = q["options"]
+    if isinstance(options, list):
+        options = {LABELS[i]: option for i, option in enumerate(options)}
+    correct = q.get("correctAnswer", q.get("correct"))
+    return q["question"], options, correct
+
+
+class TriviaEngine:
+    """The rules of a trivia round with no UI attached.
+
+    Front-ends call start(), answer() and tick() and draw whatever state
+    they find. Time comes from `clock` and randomness from `rng`, so tests
+    and the simulator can run rounds with a fake clock and a seeded RNG.
+
+    questions is a list of question dicts, or a callable returning one
+    (e.g. lambda: bank.snapshot().questions) that is read once per
+    question. picker(questions) -> index overrides question selection,
+    e.g. to draw from a QuestionDeck.
+    """
+
+    def __init__(self, questions, clock=time.time, rng=random, round_seconds=10,
+                 feedback_seconds=1.5, points=10, lives=None, picker=None):
+        self.questions = questions
+        self.clock = clock
+        self.rng = rng
+        self.round_seconds = round_seconds        # None: no time limit
+        self.feedback_seconds = feedback_seconds  # None: stay until next_question()
+        self.points = points
+        self.start_lives = lives                  # None: no lives
+        self.picker = picker
+        self.listeners = []
+        self.reset()
+
+    def reset(self):
+        """Back to the start screen with a fresh score."""
+        self.state = IDLE
+        self.score = 0
+        self.lives = self.start_lives
+        self.start_time = None
+        self.end_time = None
+        self.feedback_until = None
+        self.question = None
+        self.question_index = None
+        self.question_time = None
+        self.last_answer = None
+        self.last_correct = None
+        self.answered = 0
+        self.used = set()
+
+    def on_event(self, callback):
+        """Registers callback(engine, event, data) for "start", "question", "answer" and "game_over"."""
+        self.listeners.append(callback)
+
+    def _emit(self, event, data=None):
+        for callback in self.listeners:
+            callback(self, event, data)
+
+    def start(self):
+        self.reset()
+        now = self.clock()
+        self.start_time = now
+        if self.round_seconds is not None:
+            self.end_time = now + self.round_seconds
+        self._emit("start")
+        self.next_question()
+
+    def time_left(self):
+        """Whole seconds left in the round (None when there is no timer)."""
+        if self.end_time is None:
+            return None
+        return max(self.round_seconds - int(self.clock() - self.start_time), 0)
+
+    def next_question(self):
+        questions = self.questions() if callable(self.questions) else self.questions
+        if not questions:
+            raise ValueError("No questions to ask")
+        index = self.picker(questions) if self.picker else self._pick(len(questions))
+        self.question_index = index
+        self.question = question_parts(questions[index])
+        self.question_time = self.clock()
+        self.state = QUESTION
+        self._emit("question", index)
+
+    def _pick(self, count):
+        """Random question without repeats inside this round."""
+        if len(self.used) >= count:
+            self.used.clear()
+        while True:
+            index = self.rng.randrange(count)
+            if index not in self.used:
+                self.used.add(index)
+                return index
+
+    def answer(self, key):
+        """Scores the player's choice for the current question; returns True if correct."""
+        if self.state != QUESTION:
+            return None
+        now = self.clock()
+        correct = key == self.question[2]
+        self.last_answer = key
+        self.last_correct = correct
+        self.answered += 1
+        if correct:
+            self.score += self.points
+        elif self.lives is not None:
+            self.lives -= 1
+
+        self.state = FEEDBACK
+        if self.feedback_seconds is not None:
+            self.feedback_until = now + self.feedback_seconds
+        self._emit("answer", (key, correct, now - self.question_time))
+
+        if self.lives is not None and self.lives <= 0:
+            self._game_over()
+        return correct
+
+    def lose_life(self):
+        """Penalty outside of answering (e.g. the flappy bird hitting the floor)."""
+        if self.lives is None or self.state in (IDLE, GAME_OVER):
+            return
+        self.lives -= 1
+        if self.lives <= 0:
+            self._game_over()
+
+    def tick(self):
+        """Applies time-based transitions and returns the current state."""
+        if self.state in (QUESTION, FEEDBACK):
+            now = self.clock()
+            if self.end_time is not None and now >= self.end_time:
+                self._game_over()
+            elif self.state == FEEDBACK and self.feedback_until is not None and now >= self.feedback_until:
+                self.next_question()
+        return self.state
+
+    def next_deadline(self):
+        """Clock time of the next automatic transition, or None; lets a front-end sleep until then."""
+        deadlines = [t for t in (self.end_time, self.feedback_until if self.state == FEEDBACK else None)
+                     if t is not None]
+        return min(deadlines) if deadlines else None
+
+    def _game_over(self):
+        self.state = GAME_OVER
+        self._emit("game_over", self.score)
@@ -0,0 +1,102 @@
+"""
+Per-stage frame timing for the pygame front-ends' benchmark modes.
+
+A frame is split into named stages by calling lap(stage) as each one ends.
+results() gives FPS plus mean/p50/p95/p99 per stage. Saved results can be
+compared against a later run to catch rendering regressions.
+"""
+
+import json
+import time
+from array import array
+
+
+class StageProfiler:
+    def __init__(self, stages):
+        self.stages = list(stages)
+        self.samples = {stage: array("d") for stage in self.stages}
+        self.frame_times = array("d")
+        self._frame_start = self._last = 0.0
+
+    def start_frame(self):
+        self._frame_start = self._last = time.perf_counter()
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        self.samples[stage].append(now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        self.frame_times.append(time.perf_counter() - self._frame_start)
+
+    @property
+    def frames(self):
+        return len(self.frame_times)
+
+    def results(self):
+        total = sum(self.frame_times)
+        results = {
+            "frames": self.frames,
+            "fps": self.frames / total if total else 0.0,
+            "frame": _summary(self.frame_times),
+            "stages": {stage: _summary(self.samples[stage]) for stage in self.stages},
+        }
+        return results
+
+    def report(self, baseline=None, tolerance=0.15):
+        """Prints the results (and changes against a baseline); returns stages that got slower."""
+        results = self.results()
+        print(f"{results['frames']} frames, {results['fps']:.1f} FPS")
+        print(f"{'stage':16s} {'mean':>8s} {'p50':>8s} {'p95':>8s} {'p99':>8s}   (ms)")
+        rows = [("frame", results["frame"])] + list(results["stages"].items())
+        base_rows = {}
+        if baseline:
+            base_rows = dict(baseline["stages"], frame=baseline["frame"])
+
+        regressions = []
+        for name, stats in rows:
+            line = f"{name:16s} " + " ".join(f"{stats[k]:8.3f}" for k in ("mean", "p50", "p95", "p99"))
+            base = base_rows.get(name)
+            if base and base["mean"] > 0:
+                change = stats["mean"] / base["mean"] - 1
+                line += f"   {100 * change:+.0f}% vs baseline"
+                if change > tolerance and stats["mean"] - base["mean"] > 0.05:  # Ignore sub-50us noise
+                    regressions.append(name)
+                    line += "  <-- slower"
+            print(line)
+        return regressions
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.results(), f, indent=2)
+
+
+class NullProfiler:
+    """Stands in when not benchmarking, so the game loop can call lap() unconditionally."""
+
+    def start_frame(self):
+        pass
+
+    def lap(self, stage):
+        pass
+
+    def end_frame(self):
+        pass
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _summary(samples):
+    """Mean and percentiles in milliseconds."""
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+    ordered = sorted(samples)
+    n = len(ordered)
+
+    def pick(p):
+        return 1000 * ordered[min(int(n * p / 100), n - 1)]
+
+    return {"mean": 1000 * sum(ordered) / n, "p50": pick(50), "p95": pick(95), "p99": pick(99)}
@@ -0,0 +1,132 @@
+"""
+Bot-played session simulator for the trivia engine.
+
+Plays thousands of standard-mode rounds on a fake clock across a process
+pool, with no UI and no real waiting, and reports throughput and memory:
+
+    python3 -m trivia_core.simulator --sessions 20000 --workers 4
+"""
+
+import argparse
+import os
+import random
+import time
+import tracemalloc
+from multiprocessing import Pool
+
+from trivia_core.bank import DEFAULT_BANK_PATH, BankSnapshot, load_questions
+from trivia_core.engine import GAME_OVER, LABELS, QUESTION, TriviaEngine
+
+_questions = None  # Loaded once per worker process
+
+
+class FakeClock:
+    """A clock the simulation advances by hand instead of waiting."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def play_session(questions, seed, accuracy=0.7, mean_think=2.0, lives=None):
+    """Plays one round with a bot; returns (score, questions answered)."""
+    rng = random.Random(seed)
+    clock = FakeClock()
+    engine = TriviaEngine(questions, clock=clock, rng=rng, lives=lives)
+    engine.start()
+
+    while engine.tick() != GAME_OVER:
+        deadline = engine.next_deadline()
+        if engine.state != QUESTION:
+            clock.now = deadline  # Skip straight past the feedback pause
+            continue
+
+        think = rng.expovariate(1.0 / mean_think)
+        if deadline is not None and clock.now + think >= deadline:
+            clock.now = deadline  # Bot was too slow, round is over
+            continue
+        clock.now += think
+
+        correct = engine.question[2]
+        if rng.random() < accuracy:
+            engine.answer(correct)
+        else:
+            engine.answer(rng.choice([k for k in LABELS if k != correct]))
+
+    return engine.score, engine.answered
+
+
+def _init_worker(bank_path):
+    global _questions
+    _questions = BankSnapshot(load_questions(bank_path)).questions  # Only what the game would ask
+
+
+def _run_batch(job):
+    """Plays a batch of sessions; returns totals plus a memory sample."""
+    first_seed, count, accuracy, mean_think, lives, memory_samples = job
+    score_total = answered_total = 0
+    scores = {}
+
+    for seed in range(first_seed, first_seed + count):
+        score, answered = play_session(_questions, seed, accuracy, mean_think, lives)
+        score_total += score
+        answered_total += answered
+        scores[score] = scores.get(score, 0) + 1
+
+    # Measure a few extra sessions under tracemalloc (too slow to leave on)
+    peaks = []
+    if memory_samples:
+        tracemalloc.start()
+        for seed in range(memory_samples):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            play_session(_questions, -1 - seed, accuracy, mean_think, lives)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+
+    return count, score_total, answered_total, scores, peaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch", type=int, default=500, help="sessions per pool task")
+    parser.add_argument("--accuracy", type=float, default=0.7, help="chance the bot answers correctly")
+    parser.add_argument("--think", type=float, default=2.0, help="mean seconds the bot takes to answer")
+    parser.add_argument("--lives", type=int, help="play with lives instead of only the timer")
+    parser.add_argument("--bank", default=DEFAULT_BANK_PATH)
+    args = parser.parse_args()
+
+    jobs = []
+    for first in range(0, args.sessions, args.batch):
+        count = min(args.batch, args.sessions - first)
+        jobs.append((first, count, args.accuracy, args.think, args.lives, 20 if first == 0 else 0))
+
+    start = time.perf_counter()
+    with Pool(args.workers, initializer=_init_worker, initargs=(args.bank,)) as pool:
+        results = pool.map(_run_batch, jobs)
+    elapsed = time.perf_counter() - start
+
+    sessions = sum(r[0] for r in results)
+    answered = sum(r[2] for r in results)
+    scores = {}
+    for r in results:
+        for score, n in r[3].items():
+            scores[score] = scores.get(score, 0) + n
+    peaks = [p for r in results for p in r[4]]
+
+    print(f"sessions:            {sessions} on {args.workers} workers in {elapsed:.2f}s")
+    print(f"throughput:          {sessions / elapsed:,.0f} sessions/s ({answered / elapsed:,.0f} answers/s)")
+    print(f"mean score:          {sum(r[1] for r in results) / sessions:.1f} ({answered / sessions:.1f} answers/session)")
+    if peaks:
+        print(f"memory per session:  {sum(peaks) / len(peaks) / 1024:.1f} KiB peak (tracemalloc, {len(peaks)} samples)")
+    print("score distribution:")
+    for score in sorted(scores):
+        print(f"  {score:4d}  {scores[score]:7d}  {100.0 * scores[score] / sessions:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Per-answer telemetry: which option a player picked and how long it took.
+
+Recording only packs a fixed-size record into a preallocated ring buffer;
+a background thread appends full batches to a compact binary log. The
+report command aggregates accuracy and answer-time percentiles per question:
+
+    python3 -m trivia_core.telemetry [log file]
+"""
+
+import argparse
+import os
+import struct
+import threading
+import time
+import zlib
+
+DEFAULT_TELEMETRY_PATH = os.environ.get(
+    "SWEETRIVIA_TELEMETRY_FILE", os.path.join(os.path.expanduser("~"), ".sweetrivia_telemetry")
+)
+
+MAGIC = b"SWTL\x01\x00\x00\x00"
+# time, question text crc32, answer time (ms), station, chosen option, correct
+RECORD = struct.Struct("<dIfHBB")
+NO_CHOICE = 0xFF
+
+
+def question_key(text):
+    """Stable 32-bit id for a question, independent of its position in the bank."""
+    return zlib.crc32(text.encode("utf-8"))
+
+
+class TelemetryRecorder:
+    """Ring-buffered answer recorder with batched background flushing."""
+
+    def __init__(self, path=DEFAULT_TELEMETRY_PATH, capacity=4096, flush_interval=5.0):
+        self.path = path
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buf = bytearray(capacity * RECORD.size)
+        self._head = 0      # Next slot to write (total records ever recorded)
+        self._tail = 0      # Next slot to flush
+        self.dropped = 0    # Records lost because the buffer was full
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread = threading.Thread(target=self._flush_loop, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def record(self, question, choice, correct, latency, station=0, now=None):
+        """Logs one answer; latency is in seconds. Cheap enough to call from the game loop."""
+        chosen = ord(choice) if choice else NO_CHOICE
+        with self._lock:
+            head = self._head
+            if head - self._tail >= self.capacity:
+                self.dropped += 1
+                return
+            RECORD.pack_into(self._buf, (head % self.capacity) * RECORD.size,
+                             now if now is not None else time.time(), question_key(question),
+                             latency * 1000.0, station, chosen & 0xFF, 1 if correct else 0)
+            self._head = head + 1
+        if head - self._tail >= self.capacity // 2:
+            self._wake.set()  # Half full, don't wait for the interval
+
+    def attach(self, engine, station=0):
+        """Records every answer the engine scores, plus the question left open when time runs out."""
+        open_question = [False]
+
+        def on_event(engine, event, data):
+            if event == "question":
+                open_question[0] = True
+            elif event == "answer":
+                open_question[0] = False
+                key, correct, latency = data
+                self.record(engine.question[0], key, correct, latency, station)
+            elif event == "game_over" and open_question[0]:
+                open_question[0] = False
+                self.record(engine.question[0], None, False, engine.clock() - engine.question_time, station)
+        engine.on_event(on_event)
+
+    def flush(self):
+        """Appends everything recorded so far to the log file."""
+        with self._lock:
+            tail, head = self._tail, self._head
+            if head == tail:
+                return 0
+            start = (tail % self.capacity) * RECORD.size
+            end = (head % self.capacity) * RECORD.size
+            if end > start:
+                chunk = bytes(self._buf[start:end])
+            else:  # Wrapped around the end of the ring
+                chunk = bytes(self._buf[start:]) + bytes(self._buf[:end])
+            self._tail = head
+
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, "ab") as f:
+            if new_file:
+                f.write(MAGIC)
+            f.write(chunk)
+        return head - tail
+
+    def close(self):
+        self._stop = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+
+    def _flush_loop(self):
+        while not self._stop:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"Telemetry flush failed: {e}")
+
+
+def read_records(path):
+    """Yields (time, question key, latency ms, station, choice, correct) from a log file."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a telemetry log")
+        while True:
+            data = f.read(RECORD.size * 4096)
+            usable = len(data) - len(data) % RECORD.size  # Ignore a torn last record
+            for t, key, latency, station, choice, correct in RECORD.iter_unpack(data[:usable]):
+                yield t, key, latency, station, None if choice == NO_CHOICE else chr(choice), bool(correct)
+            if len(data) < RECORD.size * 4096:
+                return
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * p / 100.0), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(path, questions=()):
+    """Per-question accuracy, answer-time percentiles and choice counts, hardest first."""
+    texts = {question_key(q["question"]): q["question"] for q in questions}
+    stats = {}
+    for _, key, latency, _, choice, correct in read_records(path):
+        entry = stats.setdefault(key, {"answers": 0, "correct": 0, "latencies": [], "choices": {}})
+        entry["answers"] += 1
+        entry["correct"] += correct
+        entry["latencies"].append(latency)
+        entry["choices"][choice] = entry["choices"].get(choice, 0) + 1
+
+    rows = []
+    for key, entry in stats.items():
+        latencies = sorted(entry["latencies"])
+        rows.append({
+            "question": texts.get(key, f"#{key:08x}"),
+            "answers": entry["answers"],
+            "accuracy": entry["correct"] / entry["answers"],
+            "p50_ms": percentile(latencies, 50),
+            "p90_ms": percentile(latencies, 90),
+            "p99_ms": percentile(latencies, 99),
+            "choices": entry["choices"],
+        })
+    rows.sort(key=lambda row: row["accuracy"])
+    return rows
+
+
+def main():
+    from trivia_core.bank import DEFAULT_BANK_PATH, load_questions
+
+    parser = argparse.ArgumentParser(description="Per-question accuracy and answer times from telemetry.")
+    parser.add_argument("path", nargs="?", default=DEFAULT_TELEMETRY_PATH)
+    parser.add_argument("--bank", default=DEFAULT_BANK_PATH, help="question bank used to show question text")
+    args = parser.parse_args()
+
+    questions = load_questions(args.bank) if os.path.exists(args.bank) else []
+    rows = summarize(args.path, questions)
+    print(f"{'answers':>7} {'correct':>7} {'p50':>7} {'p90':>7} {'p99':>7}  question")
+    for row in rows:
+        print(f"{row['answers']:7d} {100 * row['accuracy']:6.0f}% {row['p50_ms'] / 1000:6.2f}s "
+              f"{row['p90_ms'] / 1000:6.2f}s {row['p99_ms'] / 1000:6.2f}s  {row['question'][:60]}")
+
+
+if __name__ == "__main__":
+    main()
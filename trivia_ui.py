@@ -1,4 +1,27 @@
+import argparse
+import os
+import sys
+import time
+
+STARTED = time.perf_counter()  # Startup timing includes importing pygame
+
+from trivia_core.bank import QuestionBank
+from trivia_core.deck import QuestionDeck
+from trivia_core.profiler import NullProfiler, StageProfiler, load_results
+
+parser = argparse.ArgumentParser(description="SweeTrivia home screen.")
+parser.add_argument("--bench", type=int, metavar="FRAMES",
+                    help="headless benchmark: draw FRAMES frames, then print per-stage frame times")
+parser.add_argument("--json", metavar="FILE", help="save the --bench results to FILE")
+parser.add_argument("--baseline", metavar="FILE", help="compare the --bench results with a saved run")
+args = parser.parse_args()
+
+if args.bench:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed
+
 import pygame
+from preloader import Preloader
+from screen_manager import ScreenManager
 from screens.home_screen import HomeScreen
 
 # Initialize Pygame
@@ -7,25 +30,41 @@ SCREEN_WIDTH, SCREEN_HEIGHT = 1200, 620
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("SweeTrivia - Home Screen")
 
-# Load homescreen
-home_screen = HomeScreen(screen)
+SOUNDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "standard_code", "public", "sounds")
 
-# Only displaying for now
-running = True
-while running:
-    screen.fill((0, 0, 0))
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False  # Allow window to close
+def load_sounds():
+    """Decodes the sound effects up front; none if there's no audio device."""
+    if not pygame.mixer.get_init():
+        return {}
+    return {name[:-4]: pygame.mixer.Sound(os.path.join(SOUNDS_DIR, name))
+            for name in sorted(os.listdir(SOUNDS_DIR)) if name.endswith(".mp3")}
 
-    # Draw the home screen safely
-    try:
-        home_screen.draw()
-    except Exception as e:
-        print(f"Error drawing screen: {e}")
+# The question bank, sounds and deck load on worker threads while a loading screen is up
+preloader = Preloader(screen, started=STARTED)
+preloader.add("bank", QuestionBank)
+preloader.add("sounds", load_sounds)
+preloader.add("deck", QuestionDeck)
+bundle = preloader.run("SweeTrivia")
 
-    pygame.display.update()
+# Load homescreen
+home_screen = HomeScreen(screen)
+profiler = StageProfiler(["events", "draw", "display_update"]) if args.bench else NullProfiler()
+
+# Draws only when the screen changed or is animating; an idle home screen sleeps in event.wait
+manager = ScreenManager(screen, fps=30, profiler=profiler)
+manager.bundle = bundle  # Later screens find the bank, sounds and deck here
+manager.show(home_screen)
+manager.run(max_frames=args.bench, always_redraw=bool(args.bench),
+            on_first_frame=preloader.interactive)  # Interactive once the home screen is up
 
 # Quit Pygame properly
 pygame.quit()
+
+if args.bench:
+    regressions = profiler.report(load_results(args.baseline) if args.baseline else None)
+    if args.json:
+        profiler.save(args.json)
+        print(f"💾 Results saved to {args.json}")
+    if regressions:
+        print(f"⚠️ Slower than the baseline: {', '.join(regressions)}")
+        sys.exit(1)